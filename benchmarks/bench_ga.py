@@ -0,0 +1,150 @@
+"""
+Benchmark suite engine GA pada workload sintetis
+
+Mengukur evaluasi_populasi, satu generasi penuh (jalankan_generasi), dan
+run_genetic_algorithm lengkap, beserta kurva konflik per generasi.
+Hasil ditulis ke JSON agar regresi bisa dibandingkan antar commit.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_ga --sizes 50 500 5000 --output bench_ga.json
+    python -m benchmarks.bench_ga --sizes 50000 --generations 3 --dosen-ratio 0.1 --ruangan 200
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.workload import buat_workload
+from utils.genetic_algorithm import (
+    buat_populasi_list,
+    evaluasi_populasi,
+    buat_indeks_signature,
+    jalankan_generasi,
+    run_genetic_algorithm,
+    ENGINES
+)
+
+UKURAN_DEFAULT = (50, 500, 5000, 50000)
+
+
+def _commit():
+    """Hash commit HEAD (None jika bukan repo git)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _waktu(fn, repeat):
+    """Jalankan fn sebanyak repeat kali, kembalikan (waktu terbaik, waktu rata-rata, hasil terakhir)"""
+    waktu = []
+    hasil = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hasil = fn()
+        waktu.append(time.perf_counter() - start)
+    return round(min(waktu), 6), round(sum(waktu) / len(waktu), 6), hasil
+
+
+def bench_ukuran(n_rows, args):
+    """
+    Benchmark satu ukuran workload
+
+    Returns:
+        Dictionary hasil untuk ukuran ini
+    """
+    n_dosen = max(1, int(n_rows * args.dosen_ratio))
+    populasi_data, databases = buat_workload(
+        n_rows, n_dosen=n_dosen, n_ruangan=args.ruangan, n_waktu=args.waktu,
+        n_prodi=args.prodi, n_kelas=args.kelas, seed=args.seed
+    )
+    populasi = evaluasi_populasi(buat_populasi_list(populasi_data, databases), databases)
+    indeks_sig = buat_indeks_signature(populasi_data)
+
+    eval_best, eval_avg, _ = _waktu(lambda: evaluasi_populasi(populasi, databases), args.repeat)
+    gen_best, gen_avg, _ = _waktu(
+        lambda: jalankan_generasi(populasi, populasi_data, databases, 1,
+                                  args.mutation_rate, args.elite_size, indeks_sig),
+        args.repeat
+    )
+
+    run_best, run_avg, hasil = _waktu(
+        lambda: run_genetic_algorithm(
+            populasi_data, databases,
+            generations=args.generations,
+            mutation_rate=args.mutation_rate,
+            elite_size=args.elite_size,
+            early_stopping=False,
+            engine=args.engine,
+            seed=args.seed
+        ),
+        1
+    )
+
+    history = hasil['history']
+    return {
+        'rows': n_rows,
+        'dosen': n_dosen,
+        'ruangan': args.ruangan,
+        'evaluasi_populasi_s': {'best': eval_best, 'mean': eval_avg},
+        'generasi_s': {'best': gen_best, 'mean': gen_avg},
+        'run_s': run_best,
+        'generations': hasil['total_generations'],
+        'best_konflik': hasil['best_solution']['konflik'],
+        'total_konflik': sum(k['konflik'] for k in hasil['populasi_akhir']),
+        'kurva': {
+            'generations': history['generations'],
+            'best_konflik': history['best_konflik'],
+            'total_konflik': history['total_konflik'],
+            'best_fitness': history['best_fitness'],
+            'avg_fitness': history['avg_fitness']
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(UKURAN_DEFAULT))
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--mutation-rate', type=float, default=0.15)
+    parser.add_argument('--elite-size', type=int, default=2)
+    parser.add_argument('--engine', default='python', choices=ENGINES)
+    parser.add_argument('--dosen-ratio', type=float, default=0.25, help="Jumlah dosen = rows x ratio")
+    parser.add_argument('--ruangan', type=int, default=8)
+    parser.add_argument('--waktu', type=int, default=5)
+    parser.add_argument('--prodi', type=int, default=10)
+    parser.add_argument('--kelas', type=int, default=0, help="Kelas per prodi (0 = tanpa konflik kohort)")
+    parser.add_argument('--repeat', type=int, default=3, help="Pengulangan untuk evaluasi & satu generasi")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_ga.json')
+    args = parser.parse_args()
+
+    hasil = []
+    print(f"{'Rows':>8}{'Eval (s)':>12}{'Gen (s)':>12}{'Run (s)':>12}{'Best konflik':>14}{'Total konflik':>15}")
+    for n_rows in args.sizes:
+        baris = bench_ukuran(n_rows, args)
+        hasil.append(baris)
+        print(f"{n_rows:>8}{baris['evaluasi_populasi_s']['best']:>12.4f}{baris['generasi_s']['best']:>12.4f}"
+              f"{baris['run_s']:>12.3f}{baris['best_konflik']:>14}{baris['total_konflik']:>15}")
+
+    laporan = {
+        'commit': _commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'parameters': {k: v for k, v in vars(args).items() if k not in ('sizes', 'output')},
+        'results': hasil
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(laporan, f, indent=2)
+    print(f"Hasil disimpan ke {args.output}")
+
+
+if __name__ == '__main__':
+    main()
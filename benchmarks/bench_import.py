@@ -0,0 +1,90 @@
+"""
+Benchmark cold start: waktu import scheduler core (python -X importtime)
+
+Core = modul yang dipakai worker/CLI dan harus bisa di-import tanpa
+streamlit, pandas, plotly, atau PIL. Adapter UI (utils.data_loader,
+components/, pages/) sengaja tidak termasuk. utils.ga_numpy juga core,
+tetapi numpy baru di-import saat engine='numpy' dipilih.
+
+Exit code 1 jika import core melebihi budget atau menarik modul UI.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_import --budget-ms 100
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+CORE_MODULES = (
+    'utils.genetic_algorithm',
+    'utils.kendala',
+    'utils.lokal',
+    'utils.island',
+    'utils.background',
+    'utils.importer',
+    'utils.excel_cache',
+    'utils.cli'
+)
+
+# Modul UI/berat yang tidak boleh ikut ter-import oleh core
+MODUL_TERLARANG = ('streamlit', 'pandas', 'plotly', 'PIL', 'numpy', 'openpyxl')
+
+
+def ukur_import(modules):
+    """
+    Import modules di interpreter baru dengan -X importtime
+
+    Returns:
+        Tuple (total mikrodetik modul yang diminta, dict {modul: kumulatif us})
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join(modules)],
+        capture_output=True, text=True, cwd=root, check=True
+    )
+
+    kumulatif = {}
+    for baris in proc.stderr.splitlines():
+        if not baris.startswith('import time:') or '|' not in baris:
+            continue
+        _, cumulative, nama = (bagian.strip() for bagian in baris[len('import time:'):].split('|'))
+        if cumulative.isdigit():
+            kumulatif[nama] = int(cumulative)
+
+    # Modul top-level (tanpa indentasi) yang diminta; anak sudah termasuk di kumulatifnya
+    total = sum(kumulatif.get(nama, 0) for nama in modules)
+    return total, kumulatif
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=100.0, help="Budget waktu import core (ms)")
+    parser.add_argument('--repeat', type=int, default=5, help="Ambil waktu terbaik dari N percobaan")
+    args = parser.parse_args()
+
+    hasil = [ukur_import(CORE_MODULES) for _ in range(max(1, args.repeat))]
+    total, kumulatif = min(hasil, key=lambda h: h[0])
+
+    print(f"{'Modul':<28}{'Kumulatif (ms)':>16}")
+    for nama in CORE_MODULES:
+        print(f"{nama:<28}{kumulatif.get(nama, 0) / 1000:>16.2f}")
+    print(f"{'TOTAL':<28}{total / 1000:>16.2f}  (budget {args.budget_ms:.0f} ms)")
+
+    gagal = False
+    terlarang = sorted({nama for nama in kumulatif if nama.split('.')[0] in MODUL_TERLARANG})
+    if terlarang:
+        print(f"GAGAL: core meng-import modul UI/berat: {', '.join(terlarang[:10])}")
+        gagal = True
+    if total / 1000 > args.budget_ms:
+        print(f"GAGAL: import core {total / 1000:.1f} ms melebihi budget {args.budget_ms:.0f} ms")
+        gagal = True
+
+    if not gagal:
+        print("OK")
+    sys.exit(1 if gagal else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: island model vs GA serial pada jumlah evaluasi total yang sama
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_island --rows 500 --generations 40 --islands 4
+"""
+
+import argparse
+import time
+
+from benchmarks.workload import buat_workload
+from utils.genetic_algorithm import run_genetic_algorithm
+from utils.island import run_island_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--generations', type=int, default=40, help="Total generasi GA serial")
+    parser.add_argument('--islands', type=int, default=4)
+    parser.add_argument('--migration-interval', type=int, default=5)
+    parser.add_argument('--migration-size', type=int, default=2)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    populasi_data, databases = buat_workload(args.rows, n_ruangan=max(8, args.rows // 20))
+
+    # Jumlah evaluasi total sama: islands x gen_per_island == generations
+    gen_per_island = max(1, args.generations // args.islands)
+
+    start = time.perf_counter()
+    serial = run_genetic_algorithm(populasi_data, databases, generations=args.generations, seed=args.seed)
+    waktu_serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    island = run_island_model(
+        populasi_data, databases,
+        generations=gen_per_island,
+        n_islands=args.islands,
+        migration_interval=args.migration_interval,
+        migration_size=args.migration_size,
+        workers=args.workers,
+        seed=args.seed
+    )
+    waktu_island = time.perf_counter() - start
+
+    print(f"Rows: {args.rows}, evaluasi total: {args.rows * args.generations}")
+    print(f"{'Mode':<10}{'Generasi':>10}{'Waktu (s)':>12}{'Best konflik':>14}{'Total konflik':>15}")
+    for nama, hasil, waktu in (('serial', serial, waktu_serial), ('island', island, waktu_island)):
+        total_konflik = sum(k['konflik'] for k in hasil['populasi_akhir'])
+        print(f"{nama:<10}{hasil['total_generations']:>10}{waktu:>12.3f}"
+              f"{hasil['best_solution']['konflik']:>14}{total_konflik:>15}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark memori: peak & alokasi per generasi (tracemalloc)
+
+Jalankan dari root repo (bandingkan angka antar commit):
+    python -m benchmarks.bench_memory --rows 2000 --generations 5
+"""
+
+import argparse
+import random
+import tracemalloc
+
+from benchmarks.workload import buat_workload
+from utils.genetic_algorithm import (
+    Kromosom,
+    buat_populasi_list,
+    evaluasi_populasi,
+    jalankan_generasi,
+    buat_indeks_signature
+)
+
+
+def ukur(fn):
+    """
+    Jalankan fn di bawah tracemalloc
+
+    Returns:
+        Tuple (hasil fn, peak bytes, jumlah blok baru yang masih hidup)
+    """
+    tracemalloc.start()
+    sebelum = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.reset_peak()
+
+    hasil = fn()
+
+    _, peak = tracemalloc.get_traced_memory()
+    sesudah = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+
+    return hasil, peak, sesudah - sebelum
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--generations', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    populasi_data, databases = buat_workload(args.rows, n_ruangan=max(8, args.rows // 20))
+    rng = random.Random(args.seed)
+
+    # ===== REPRESENTASI: Kromosom (__slots__) vs dict =====
+    populasi, peak_slots, _ = ukur(lambda: buat_populasi_list(populasi_data, databases, rng))
+    _, peak_dict, _ = ukur(lambda: [
+        {'kode': k.kode, 'data': list(k.data), 'generation': k.generation, 'konflik': 0, 'fitness': 0.0}
+        for k in populasi
+    ])
+    print(f"Rows: {args.rows}")
+    print(f"Populasi Kromosom: {peak_slots / 1024:10.1f} KiB")
+    print(f"Populasi dict    : {peak_dict / 1024:10.1f} KiB")
+
+    # ===== PER GENERASI =====
+    populasi = evaluasi_populasi(populasi, databases)
+    indeks_sig = buat_indeks_signature(populasi_data)
+
+    print(f"\n{'Gen':>4}{'Peak (KiB)':>14}{'Blok baru':>12}")
+    for gen in range(1, args.generations + 1):
+        populasi, peak, blok = ukur(lambda: jalankan_generasi(
+            populasi, populasi_data, databases, gen, 0.15, 2, indeks_sig, rng=rng
+        ))
+        print(f"{gen:>4}{peak / 1024:>14.1f}{blok:>12}")
+
+
+if __name__ == '__main__':
+    main()
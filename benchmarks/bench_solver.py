@@ -0,0 +1,116 @@
+"""
+Benchmark waktu-sampai-nol-konflik antar engine / solver
+
+Setiap engine dijalankan pada input yang sama (workload sintetis, seed
+sama) sampai total konflik jadwal = 0 atau batas generasi habis. Waktu
+dicatat dari callback on_generation saat snapshot pertama dengan
+total_konflik 0, lalu run dihentikan.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_solver --sizes 100 300 --repeat 3
+    python -m benchmarks.bench_solver --sizes 1000 --engines annealing tabu --generations 200
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.bench_ga import _commit
+from benchmarks.workload import buat_workload
+from utils.genetic_algorithm import ENGINES, SEEDING, run_genetic_algorithm
+
+
+def jalankan(populasi_data, databases, engine, generations, seed, seeding='random'):
+    """
+    Satu run sampai nol konflik
+
+    Returns:
+        Dictionary {detik, generasi, total_konflik, nol}
+    """
+    catatan = {'detik': None, 'generasi': None}
+    start = time.perf_counter()
+
+    def _cek(snapshot):
+        if snapshot['total_konflik'] == 0 and catatan['detik'] is None:
+            catatan['detik'] = round(time.perf_counter() - start, 4)
+            catatan['generasi'] = snapshot['generation']
+            return True
+        return False
+
+    hasil = run_genetic_algorithm(populasi_data, databases, generations=generations,
+                                  engine=engine, seeding=seeding, seed=seed, on_generation=_cek)
+
+    return dict(
+        catatan,
+        total_konflik=sum(k['konflik'] for k in hasil['populasi_akhir']),
+        nol=catatan['detik'] is not None,
+        detik_total=round(time.perf_counter() - start, 4)
+    )
+
+
+def bench_ukuran(n_rows, args):
+    """Semua engine pada satu ukuran workload"""
+    populasi_data, databases = buat_workload(
+        n_rows, n_ruangan=max(1, int(n_rows * args.ruangan_ratio)), n_waktu=args.waktu,
+        n_prodi=args.prodi, n_kelas=args.kelas, seed=args.seed
+    )
+
+    hasil = {}
+    for engine in args.engines:
+        runs = [jalankan(populasi_data, databases, engine, args.generations, args.seed + i, args.seeding)
+                for i in range(args.repeat)]
+        waktu_nol = [r['detik'] for r in runs if r['nol']]
+        hasil[engine] = {
+            'sukses': len(waktu_nol),
+            'median_detik': round(statistics.median(waktu_nol), 4) if waktu_nol else None,
+            'median_total_konflik': statistics.median(r['total_konflik'] for r in runs),
+            'runs': runs
+        }
+    return {'rows': n_rows, 'ruangan': len(databases['ruangan']), 'engines': hasil}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 300])
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES), choices=ENGINES)
+    parser.add_argument('--generations', type=int, default=100, help="Batas generasi per run")
+    parser.add_argument('--seeding', default='random', choices=SEEDING)
+    parser.add_argument('--ruangan-ratio', type=float, default=0.1, help="Jumlah ruangan = rows x ratio")
+    parser.add_argument('--waktu', type=int, default=5)
+    parser.add_argument('--prodi', type=int, default=10)
+    parser.add_argument('--kelas', type=int, default=0, help="Kelas per prodi (0 = tanpa konflik kohort)")
+    parser.add_argument('--repeat', type=int, default=3, help="Jumlah run (seed berbeda) per engine")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_solver.json')
+    args = parser.parse_args()
+
+    hasil = []
+    print(f"{'Rows':>8}  {'Engine':<10}{'Nol':>6}{'Median (s)':>12}{'Median konflik':>16}")
+    for n_rows in args.sizes:
+        baris = bench_ukuran(n_rows, args)
+        hasil.append(baris)
+        for engine, r in baris['engines'].items():
+            median = f"{r['median_detik']:.3f}" if r['median_detik'] is not None else '-'
+            print(f"{n_rows:>8}  {engine:<10}{r['sukses']:>3}/{args.repeat:<2}{median:>12}"
+                  f"{r['median_total_konflik']:>16}")
+
+    laporan = {
+        'commit': _commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'parameters': {k: v for k, v in vars(args).items() if k not in ('sizes', 'output')},
+        'results': hasil
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(laporan, f, indent=2)
+    print(f"Hasil disimpan ke {args.output}")
+
+
+if __name__ == '__main__':
+    main()
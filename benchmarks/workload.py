@@ -0,0 +1,44 @@
+"""
+Generator workload sintetis untuk benchmark (tanpa file Excel)
+"""
+
+import random
+
+
+def buat_workload(n_rows, n_dosen=None, n_ruangan=8, n_waktu=5, n_prodi=10, n_kelas=0, seed=0):
+    """
+    Buat populasi_data & databases sintetis
+
+    Args:
+        n_rows: Jumlah baris (dosen, matkul, prodi)
+        n_dosen: Jumlah dosen unik (default: n_rows // 4)
+        n_ruangan: Jumlah ruangan
+        n_waktu: Jumlah slot waktu per hari
+        n_prodi: Jumlah prodi unik
+        n_kelas: Jumlah kelas per prodi (0 = tanpa kelas, tanpa konflik kohort)
+        seed: Seed generator
+
+    Returns:
+        Tuple (populasi_data, databases)
+    """
+    rng = random.Random(seed)
+    n_dosen = n_dosen or max(1, n_rows // 4)
+
+    databases = {
+        'sks': ['2', '3', '4'],
+        'hari': ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat'],
+        'waktu': [f"W{i + 1}" for i in range(n_waktu)],
+        'ruangan': [f"R{i + 1}" for i in range(n_ruangan)]
+    }
+
+    populasi_data = {
+        f"C{i + 1}": [f"Dosen {rng.randrange(n_dosen) + 1}", f"Matkul {i + 1}", f"Prodi {rng.randrange(n_prodi) + 1}"]
+        for i in range(n_rows)
+    }
+
+    if n_kelas:
+        databases['kelas'] = [f"K{i + 1}" for i in range(n_kelas)]
+        for data in populasi_data.values():
+            data += [None, rng.choice(databases['kelas'])]
+
+    return populasi_data, databases
@@ -1,9 +1,12 @@
 """Header dan styling aplikasi"""
 import streamlit as st
-from PIL import Image
 import base64
-from io import BytesIO
-from config.settings import APP_IMAGE_PATH, INPUT_IMAGE_PATH, RUN_IMAGE_PATH, RESULT_IMAGE_PATH, SETTING_IMAGE_PATH
+import functools
+import mimetypes
+import os
+from config.settings import (
+    APP_IMAGE_PATH, INPUT_IMAGE_PATH, RUN_IMAGE_PATH, RESULT_IMAGE_PATH, SETTING_IMAGE_PATH, STATIC_DIR
+)
 
 def apply_custom_css():
     """Terapkan custom CSS"""
@@ -35,17 +38,33 @@ def display_header():
     st.markdown("<div class='big-title'>🧬 Genetic Scheduler</div>", unsafe_allow_html=True)
     st.markdown("<div class='sub'>Aplikasi Penjadwalan Kuliah berbasis Algoritma Genetika</div>", unsafe_allow_html=True)
 
+@functools.lru_cache(maxsize=32)
+def _data_uri(path, mtime_ns):
+    """Data URI file gambar, dihitung sekali per (path, mtime) untuk seluruh proses"""
+    mime = mimetypes.guess_type(path)[0] or 'image/jpeg'
+    with open(path, 'rb') as f:
+        return f"data:{mime};base64,{base64.b64encode(f.read()).decode()}"
+
+
+def _image_src(path):
+    """URL static (dicache browser) jika tersedia, selain itu data URI yang dicache"""
+    mtime_ns = os.stat(path).st_mtime_ns
+
+    rel = os.path.relpath(path, STATIC_DIR)
+    if st.get_option("server.enableStaticServing") and not rel.startswith(os.pardir):
+        return f"app/static/{rel.replace(os.sep, '/')}?v={mtime_ns}"
+
+    return _data_uri(os.path.abspath(path), mtime_ns)
+
+
 def _render_image(path):
     try:
-        image = Image.open(path)
-        buffered = BytesIO()
-        image.save(buffered, format="JPEG")
-        img_str = base64.b64encode(buffered.getvalue()).decode()
+        img_src = _image_src(path)
 
         st.markdown(
             f"""
             <div style="text-align: center;">
-                <img src="data:image/jpeg;base64,{img_str}"
+                <img src="{img_src}"
                 style="width: 100%; 
                     max-width: 500px;
                     height: auto; 
@@ -12,6 +12,7 @@ def render_input_sidebar(databases):
             dosen = st.selectbox("Nama Dosen", options=databases['dosen'])
             matkul = st.selectbox("Mata Kuliah", options=databases['matkul'])
             prodi = st.selectbox("Program Studi", options=databases['prodi'])
+            kelas = st.selectbox("Kelas (opsional)", options=[''] + list(databases.get('kelas', [])))
 
             submitted = st.form_submit_button("➕ Tambah Data")
             
@@ -20,7 +21,39 @@ def render_input_sidebar(databases):
                 st.session_state.populasi_data[kode] = [
                     dosen, matkul, prodi,
                 ]
+                if kelas:
+                    # SKS tetap kosong (None = acak), kelas di elemen ke-5
+                    st.session_state.populasi_data[kode] += [None, kelas]
                 st.success(f"✅ Data berhasil ditambahkan dengan kode {kode}!")
                 return True
     
-    return False
\ No newline at end of file
+    return False
+
+def render_import_sidebar(databases):
+    """Upload draft penugasan (.xlsx) atau CSV lalu import ke populasi_data dalam satu rerun"""
+    from utils.importer import impor_file
+
+    st.sidebar.markdown("---")
+    st.sidebar.title("📥 Import Massal")
+
+    with st.sidebar.form("import_form", clear_on_submit=True):
+        uploaded = st.file_uploader(
+            "Draft penugasan (.xlsx) atau CSV (Dosen, Mata Kuliah, Prodi[, SKS, Kelas])",
+            type=['xlsx', 'csv']
+        )
+        submitted = st.form_submit_button("📥 Import Data")
+
+        if submitted and uploaded is not None:
+            try:
+                populasi_data, ringkasan = impor_file(
+                    uploaded.name, uploaded, st.session_state.populasi_data, databases
+                )
+            except Exception as e:
+                st.error(f"❌ Gagal import {uploaded.name}: {e}")
+                return False
+
+            st.session_state.populasi_data = populasi_data
+            st.session_state.import_summary = (uploaded.name, ringkasan)
+            return True
+
+    return False
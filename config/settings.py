@@ -3,11 +3,17 @@
 # Path files
 DATABASE_PATH = 'mnt/db/Databases.xlsx'
 KROMOSOM_PATH = 'mnt/db/Kromosom.xlsx'
-APP_IMAGE_PATH = 'mnt/img/schedule_image.jpg'
-INPUT_IMAGE_PATH = 'mnt/img/input_page_image.jpg'
-RUN_IMAGE_PATH = 'mnt/img/run_page_image.jpg'
-RESULT_IMAGE_PATH = 'mnt/img/result_page_image.jpg'
-SETTING_IMAGE_PATH = 'mnt/img/settings_page_image.jpg'
+APP_IMAGE_PATH = 'static/img/schedule_image.jpg'
+INPUT_IMAGE_PATH = 'static/img/input_page_image.jpg'
+RUN_IMAGE_PATH = 'static/img/run_page_image.jpg'
+RESULT_IMAGE_PATH = 'static/img/result_page_image.jpg'
+SETTING_IMAGE_PATH = 'static/img/settings_page_image.jpg'
+
+# Folder yang disajikan Streamlit di app/static/ (server.enableStaticServing)
+STATIC_DIR = 'static'
+
+# Cache disk hasil parsing Excel (dikunci path + mtime + ukuran)
+CACHE_DIR = '.cache/excel'
 
 # Kolom mapping untuk Databases.xlsx
 COLUMN_MAPPING = {
@@ -22,6 +28,19 @@ COLUMN_MAPPING = {
     'blok': 25       # Kolom Z
 }
 
+# Soft constraint bawaan (utils.kendala.buat_registri); bobot < 1 agar konflik tetap dominan.
+# 'hari_preferensi' butuh {dosen: [hari, ...]} sehingga tidak termasuk bawaan.
+# Ruang lab: DATABASES_DEFAULT (Lab1, Lab2) dan ruang praktikum Databases.xlsx
+KENDALA_LUNAK = {
+    'batas_jam_harian': {'batas': 3, 'bobot': 0.3},        # slot per dosen per hari
+    'celah_kohort': {'bobot': 0.1},                        # slot kosong di hari kohort
+    'ruang_lab': {'ruangan': ['Lab1', 'Lab2', '77.3.08', '77.2.07'], 'bobot': 0.5}
+}
+
+# Budget bawaan run di halaman Run Algorithm (server bersama); 0 = tanpa batas
+GA_MAX_SECONDS = 300
+GA_MAX_EVALUATIONS = 0
+
 # Page config
 PAGE_TITLE = "Genetic Scheduler"
 PAGE_ICON = "🧬"
@@ -5,7 +5,7 @@ import streamlit as st
 import pandas as pd
 from utils.data_loader import load_databases
 from components.header import apply_custom_css, display_image_on_input
-from components.sidebar import render_input_sidebar
+from components.sidebar import render_input_sidebar, render_import_sidebar
 
 # Page config
 st.set_page_config(
@@ -33,16 +33,30 @@ submitted = render_input_sidebar(databases)
 if submitted:
     st.rerun()
 
+# Sidebar import massal
+imported = render_import_sidebar(databases)
+if imported:
+    st.rerun()
+
+if "import_summary" in st.session_state:
+    nama_file, ringkasan = st.session_state.pop("import_summary")
+    st.success(
+        f"✅ {ringkasan['ditambahkan']} dari {ringkasan['total']} baris di {nama_file} berhasil diimport"
+        + (f" ({ringkasan['duplikat']} kombinasi duplikat dilewati)" if ringkasan['duplikat'] else "")
+    )
+
 # Display data
 st.markdown("### 📌 Data Jadwal yang Sudah Ditambahkan")
 
 if len(st.session_state.populasi_data) == 0:
-    st.info("💡 Belum ada data. Silakan tambahkan dari sidebar.")
+    st.info("💡 Belum ada data. Silakan tambahkan atau import dari sidebar.")
 else:
+    # Data hasil import dapat membawa SKS (kolom ke-4) dan Kelas (kolom ke-5)
+    jumlah_kolom = max(len(data) for data in st.session_state.populasi_data.values())
     df = pd.DataFrame.from_dict(
         st.session_state.populasi_data,
         orient="index",
-        columns=["Dosen", "Matkul", "Prodi"]
+        columns=["Dosen", "Matkul", "Prodi", "SKS", "Kelas"][:jumlah_kolom]
     )
     
     st.dataframe(df, use_container_width=True)
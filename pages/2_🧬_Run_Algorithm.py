@@ -1,11 +1,17 @@
 """
 Page 2: Jalankan Algoritma
 """
+import time
 import streamlit as st
 import pandas as pd
 from utils.data_loader import load_databases
 from components.header import apply_custom_css, display_image_on_run
-from utils.genetic_algorithm import run_genetic_algorithm, get_summary_stats, format_kromosom_detail
+from utils.genetic_algorithm import (
+    run_genetic_algorithm, run_many, get_summary_stats, format_kromosom_detail, kemampuan_engine
+)
+from utils.background import GARunner
+from utils.kendala import buat_registri
+from config.settings import GA_MAX_SECONDS, GA_MAX_EVALUATIONS, KENDALA_LUNAK
 
 
 st.set_page_config(
@@ -19,7 +25,12 @@ if 'ga_config' not in st.session_state:
     st.session_state.ga_config = {
         'generations': 10,
         'mutation_rate': 0.15,
-        'elite_size': 2
+        'elite_size': 2,
+        'engine': 'python',
+        'n_restarts': 1,
+        'population_size': 30,
+        'max_seconds': GA_MAX_SECONDS,
+        'max_evaluations': GA_MAX_EVALUATIONS
     }
 
 st.title("🧬 Jalankan Algoritma Genetika")
@@ -39,10 +50,12 @@ databases = load_databases()
 
 # Display current data
 st.markdown("### 📋 Data Jadwal yang Akan Dioptimasi")
+# Data hasil import dapat membawa SKS sebagai kolom ke-4
+jumlah_kolom = max(len(data) for data in st.session_state.populasi_data.values())
 df = pd.DataFrame.from_dict(
     st.session_state.populasi_data,
     orient="index",
-    columns=["Dosen", "Matkul", "Prodi"]
+    columns=["Dosen", "Matkul", "Prodi", "SKS", "Kelas"][:jumlah_kolom]
 )
 st.dataframe(df, use_container_width=True)
 st.markdown("""---""")
@@ -85,12 +98,186 @@ with col3:
 with col4:
     st.metric("Ukuran Populasi", len(st.session_state.populasi_data))
 
+ALASAN_BERHENTI = {
+    'optimal': 'solusi tanpa konflik ditemukan (early stopping)',
+    'stagnation': 'tidak ada perbaikan selama {patience} generasi',
+    'time_limit': 'batas waktu {max_seconds} detik tercapai',
+    'evaluation_limit': 'batas {max_evaluations} evaluasi tercapai'
+}
+ENGINE_OPTIONS = {
+    'python': 'Python (default)',
+    'numpy': 'NumPy (array, lebih cepat untuk data besar)',
+    'jadwal': 'Jadwal Utuh (individu = satu jadwal lengkap)',
+    'annealing': 'Simulated Annealing (satu jadwal, cepat)',
+    'tabu': 'Tabu Search (satu jadwal, min-conflicts)',
+    'island': 'Island Model (beberapa populasi paralel)'
+}
+col1, col2 = st.columns(2)
+
+with col1:
+    engine = st.selectbox(
+        "Engine",
+        options=list(ENGINE_OPTIONS.keys()),
+        index=list(ENGINE_OPTIONS.keys()).index(st.session_state.ga_config.get('engine', 'python')),
+        format_func=ENGINE_OPTIONS.get,
+        help="Engine NumPy memproses seluruh populasi sebagai array integer"
+    )
+    st.session_state.ga_config['engine'] = engine
+    kemampuan = kemampuan_engine(engine)
+    
+    if engine == 'jadwal':
+        population_size = st.number_input(
+            "Jumlah Jadwal per Populasi",
+            min_value=2,
+            max_value=500,
+            value=st.session_state.ga_config.get('population_size', 30),
+            help="Setiap individu adalah jadwal lengkap untuk semua mata kuliah"
+        )
+        st.session_state.ga_config['population_size'] = population_size
+    
+    if engine == 'island':
+        n_islands = st.number_input(
+            "Jumlah Pulau",
+            min_value=2,
+            max_value=16,
+            value=st.session_state.ga_config.get('n_islands', 4),
+            help="Populasi independen yang berevolusi paralel di beberapa core"
+        )
+        st.session_state.ga_config['n_islands'] = n_islands
+        
+        migration_interval = st.number_input(
+            "Interval Migrasi (generasi)",
+            min_value=1,
+            max_value=100,
+            value=st.session_state.ga_config.get('migration_interval', 5),
+            help="Kromosom terbaik tiap pulau pindah ke pulau berikutnya setiap N generasi; "
+                 "batas waktu, patience, dan pembatalan dicek di akhir interval ini"
+        )
+        st.session_state.ga_config['migration_interval'] = migration_interval
+    
+    if 'repair_budget' in kemampuan:
+        repair_budget = st.number_input(
+            "Budget Repair per Generasi (detik)",
+            min_value=0.0,
+            max_value=5.0,
+            step=0.05,
+            value=st.session_state.ga_config.get('repair_budget', 0.0),
+            help="Min-conflicts local search: pindahkan gen yang konflik ke slot terbaik. 0 = nonaktif"
+        )
+        st.session_state.ga_config['repair_budget'] = repair_budget
+    
+    if 'kendala' in kemampuan:
+        soft_constraints = st.checkbox(
+            "Soft constraint",
+            value=st.session_state.ga_config.get('soft_constraints', False),
+            help="Tambahkan penalti berbobot KENDALA_LUNAK (config/settings.py) ke fitness: batas slot "
+                 "mengajar dosen per hari, celah jadwal kohort, dan ruang lab untuk praktikum"
+        )
+        st.session_state.ga_config['soft_constraints'] = soft_constraints
+
+with col2:
+    n_restarts = st.number_input(
+        "Jumlah Restart",
+        min_value=1,
+        max_value=32,
+        value=st.session_state.ga_config.get('n_restarts', 1),
+        help="Jalankan beberapa run independen secara paralel dan ambil hasil terbaik"
+    )
+    st.session_state.ga_config['n_restarts'] = n_restarts
+    
+    seed = st.number_input(
+        "Seed (opsional)",
+        min_value=0,
+        value=st.session_state.ga_config.get('seed'),
+        step=1,
+        help="Seed sama + parameter sama = hasil sama. Kosongkan untuk seed acak; "
+             "dengan beberapa restart, seed tiap run diturunkan dari seed ini"
+    )
+    st.session_state.ga_config['seed'] = seed
+    
+    SEEDING_OPTIONS = {
+        'random': 'Acak',
+        'greedy': 'Greedy (dosen paling terkendala lebih dulu)'
+    }
+    seeding = st.selectbox(
+        "Inisialisasi Populasi",
+        options=list(SEEDING_OPTIONS.keys()),
+        index=list(SEEDING_OPTIONS.keys()).index(st.session_state.ga_config.get('seeding', 'random')),
+        format_func=SEEDING_OPTIONS.get,
+        help="Greedy menempatkan mata kuliah ke slot bebas sehingga generasi 0 sudah minim konflik"
+    )
+    st.session_state.ga_config['seeding'] = seeding
+    
+    if seeding == 'greedy':
+        random_fraction = st.slider(
+            "Fraksi Acak",
+            min_value=0.0,
+            max_value=1.0,
+            value=st.session_state.ga_config.get('random_fraction', 0.2),
+            step=0.05,
+            help="Bagian populasi yang tetap diacak untuk menjaga keberagaman"
+        )
+        st.session_state.ga_config['random_fraction'] = random_fraction
+
+# ========== PENGHENTIAN OTOMATIS ==========
+with st.expander("⏱️ Penghentian Otomatis & Adaptasi"):
+    early_stopping = st.checkbox(
+        "Early stopping saat optimal",
+        value=st.session_state.ga_config.get('early_stopping', False),
+        help="Berhenti begitu solusi tanpa konflik ditemukan"
+    )
+    st.session_state.ga_config['early_stopping'] = early_stopping
+    
+    patience = st.number_input(
+        "Patience (generasi tanpa perbaikan)",
+        min_value=0,
+        max_value=1000,
+        value=st.session_state.ga_config.get('patience', 0),
+        help="Berhenti setelah sekian generasi tanpa perbaikan konflik/fitness. 0 = nonaktif"
+    )
+    st.session_state.ga_config['patience'] = patience
+    
+    col_budget1, col_budget2 = st.columns(2)
+    with col_budget1:
+        max_seconds = st.number_input(
+            "Batas Waktu per Run (detik)",
+            min_value=0,
+            max_value=86400,
+            value=st.session_state.ga_config.get('max_seconds', GA_MAX_SECONDS),
+            help="Run dihentikan di akhir generasi begitu waktu habis; hasil terbaik sejauh ini "
+                 "yang ditampilkan. 0 = tanpa batas"
+        )
+        st.session_state.ga_config['max_seconds'] = max_seconds
+    with col_budget2:
+        max_evaluations = st.number_input(
+            "Batas Evaluasi per Run",
+            min_value=0,
+            step=1000,
+            value=st.session_state.ga_config.get('max_evaluations', GA_MAX_EVALUATIONS),
+            help="Jumlah kromosom (Python/NumPy), jadwal utuh (Jadwal Utuh), atau langkah "
+                 "(Annealing/Tabu) yang dievaluasi sebelum run dihentikan. 0 = tanpa batas"
+        )
+        st.session_state.ga_config['max_evaluations'] = max_evaluations
+    
+    if 'adaptive' in kemampuan:
+        adaptive = st.checkbox(
+            "Mutasi adaptif + immigrant",
+            value=st.session_state.ga_config.get('adaptive', False),
+            help="Saat populasi stagnan atau keragaman slot kolaps, mutation rate dinaikkan "
+                 "dan kromosom terburuk diganti immigrant"
+        )
+        st.session_state.ga_config['adaptive'] = adaptive
+
 # Info box
 st.info("""
 **📚 Penjelasan Parameter:**
 - **Jumlah Generasi**: Berapa kali proses evolusi diulang. Semakin banyak = hasil lebih optimal.
 - **Mutation Rate**: Peluang gen berubah secara acak. Rekomendasi: 0.15-0.20.
 - **Elite Size**: Jumlah jadwal terbaik yang otomatis lolos ke generasi berikutnya.
+- **Engine**: NumPy menyimpan populasi sebagai array integer; pilih untuk dataset besar. Jadwal Utuh mengoptimasi setiap jadwal lengkap sebagai satu individu (konflik = total konflik jadwal). Simulated Annealing dan Tabu Search memperbaiki satu jadwal langkah demi langkah (1 generasi = satu langkah per mata kuliah); Mutation Rate dan Elite Size tidak dipakai. Island Model menjalankan beberapa populasi GA paralel dan memindahkan kromosom terbaik antar pulau setiap interval migrasi.
+- **Inisialisasi Populasi**: Greedy menempatkan mata kuliah dosen yang paling padat lebih dulu ke slot yang masih bebas; Fraksi Acak menjaga sebagian populasi tetap acak.
+- **Jumlah Restart**: Run independen yang dijalankan paralel di beberapa core; hasil terbaik yang disimpan.
+- **Soft constraint**: Penalti preferensi (KENDALA_LUNAK di config/settings.py) ikut menurunkan fitness; konflik tetap dihitung terpisah. Hanya engine Python.
 """)
 
 # Recommended settings
@@ -122,46 +309,118 @@ with st.expander("💡 Pengaturan Rekomendasi"):
         """)
 
 # ========== RUN BUTTON ==========
-if st.button("🚀 Jalankan Algoritma Genetika", type="primary", use_container_width=True):
-    if len(st.session_state.populasi_data) < 2:
-        st.error("⚠️ Minimal 2 kromosom diperlukan!")
-    else:
-        # Progress indicator
-        with st.spinner('🔄 Menjalankan Algoritma Genetika...'):
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            status_text.text("📦 Mempersiapkan populasi...")
-            progress_bar.progress(20)
-            
-            status_text.text("🧬 Evolusi sedang berlangsung...")
-            progress_bar.progress(40)
+runner = st.session_state.get('ga_runner')
+
+if runner is None:
+    if st.button("🚀 Jalankan Algoritma Genetika", type="primary", use_container_width=True):
+        if len(st.session_state.populasi_data) < 2:
+            st.error("⚠️ Minimal 2 kromosom diperlukan!")
+        else:
+            ga_params = {
+                'generations': generations,
+                'mutation_rate': mutation_rate,
+                'elite_size': elite_size,
+                'engine': engine,
+                'seeding': seeding,
+                'early_stopping': early_stopping
+            }
+            if seed is not None:
+                ga_params['seed'] = int(seed)
+            if patience:
+                ga_params['patience'] = patience
+            if max_seconds:
+                ga_params['max_seconds'] = max_seconds
+            if max_evaluations:
+                ga_params['max_evaluations'] = max_evaluations
+            if 'adaptive' in kemampuan and st.session_state.ga_config.get('adaptive'):
+                ga_params['adaptive'] = True
+            if seeding == 'greedy':
+                ga_params['random_fraction'] = st.session_state.ga_config['random_fraction']
+            if engine == 'jadwal':
+                ga_params['population_size'] = st.session_state.ga_config['population_size']
+            if engine == 'island':
+                ga_params['n_islands'] = st.session_state.ga_config['n_islands']
+                ga_params['migration_interval'] = st.session_state.ga_config['migration_interval']
+            if 'repair_budget' in kemampuan and st.session_state.ga_config.get('repair_budget'):
+                ga_params['repair_budget'] = st.session_state.ga_config['repair_budget']
+            if 'kendala' in kemampuan and st.session_state.ga_config.get('soft_constraints'):
+                try:
+                    ga_params['kendala'] = buat_registri(KENDALA_LUNAK, databases)
+                except ValueError as e:
+                    st.error(f"❌ {e}")
+                    st.stop()
             
-            # Run algorithm
-            try:
-                results = run_genetic_algorithm(
-                    st.session_state.populasi_data,
+            # GA berjalan di background thread; halaman ini hanya mem-poll progress
+            if n_restarts > 1:
+                runner = GARunner(
+                    run_many,
+                    dict(st.session_state.populasi_data),
                     databases,
-                    generations=generations,
-                    mutation_rate=mutation_rate,
-                    elite_size=elite_size
+                    n_runs=n_restarts,
+                    callback_arg='on_run_complete',
+                    cancel_arg='cancel_event',
+                    **ga_params
                 )
-                
-                progress_bar.progress(90)
-                status_text.text("💾 Menyimpan hasil...")
-                
-                # Save results to session state
-                st.session_state.ga_results = results
-                
-                progress_bar.progress(100)
-                status_text.text("✅ Selesai!")
-                
-                st.success(f"✅ Algoritma berhasil dijalankan! ({results['total_generations']} generasi)")
-                
-            except Exception as e:
-                st.error(f"❌ Error saat menjalankan algoritma: {str(e)}")
-                st.stop()
+            else:
+                runner = GARunner(
+                    run_genetic_algorithm,
+                    dict(st.session_state.populasi_data),
+                    databases,
+                    **ga_params
+                )
+            
+            st.session_state.ga_runner = runner.start()
+            st.rerun()
+
+else:
+    # ========== LIVE PROGRESS ==========
+    runner.poll()
+    events = runner.events
+    
+    st.markdown("### 🔄 Evolusi Sedang Berlangsung")
+    
+    if events and 'n_runs' in events[-1]:
+        last = events[-1]
+        st.progress(last['n_selesai'] / last['n_runs'])
+        st.text(f"🔁 Restart selesai: {last['n_selesai']}/{last['n_runs']}")
+        st.dataframe(
+            pd.DataFrame(events)[['run', 'seed', 'final_best_fitness', 'final_avg_fitness', 'final_konflik', 'total_konflik']],
+            use_container_width=True
+        )
+    elif events:
+        last = events[-1]
+        st.progress(last['generation'] / last['total_generations'])
+        st.text(
+            f"🧬 Generasi {last['generation']}/{last['total_generations']} — "
+            f"Best Fitness={last['best_fitness']:.4f}, Total Konflik={last['total_konflik']}"
+        )
+        st.line_chart(pd.DataFrame({
+            'Generasi': [e['generation'] for e in events],
+            'Best Fitness': [e['best_fitness'] for e in events],
+            'Average Fitness': [e['avg_fitness'] for e in events]
+        }).set_index('Generasi'))
+    else:
+        st.progress(0)
+        st.text("📦 Mempersiapkan populasi...")
+    
+    if runner.running:
+        if runner.cancelled:
+            st.warning("⏳ Membatalkan setelah generasi yang sedang berjalan...")
+        elif st.button("⛔ Batalkan", use_container_width=True):
+            runner.cancel()
         
+        time.sleep(0.5)
+        st.rerun()
+    else:
+        del st.session_state.ga_runner
+        
+        if runner.error is not None:
+            st.error(f"❌ Error saat menjalankan algoritma: {str(runner.error)}")
+            st.stop()
+        
+        # Save results to session state
+        runner.result['cancelled'] = runner.cancelled
+        st.session_state.ga_results = runner.result
         st.rerun()
 
 # ========== DISPLAY RESULTS FROM SESSION STATE ==========
@@ -195,25 +454,40 @@ if "ga_results" in st.session_state and st.session_state.ga_results is not None:
     with col3:
         st.metric(
             "Konflik Awal",
-            stats['initial_konflik'],
-            help="Jumlah konflik di populasi awal"
+            stats['initial_total_konflik'],
+            help="Total konflik jadwal di generasi pertama"
         )
     
     with col4:
         st.metric(
             "Konflik Akhir",
-            stats['final_konflik'],
-            delta=-(stats['initial_konflik'] - stats['final_konflik']),
+            stats['final_total_konflik'],
+            delta=-(stats['initial_total_konflik'] - stats['final_total_konflik']),
             delta_color="inverse",
             help="Jumlah konflik setelah optimasi"
         )
     
     # Status indicator
+    asal_hasil = (f" Hasil diambil dari generasi {stats['generasi_terbaik']} (terbaik sejauh ini)."
+                  if stats['generasi_terbaik'] != results['total_generations'] else "")
+    if results.get('cancelled'):
+        st.warning(f"⛔ Run dibatalkan pada generasi {results['total_generations']} — menampilkan hasil terbaik sejauh ini."
+                   + asal_hasil)
+    elif results.get('stop_reason') in ALASAN_BERHENTI:
+        st.info(f"⏱️ Berhenti pada generasi {results['total_generations']}: "
+                + ALASAN_BERHENTI[results['stop_reason']].format(**results['parameters']) + asal_hasil)
+    if results['parameters'].get('seed') is not None:
+        st.caption(f"🎲 Seed run: {results['parameters']['seed']} (isi kolom Seed dengan nilai ini untuk mengulang run)")
+    if results.get('kendala_lunak'):
+        st.caption("🧩 Penalti soft constraint populasi akhir: " + ", ".join(
+            f"{nama} = {nilai}" for nama, nilai in results['kendala_lunak'].items()
+        ))
+    
     if stats['reached_optimal']:
         st.success("🎉 **OPTIMAL!** Fitness = 1.0 dengan 0 konflik tercapai!")
     else:
         improvement_pct = results['improvement']['improvement_percentage']
-        st.info(f"📈 **Peningkatan Fitness: {improvement_pct}%** - Masih ada {stats['final_konflik']} konflik")
+        st.info(f"📈 **Peningkatan Fitness: {improvement_pct}%** - Masih ada {stats['final_total_konflik']} konflik")
     st.markdown("""---""")
     
     # ========== EVOLUTION CHART ==========
@@ -227,6 +501,16 @@ if "ga_results" in st.session_state and st.session_state.ga_results is not None:
     
     st.line_chart(chart_data.set_index('Generasi'))
 
+    # ========== RESTART SUMMARY ==========
+    if 'restarts' in results:
+        restarts = results['restarts']
+        with st.expander(f"🔁 Ringkasan {restarts['n_runs']} Restart (terbaik: run #{restarts['best_run']})"):
+            df_runs = pd.DataFrame(restarts['runs'])
+            st.dataframe(
+                df_runs[['run', 'seed', 'final_best_fitness', 'final_avg_fitness', 'final_konflik', 'total_konflik']],
+                use_container_width=True
+            )
+
     # ========== COMPARISON TABLE ==========
     with st.expander("🔍 Lihat Perbandingan Populasi Awal vs Akhir"):
         col1, col2 = st.columns(2)
@@ -239,7 +523,7 @@ if "ga_results" in st.session_state and st.session_state.ga_results is not None:
             st.dataframe(df_awal[['Kode', 'Dosen', 'Mata Kuliah', 'Fitness', 'Konflik']], use_container_width=True)
         
         with col2:
-            st.markdown(f"**✨ Populasi Akhir (Generasi {results['total_generations']})**")
+            st.markdown(f"**✨ Populasi Akhir (Generasi {stats['generasi_terbaik']})**")
             df_akhir = pd.DataFrame([
                 format_kromosom_detail(k) for k in results['populasi_akhir']
             ])
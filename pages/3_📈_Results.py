@@ -94,8 +94,8 @@ with col2:
     )
 
 with col3:
-    initial_konflik = int(stats['initial_konflik'])
-    final_konflik = int(stats['final_konflik'])
+    initial_konflik = int(stats['initial_total_konflik'])
+    final_konflik = int(stats['final_total_konflik'])
     konflik_delta = initial_konflik - final_konflik
     
     st.metric(
@@ -218,6 +218,8 @@ with st.expander("🔍 Lihat Detail per Jadwal"):
             st.write(f"**Dosen:** {row['Dosen']}")
             st.write(f"**Mata Kuliah:** {row['Mata Kuliah']}")
             st.write(f"**Prodi:** {row['Prodi']}")
+            if row['Kelas']:
+                st.write(f"**Kelas:** {row['Kelas']}")
         
         with col2:
             st.markdown("**📅 Jadwal Perkuliahan**")
@@ -280,7 +282,7 @@ with tab2:
     
     konflik_data = pd.DataFrame({
         'Generasi': results['history']['generations'],
-        'Jumlah Konflik': results['history']['best_konflik']
+        'Jumlah Konflik': results['history']['total_konflik']
     })
     
     konflik_chart = alt.Chart(konflik_data).mark_area(
@@ -310,10 +312,10 @@ with tab2:
     
     st.altair_chart(konflik_chart, use_container_width=True)
     
-    konflik_reduction = int(stats['initial_konflik'] - stats['final_konflik'])
+    konflik_reduction = int(stats['initial_total_konflik'] - stats['final_total_konflik'])
     if konflik_reduction > 0:
         st.success(f"✅ Berhasil mengurangi {konflik_reduction} konflik!")
-    elif int(stats['final_konflik']) == 0:
+    elif int(stats['final_total_konflik']) == 0:
         st.success("✅ Tidak ada konflik sejak awal!")
 
 # ========== ADVANCED DATA (EXPANDER) ==========
@@ -330,6 +332,7 @@ with st.expander("📊 Data Lanjutan: Progress & Populasi"):
             'Avg Fitness': results['history']['avg_fitness'][i],
             'Worst Fitness': results['history']['worst_fitness'][i],
             'Best Konflik': results['history']['best_konflik'][i],
+            'Total Konflik': results['history']['total_konflik'][i],
             'Improvement': results['history']['best_fitness'][i] - results['history']['best_fitness'][0] if i > 0 else 0
         })
     
@@ -365,7 +368,7 @@ with st.expander("📊 Data Lanjutan: Progress & Populasi"):
         st.dataframe(df_awal[['Kode', 'Dosen', 'Mata Kuliah', 'Hari', 'Waktu', 'Fitness', 'Konflik']], use_container_width=True, height=300)
     
     with col2:
-        st.markdown(f"**🟢 Populasi Akhir (Generasi {results['total_generations']})**")
+        st.markdown(f"**🟢 Populasi Akhir (Generasi {stats['generasi_terbaik']})**")
         df_akhir = pd.DataFrame([
             format_kromosom_detail(k) for k in results['populasi_akhir']
         ])
@@ -382,11 +385,16 @@ if stats['reached_optimal']:
     Algoritma telah menemukan solusi terbaik tanpa konflik. Jadwal ini siap digunakan!
     """)
 else:
-    final_konflik_display = int(stats['final_konflik'])
+    final_konflik_display = int(stats['final_total_konflik'])
     current_gen = results['total_generations']
+    if results['parameters'].get('repair_budget'):
+        tip_repair = f"- ✅ Naikkan **Budget Repair** (sekarang {results['parameters']['repair_budget']} detik/generasi)"
+    else:
+        tip_repair = "- ✅ Aktifkan **Budget Repair** (min-conflicts) pada engine Python, mis. 0.05 detik/generasi"
     st.info(f"""
     💡 **Tips untuk Meningkatkan Hasil:**
     
+    {tip_repair}
     - ✅ Tingkatkan **Jumlah Generasi** menjadi {current_gen * 2} atau lebih
     - ✅ Coba **Mutation Rate** yang lebih tinggi (15-20%)
     - ✅ Jalankan algoritma beberapa kali dan pilih hasil terbaik
@@ -0,0 +1,25 @@
+"""
+Fixture bersama untuk pengujian properti scheduler
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.workload import buat_workload  # noqa: E402
+from utils.genetic_algorithm import DATABASES_DEFAULT  # noqa: E402
+
+
+@pytest.fixture
+def workload():
+    """Input kecil dengan kohort (kelas) sehingga ketiga jenis konflik muncul"""
+    return buat_workload(60, n_dosen=12, n_ruangan=4, n_waktu=5, n_prodi=3, n_kelas=2, seed=1)
+
+
+@pytest.fixture
+def databases_bawaan():
+    """Salinan DATABASES_DEFAULT (waktu berupa rentang jam)"""
+    return {key: list(values) for key, values in DATABASES_DEFAULT.items()}
@@ -0,0 +1,44 @@
+"""
+Seed yang sama menghasilkan run yang sama untuk setiap engine dan worker run_many
+"""
+
+import pytest
+
+from utils.genetic_algorithm import ENGINES, run_genetic_algorithm, run_many
+
+
+def jejak(hasil):
+    return (
+        [(k['kode'], list(k['data']), k['konflik']) for k in hasil['populasi_akhir']],
+        hasil['history'],
+        hasil['parameters']['seed']
+    )
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('seeding', ['random', 'greedy'])
+def test_seed_sama_hasil_sama(workload, engine, seeding):
+    populasi_data, databases = workload
+    params = dict(generations=4, engine=engine, seeding=seeding, population_size=6, seed=11)
+    
+    pertama = run_genetic_algorithm(populasi_data, databases, **params)
+    kedua = run_genetic_algorithm(populasi_data, databases, **params)
+    assert jejak(pertama) == jejak(kedua)
+    assert pertama['parameters']['seed'] == 11
+
+
+def test_seed_berbeda_hasil_berbeda(workload):
+    populasi_data, databases = workload
+    pertama = run_genetic_algorithm(populasi_data, databases, generations=3, seed=1)
+    kedua = run_genetic_algorithm(populasi_data, databases, generations=3, seed=2)
+    assert jejak(pertama)[0] != jejak(kedua)[0]
+
+
+def test_run_many_tidak_bergantung_worker(workload):
+    populasi_data, databases = workload
+    params = dict(n_runs=3, generations=3, seed=5)
+    
+    serial = run_many(populasi_data, databases, workers=1, **params)
+    paralel = run_many(populasi_data, databases, workers=2, **params)
+    assert serial['restarts']['runs'] == paralel['restarts']['runs']
+    assert jejak(serial) == jejak(paralel)
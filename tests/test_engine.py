@@ -0,0 +1,116 @@
+"""
+Kontrak solver SOLVER: kemampuan yang dideklarasikan dan history yang sama untuk semua engine
+"""
+
+import random
+import threading
+
+import pytest
+
+from utils.genetic_algorithm import (
+    ENGINES, KEMAMPUAN, SOLVER, buat_populasi_awal, evaluasi_populasi, get_summary_stats, kemampuan_engine,
+    run_genetic_algorithm, run_many, signature, suntik_imigran
+)
+from utils.island import migrasi
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_history_sama_antar_engine(workload, engine):
+    populasi_data, databases = workload
+    hasil = run_genetic_algorithm(populasi_data, databases, generations=5, engine=engine,
+                                  population_size=6, seed=3)
+    history = hasil['history']
+    
+    assert len(history['total_konflik']) == len(history['best_konflik']) == len(history['generations'])
+    # Run tidak dipotong: total generasi terakhir = total konflik jadwal yang dikembalikan
+    assert history['total_konflik'][-1] == sum(k['konflik'] for k in hasil['populasi_akhir'])
+    # best_konflik = konflik terkecil satu mata kuliah, bukan total jadwal
+    assert history['best_konflik'][-1] <= min(k['konflik'] for k in hasil['populasi_akhir'])
+
+
+def test_kemampuan_sesuai_parameter_solver():
+    assert kemampuan_engine('python') == frozenset(KEMAMPUAN)
+    for engine in ENGINES:
+        assert kemampuan_engine(engine) <= set(SOLVER[engine][2])
+
+
+@pytest.mark.parametrize('opsi', [{'adaptive': True}, {'repair_budget': 0.01}])
+def test_kemampuan_tidak_didukung_ditolak(workload, opsi):
+    populasi_data, databases = workload
+    with pytest.raises(ValueError, match='belum didukung engine numpy'):
+        run_genetic_algorithm(populasi_data, databases, generations=2, engine='numpy', **opsi)
+
+
+def test_imigran_untuk_signature_yang_diganti(workload):
+    populasi_data, databases = workload
+    rng = random.Random(4)
+    populasi = evaluasi_populasi(buat_populasi_awal(populasi_data, databases, rng=rng), databases)
+    sebelum = sorted(signature(k) for k in populasi)
+    
+    baru, n_imigran = suntik_imigran(populasi, populasi_data, databases, 7, rng=rng)
+    
+    assert n_imigran == sum(k['kode'].startswith('G7_IMM_') for k in baru)
+    assert sorted(signature(k) for k in baru) == sebelum
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_ringkasan_run_dipotong_sesuai_populasi_akhir(workload, engine):
+    populasi_data, databases = workload
+    hasil = run_genetic_algorithm(populasi_data, databases, generations=200, engine=engine,
+                                  population_size=6, max_evaluations=600, seed=8)
+    stats = get_summary_stats(hasil)
+    
+    assert hasil['stop_reason'] == 'evaluation_limit'
+    assert stats['generasi_terbaik'] <= stats['total_generations']
+    assert stats['final_total_konflik'] == sum(k['konflik'] for k in hasil['populasi_akhir'])
+
+
+def test_migrasi_mengisi_signature_yang_hilang(workload):
+    populasi_data, databases = workload
+    rng = random.Random(12)
+    pulau = [evaluasi_populasi(buat_populasi_awal(populasi_data, databases, rng=rng), databases) for _ in range(3)]
+    
+    for populasi in migrasi(pulau, 5, 3, populasi_data, databases, rng=rng):
+        assert len(populasi) == len(populasi_data)
+        assert len({signature(k) for k in populasi}) == len(populasi_data)
+
+
+def test_snapshot_island_selalu_berisi_solusi_terbaik(workload):
+    populasi_data, databases = workload
+    snapshots = []
+    run_genetic_algorithm(populasi_data, databases, generations=7, engine='island',
+                          population_size=6, seed=6, migration_interval=3, on_generation=snapshots.append)
+    
+    assert len(snapshots) == 7
+    assert all(s['best_solution'] is not None for s in snapshots)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_cancel_event_menghentikan_run(workload, engine):
+    populasi_data, databases = workload
+    batal = threading.Event()
+    batal.set()
+    hasil = run_genetic_algorithm(populasi_data, databases, generations=50, engine=engine,
+                                  population_size=6, seed=5, cancel_event=batal)
+    
+    assert hasil['stop_reason'] == 'cancelled'
+    assert hasil['total_generations'] < 50
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_cancel_event_menghentikan_run_many(workload, workers):
+    populasi_data, databases = workload
+    batal = threading.Event()
+    batal.set()
+    hasil = run_many(populasi_data, databases, n_runs=3, workers=workers, seed=5,
+                     generations=50, cancel_event=batal)
+    
+    assert hasil['stop_reason'] == 'cancelled'
+    assert all(run['total_generations'] < 50 for run in hasil['restarts']['runs'])
+
+
+@pytest.mark.parametrize('n_runs', [0, -1])
+def test_run_many_menolak_n_runs_kosong(workload, n_runs):
+    populasi_data, databases = workload
+    with pytest.raises(ValueError, match='n_runs'):
+        run_many(populasi_data, databases, n_runs=n_runs)
@@ -0,0 +1,79 @@
+"""
+Jumlah baris importer draft Excel / CSV
+"""
+
+import io
+import os
+
+import pytest
+
+from utils.importer import baca_csv, baca_draft_excel, impor_file, impor_populasi
+
+DRAFT_ASLI = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                          'mnt', 'db', 'Draft_Penugasan_Matematika_Ganjil_2025_2026.xlsx')
+
+
+def tulis_draft(path):
+    from openpyxl import Workbook
+    
+    wb = Workbook()
+    ws = wb.active
+    ws.append(['DRAFT PENUGASAN'])
+    ws.append(['No', 'Nama Dosen', 'Nama Matakuliah', 'SKS', 'Prodi', 'Kelas'])
+    ws.append(['[1]', '[2]', '[3]', '[4]', '[5]', '[6]'])
+    ws.append([1, 'Dosen A', 'Aljabar', 3, 'Matematika', 'A'])
+    ws.append([None, None, 'Kalkulus', 2, 'Matematika', 'A'])
+    ws.append([None, None, None, None, None, None])          # pertemuan kedua
+    ws.append(['Jumlah Beban SKS', None, None, 5, None, None])
+    ws.append(['No', 'Nama Dosen', 'Nama Matakuliah', 'SKS', 'Prodi', 'Kelas'])  # header halaman berikut
+    ws.append([2, 'Dosen B', 'Statistika', 3, 'Statistika', 'B'])
+    ws.append([None, None, 'Statistika', 3, 'Statistika', 'B'])   # duplikat
+    ws.append([None, None, 'Statistika', 3, 'Statistika', 'C'])   # kelas lain
+    wb.save(path)
+
+
+def test_draft_excel(tmp_path):
+    path = tmp_path / 'draft.xlsx'
+    tulis_draft(path)
+    
+    baris = list(baca_draft_excel(path))
+    assert len(baris) == 5
+    assert baris[1] == ('Dosen A', 'Kalkulus', 'Matematika', '2', 'A')
+    
+    populasi_data, ringkasan = impor_file('draft.xlsx', path)
+    assert ringkasan == {'ditambahkan': 4, 'duplikat': 1, 'total': 5}
+    assert len(populasi_data) == 4
+
+
+def test_csv_dan_populasi_lama():
+    teks = (
+        "Dosen,Mata Kuliah,Prodi,SKS,Kelas\n"
+        "Dosen A,Aljabar,Matematika,3,A\n"
+        "Dosen A,Aljabar,Matematika,3,A\n"
+        ",Kosong,Matematika,,\n"
+        "Dosen B,Statistika,Statistika,,\n"
+    )
+    baris = list(baca_csv(io.BytesIO(teks.encode('utf-8'))))
+    assert len(baris) == 3
+    
+    lama = {'C1': ['Dosen B', 'Statistika', 'Statistika']}
+    populasi_data, ringkasan = impor_populasi(baris, lama)
+    assert ringkasan == {'ditambahkan': 1, 'duplikat': 2, 'total': 3}
+    assert list(populasi_data) == ['C1', 'C2']
+    assert populasi_data['C2'] == ['Dosen A', 'Aljabar', 'Matematika', '3', 'A']
+
+
+def test_format_tidak_didukung():
+    with pytest.raises(ValueError):
+        impor_file('jadwal.txt', io.BytesIO(b''))
+
+
+@pytest.mark.skipif(not os.path.exists(DRAFT_ASLI), reason='Draft penugasan tidak tersedia')
+def test_draft_asli():
+    baris = list(baca_draft_excel(DRAFT_ASLI))
+    populasi_data, ringkasan = impor_populasi(baris)
+    
+    assert ringkasan['total'] == len(baris) > 0
+    assert ringkasan['ditambahkan'] + ringkasan['duplikat'] == ringkasan['total']
+    assert len(populasi_data) == ringkasan['ditambahkan']
+    assert all(dosen and matkul for dosen, matkul, *_ in baris)
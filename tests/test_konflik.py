@@ -0,0 +1,167 @@
+"""
+Evaluator konflik (bucket, indeks incremental, engine array) dibandingkan
+dengan hitung_konflik berpasangan sebagai acuan
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from config.settings import KENDALA_LUNAK
+from utils.genetic_algorithm import (
+    DATABASES_DEFAULT, GEN_MUTASI, IndeksKonflik, Kromosom, buat_indeks_signature, buat_populasi_list,
+    evaluasi_populasi, hitung_konflik, hitung_konflik_populasi, jalankan_generasi
+)
+from utils.ga_numpy import ASAL_INPUT, buat_kodebook, decode_populasi, hitung_konflik_array, _slot_acak, _susun_genes
+from utils.ga_jadwal import hitung_konflik_jadwal, jadwal_acak, urai_kode
+from utils.kendala import buat_registri
+
+
+def acuan(populasi, databases):
+    return [hitung_konflik(krom, populasi, databases) for krom in populasi]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_bucket_sama_dengan_acuan(workload, seed):
+    populasi_data, databases = workload
+    populasi = buat_populasi_list(populasi_data, databases, random.Random(seed))
+    assert hitung_konflik_populasi(populasi, databases) == acuan(populasi, databases)
+
+
+def test_bucket_dengan_kode_ganda(workload):
+    populasi_data, databases = workload
+    rng = random.Random(3)
+    populasi = buat_populasi_list(populasi_data, databases, rng)
+    # Kromosom dengan kode sama tidak saling menghitung konflik
+    populasi += [Kromosom(krom.kode, list(krom.data)) for krom in rng.sample(populasi, 10)]
+    assert hitung_konflik_populasi(populasi, databases) == acuan(populasi, databases)
+
+
+def test_bucket_tanpa_databases(workload):
+    populasi_data, databases = workload
+    populasi = buat_populasi_list(populasi_data, databases, random.Random(4))
+    assert hitung_konflik_populasi(populasi) == acuan(populasi, None)
+
+
+def test_bucket_rentang_jam(databases_bawaan):
+    rng = random.Random(5)
+    populasi_data = {
+        f"C{i}": [f"D{rng.randrange(6)}", f"M{i}", f"P{rng.randrange(2)}", None, f"K{rng.randrange(2)}"]
+        for i in range(40)
+    }
+    populasi = buat_populasi_list(populasi_data, databases_bawaan, rng)
+    assert hitung_konflik_populasi(populasi, databases_bawaan) == acuan(populasi, databases_bawaan)
+
+
+def test_kromosom_key_tidak_ada():
+    krom = Kromosom('C1', ['Dosen A', 'Aljabar', 'Matematika'])
+    
+    assert krom['kode'] == 'C1'
+    assert krom.get('tidak_ada', 0) == 0
+    with pytest.raises(KeyError):
+        krom['tidak_ada']
+
+
+@pytest.mark.parametrize('pakai_kendala', [False, True])
+def test_indeks_incremental_sama_dengan_hitung_ulang(workload, pakai_kendala):
+    populasi_data, databases = workload
+    rng = random.Random(6)
+    kendala = buat_registri({'batas_jam_harian': {'batas': 2}, 'celah_kohort': {}}) if pakai_kendala else None
+    populasi = evaluasi_populasi(buat_populasi_list(populasi_data, databases, rng), databases, kendala)
+    indeks = IndeksKonflik(populasi, databases, kendala)
+    
+    for langkah in range(300):
+        krom = rng.choice(populasi)
+        gene_idx = rng.choice(GEN_MUTASI)
+        pilihan = databases[('sks', 'hari', 'waktu', 'ruangan')[gene_idx - 3]]
+        indeks.ubah_gen(krom, gene_idx, rng.choice(pilihan))
+        if langkah % 25 == 0:
+            indeks.perbarui_skor()
+    indeks.perbarui_skor()
+    
+    segar = evaluasi_populasi([krom.salin() for krom in populasi], databases, kendala)
+    assert [k['konflik'] for k in populasi] == [k['konflik'] for k in segar]
+    assert [k['penalti'] for k in populasi] == [k['penalti'] for k in segar]
+    assert [k['konflik'] for k in populasi] == acuan(populasi, databases)
+
+
+def test_rangkum_kendala_sama_dengan_penalti(workload):
+    populasi_data, databases = workload
+    kendala = buat_registri({'batas_jam_harian': {'batas': 2}, 'celah_kohort': {}, 'ruang_lab': {}})
+    populasi = evaluasi_populasi(buat_populasi_list(populasi_data, databases, random.Random(9)), databases, kendala)
+    
+    per_kendala = kendala.rangkum(populasi, databases)
+    assert set(per_kendala) == {'batas_jam_harian', 'celah_kohort', 'ruang_lab'}
+    assert sum(per_kendala.values()) == pytest.approx(sum(k['penalti'] for k in populasi), abs=1e-3)
+
+
+def test_running_total_indeks_lintas_generasi(workload):
+    populasi_data, databases = workload
+    rng = random.Random(10)
+    kendala = buat_registri({'batas_jam_harian': {'batas': 2}, 'celah_kohort': {}, 'ruang_lab': {}})
+    populasi = evaluasi_populasi(buat_populasi_list(populasi_data, databases, rng), databases, kendala)
+    indeks = IndeksKonflik(databases=databases, kendala=kendala)
+    indeks_sig = buat_indeks_signature(populasi_data)
+    
+    for gen in range(1, 4):
+        populasi = jalankan_generasi(populasi, populasi_data, databases, gen, 0.2, 2, indeks_sig, kendala,
+                                     rng=rng, indeks=indeks)
+        offspring = indeks.anggota()
+        assert len(offspring) == len(populasi)
+        assert indeks.penalti_per_kendala() == pytest.approx(kendala.rangkum(offspring, databases), abs=1e-3)
+        assert indeks.total_penalti == pytest.approx(sum(k['penalti'] for k in offspring), abs=1e-3)
+    
+    indeks.hapus_banyak(offspring[::2])
+    assert indeks.penalti_per_kendala() == pytest.approx(kendala.rangkum(indeks.anggota(), databases), abs=1e-3)
+
+
+def test_kendala_lunak_cocok_dengan_databases_bawaan():
+    assert len(buat_registri(KENDALA_LUNAK, DATABASES_DEFAULT)) == len(KENDALA_LUNAK)
+    with pytest.raises(ValueError, match='ruang lab'):
+        buat_registri({'ruang_lab': {'ruangan': ['Lab9']}}, DATABASES_DEFAULT)
+
+
+def test_indeks_hapus_tambah(workload):
+    populasi_data, databases = workload
+    rng = random.Random(7)
+    populasi = evaluasi_populasi(buat_populasi_list(populasi_data, databases, rng), databases)
+    indeks = IndeksKonflik(populasi, databases)
+    
+    keluar = rng.sample(populasi, 15)
+    for krom in keluar:
+        indeks.hapus(krom)
+    indeks.perbarui_skor()
+    sisa = [krom for krom in populasi if krom in indeks]
+    assert [indeks.konflik(k) for k in sisa] == acuan(sisa, databases)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_engine_array_sama_dengan_acuan(workload, seed):
+    populasi_data, databases = workload
+    kodebook = buat_kodebook(populasi_data, databases)
+    rng = np.random.default_rng(seed)
+    n = len(kodebook['kunci'])
+    genes = _susun_genes(kodebook['signature'], _slot_acak(n, kodebook, rng, kodebook['sks_input']))
+    
+    populasi = decode_populasi({
+        'genes': genes, 'konflik': np.zeros(n, dtype=np.int64), 'generation': np.zeros(n, dtype=np.int64),
+        'asal': np.full(n, ASAL_INPUT), 'nomor': np.arange(n)
+    }, kodebook)
+    assert hitung_konflik_array(genes, kodebook).tolist() == acuan(populasi, databases)
+
+
+def test_jadwal_utuh_sama_dengan_acuan(workload):
+    populasi_data, databases = workload
+    kodebook = buat_kodebook(populasi_data, databases)
+    kode = jadwal_acak(4, kodebook, np.random.default_rng(8))
+    konflik = hitung_konflik_jadwal(kode, kodebook)
+    n = len(kodebook['kunci'])
+    
+    for baris, konflik_baris in zip(kode, konflik):
+        genes = _susun_genes(kodebook['signature'], urai_kode(baris, kodebook))
+        populasi = decode_populasi({
+            'genes': genes, 'konflik': np.zeros(n, dtype=np.int64), 'generation': np.zeros(n, dtype=np.int64),
+            'asal': np.full(n, ASAL_INPUT), 'nomor': np.arange(n)
+        }, kodebook)
+        assert konflik_baris.tolist() == acuan(populasi, databases)
@@ -0,0 +1,108 @@
+"""
+Span waktu dari label rentang jam (PetaSlot)
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from utils.genetic_algorithm import (
+    PetaSlot, buat_populasi_list, crossover, hitung_konflik, hitung_konflik_populasi,
+    mutasi, rentang_waktu, run_genetic_algorithm, ENGINES
+)
+from utils.ga_numpy import buat_kodebook, hitung_konflik_array, _slot_acak, _susun_genes
+
+# Potongan label waktu Databases.xlsx: rentang jam yang saling tumpang tindih
+DATABASES_JAM = {
+    'sks': ['1 - 1.0', '2 - 1.5', '3 - 2.0', '4 - 3.0'],
+    'hari': ['Senin', 'Selasa'],
+    'waktu': ['1 - 08.00-09.40', '2 - 08.00–10.30', '3 - 09.40-10.30', '4 - 10.30-12.10',
+              '5 - 13.00-14.40', '6 - 16.20-18.00'],
+    'ruangan': ['77.3.01B', '77.3.02', 'Online']
+}
+
+
+def test_rentang_waktu():
+    assert rentang_waktu('1 - 08.00-09.40') == (480, 580)
+    assert rentang_waktu('2 - 08.00–10.30') == (480, 630)
+    assert rentang_waktu('07:00-09:00') == (420, 540)
+    assert rentang_waktu('W1') is None
+    assert rentang_waktu('10.00-09.00') is None
+
+
+def test_label_tumpang_tindih_beririsan():
+    peta = PetaSlot(DATABASES_JAM)
+    a = peta.rentang('1 - 08.00-09.40', '1 - 1.0')
+    b = peta.rentang('2 - 08.00–10.30', '1 - 1.0')
+    c = peta.rentang('3 - 09.40-10.30', '1 - 1.0')
+    assert a[0] < b[1] and b[0] < a[1]
+    assert b[0] < c[1] and c[0] < b[1]
+    assert a[1] <= c[0]
+
+
+def test_sks_memperpanjang_span_tanpa_dipotong():
+    peta = PetaSlot(DATABASES_JAM)
+    # 3 SKS = 150 menit dari 08.00 sampai 10.30, sama dengan label kedua
+    assert peta.rentang('1 - 08.00-09.40', '4 - 3.0') == peta.rentang('2 - 08.00–10.30', '1 - 1.0')
+    # 16.20 + 150 menit melewati akhir hari: tidak muat dan tidak dipilih
+    assert not peta.muat('6 - 16.20-18.00', '4 - 3.0')
+    assert '6 - 16.20-18.00' not in peta.waktu_muat('4 - 3.0')
+    awal, akhir = peta.rentang('6 - 16.20-18.00', '4 - 3.0')
+    assert akhir > peta.n_blok
+
+
+def test_blok_berurutan_tanpa_rentang_jam():
+    databases = {'sks': ['2', '4'], 'hari': ['Senin'], 'waktu': ['W1', 'W2', 'W3'], 'ruangan': ['R1']}
+    peta = PetaSlot(databases)
+    assert peta.rentang('W2', '4') == (1, 3)
+    assert not peta.muat('W3', '4')
+    assert peta.waktu_muat('4') == ('W1', 'W2')
+
+
+def test_sks_tidak_muat_ditolak():
+    databases = dict(DATABASES_JAM, waktu=['1 - 08.00-09.40'])
+    with pytest.raises(ValueError):
+        PetaSlot(databases).waktu_muat('4 - 3.0')
+
+
+def test_operator_menjaga_span_muat():
+    rng = random.Random(2)
+    peta = PetaSlot(DATABASES_JAM)
+    populasi_data = {f"C{i}": [f"D{i % 5}", f"M{i}", 'P', None, 'A'] for i in range(40)}
+    populasi = buat_populasi_list(populasi_data, DATABASES_JAM, rng)
+    
+    for _ in range(200):
+        anak = crossover(rng.choice(populasi), rng.choice(populasi), 1, rng=rng, databases=DATABASES_JAM)
+        for krom in anak:
+            mutasi(krom, 1.0, DATABASES_JAM, rng=rng)
+            assert peta.muat(krom['data'][5], krom['data'][3])
+
+
+def test_evaluator_rentang_jam_sama_dengan_acuan():
+    rng = random.Random(3)
+    populasi_data = {f"C{i}": [f"D{rng.randrange(6)}", f"M{i}", 'P', None, f"K{rng.randrange(2)}"]
+                     for i in range(50)}
+    populasi = buat_populasi_list(populasi_data, DATABASES_JAM, rng)
+    acuan = [hitung_konflik(krom, populasi, DATABASES_JAM) for krom in populasi]
+    assert hitung_konflik_populasi(populasi, DATABASES_JAM) == acuan
+    
+    kodebook = buat_kodebook(populasi_data, DATABASES_JAM)
+    slot = _slot_acak(len(populasi_data), kodebook, np.random.default_rng(4), kodebook['sks_input'])
+    assert kodebook['muat'][slot[:, 0], slot[:, 2]].all()
+    genes = _susun_genes(kodebook['signature'], slot)
+    nilai = kodebook['nilai']
+    for krom, baris in zip(populasi, genes):
+        krom['data'][3:7] = [nilai['sks'][baris[3]], nilai['hari'][baris[4]],
+                             nilai['waktu'][baris[5]], nilai['ruangan'][baris[6]]]
+    acuan = [hitung_konflik(krom, populasi, DATABASES_JAM) for krom in populasi]
+    assert hitung_konflik_array(genes, kodebook).tolist() == acuan
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_hasil_engine_muat(engine):
+    populasi_data = {f"C{i}": [f"D{i % 7}", f"M{i}", 'P'] for i in range(30)}
+    hasil = run_genetic_algorithm(populasi_data, DATABASES_JAM, generations=5, engine=engine,
+                                  population_size=6, seed=9)
+    peta = PetaSlot(DATABASES_JAM)
+    assert all(peta.muat(k['data'][5], k['data'][3]) for k in hasil['populasi_akhir'])
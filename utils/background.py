@@ -0,0 +1,81 @@
+"""
+Eksekusi GA di thread latar belakang
+
+Script Streamlit tidak lagi terblokir selama evolusi: GA berjalan di
+thread terpisah, setiap generasi mengirim event lewat queue, dan halaman
+cukup mem-poll event tersebut untuk menggambar progress secara live.
+"""
+
+import queue
+import threading
+
+
+class GARunner:
+    """
+    Jalankan fungsi GA (run_genetic_algorithm / run_many) di background
+
+    Fungsi dipanggil dengan callback progress (keyword `callback_arg`)
+    yang mengirim event ke queue dan mengembalikan True bila run
+    dibatalkan, sehingga evolusi berhenti di batas generasi berikutnya.
+    Bila callback hanya dipanggil per run (run_many), event pembatalan
+    diteruskan lewat keyword `cancel_arg` agar run yang sedang berjalan
+    juga berhenti di batas generasi.
+    """
+
+    def __init__(self, fn, *args, callback_arg='on_generation', cancel_arg=None, **kwargs):
+        self.events = []
+        self.result = None
+        self.error = None
+
+        self._fn = fn
+        self._args = args
+        self._queue = queue.Queue()
+        self._cancel = threading.Event()
+        self._kwargs = dict(kwargs, **{callback_arg: self._callback})
+        if cancel_arg is not None:
+            self._kwargs[cancel_arg] = self._cancel
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _callback(self, event):
+        self._queue.put(event)
+        return self._cancel.is_set()
+
+    def _run(self):
+        try:
+            self.result = self._fn(*self._args, **self._kwargs)
+        except Exception as e:
+            self.error = e
+
+    def start(self):
+        """Mulai eksekusi di background"""
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Minta pembatalan; GA berhenti setelah generasi yang sedang berjalan"""
+        self._cancel.set()
+
+    def poll(self):
+        """
+        Ambil event baru sejak poll terakhir
+
+        Returns:
+            List event baru (semua event tersimpan di self.events)
+        """
+        baru = []
+        while True:
+            try:
+                baru.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        self.events.extend(baru)
+        return baru
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
@@ -0,0 +1,193 @@
+"""
+Command-line entry point GA scheduler (tanpa Streamlit)
+
+Hot path hanya memakai modul standar + utils.genetic_algorithm, jadi tidak
+meng-import streamlit, pandas, atau plotly (cocok untuk cron & CI).
+
+Contoh (dari root repo):
+    python -m utils.cli jadwal.csv -o hasil.csv --generations 50 --seed 42
+    python -m utils.cli mnt/db/Draft_Penugasan_Matematika_Ganjil_2025_2026.xlsx \\
+        -o hasil.csv --runs 4 --workers 4 --databases mnt/db/Databases.xlsx
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+from utils.genetic_algorithm import (
+    DATABASES_DEFAULT,
+    ENGINES,
+    KEMAMPUAN,
+    SEEDING,
+    kemampuan_engine,
+    run_genetic_algorithm,
+    run_many,
+    get_summary_stats,
+    export_hasil_ga_ke_csv
+)
+from utils.importer import impor_file
+
+
+def buat_parser():
+    """Argument parser CLI"""
+    parser = argparse.ArgumentParser(
+        prog='python -m utils.cli',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('input', help="File input: CSV (Dosen, Mata Kuliah, Prodi) atau draft penugasan .xlsx")
+    parser.add_argument('-o', '--output', required=True, help="Path CSV jadwal hasil")
+    parser.add_argument('--history', help="Path JSON history & ringkasan (default: <output>.history.json)")
+    parser.add_argument('--databases', help="Databases.xlsx untuk pilihan slot (default: pilihan bawaan)")
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--mutation-rate', type=float, default=0.15)
+    parser.add_argument('--elite-size', type=int, default=2)
+    parser.add_argument('--early-stopping', action='store_true')
+    parser.add_argument('--engine', default='python', choices=ENGINES)
+    parser.add_argument('--population-size', type=int, default=30,
+                        help="Jumlah jadwal per populasi untuk --engine jadwal (default: 30)")
+    parser.add_argument('--islands', type=int, default=4,
+                        help="Jumlah pulau untuk --engine island (default: 4)")
+    parser.add_argument('--migration-interval', type=int, default=5,
+                        help="Migrasi setiap N generasi untuk --engine island (default: 5)")
+    parser.add_argument('--migration-size', type=int, default=2,
+                        help="Jumlah migran per pulau untuk --engine island (default: 2)")
+    parser.add_argument('--repair-budget', type=float,
+                        help="Detik per generasi untuk repair min-conflicts (engine python, island)")
+    parser.add_argument('--seeding', default='random', choices=SEEDING,
+                        help="Populasi awal: acak atau greedy (dosen paling terkendala lebih dulu)")
+    parser.add_argument('--random-fraction', type=float, default=0.2,
+                        help="Fraksi populasi yang tetap acak untuk --seeding greedy (default: 0.2)")
+    parser.add_argument('--patience', type=int,
+                        help="Berhenti setelah N generasi tanpa perbaikan")
+    parser.add_argument('--max-seconds', type=float,
+                        help="Batas waktu run dalam detik (dicek di batas generasi)")
+    parser.add_argument('--max-evaluations', type=int,
+                        help="Batas jumlah evaluasi (kromosom, jadwal, atau langkah sesuai engine)")
+    parser.add_argument('--adaptive', action='store_true',
+                        help="Naikkan mutasi & suntik immigrant saat stagnan (engine python)")
+    parser.add_argument('--soft-constraints', action='store_true',
+                        help="Aktifkan soft constraint bawaan (config.settings.KENDALA_LUNAK, engine python, island)")
+    parser.add_argument('--seed', type=int,
+                        help="Seed run; dengan --runs > 1 menjadi seed induk untuk seed tiap restart")
+    parser.add_argument('--runs', type=int, default=1, help="Jumlah restart independen (default: 1)")
+    parser.add_argument('--workers', type=int, help="Jumlah proses untuk --runs > 1")
+    parser.add_argument('--quiet', action='store_true',
+                        help="Sembunyikan log info GA (mis. pengisian kromosom yang hilang); peringatan tetap tampil")
+    return parser
+
+
+def muat_databases(path):
+    """Pilihan slot dari Databases.xlsx (lewat cache disk) atau bawaan"""
+    if not path:
+        return {key: list(values) for key, values in DATABASES_DEFAULT.items()}
+    
+    from config.settings import COLUMN_MAPPING
+    from utils.excel_cache import baca_kolom_unik, susun_databases
+    return susun_databases(baca_kolom_unik(path, COLUMN_MAPPING))
+
+
+def _tulis_history(path, results, args, waktu):
+    """Simpan history per generasi dan ringkasan run ke JSON"""
+    laporan = {
+        'input': args.input,
+        'output': args.output,
+        'seed': args.seed,
+        'elapsed_seconds': round(waktu, 3),
+        'summary': get_summary_stats(results),
+        'parameters': results['parameters'],
+        'history': results['history']
+    }
+    if 'restarts' in results:
+        laporan['restarts'] = results['restarts']
+    if 'kendala_lunak' in results:
+        laporan['kendala_lunak'] = results['kendala_lunak']
+    for key in ('stop_reason', 'evaluations', 'adaptasi', 'jadwal', 'lintasan'):
+        if key in results:
+            laporan[key] = results[key]
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(laporan, f, indent=2, ensure_ascii=False)
+
+
+def main(argv=None):
+    args = buat_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format='%(message)s')
+    
+    try:
+        databases = muat_databases(args.databases)
+        with open(args.input, 'rb') as f:
+            populasi_data, ringkasan = impor_file(args.input, f)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    
+    diminta = {'kendala': args.soft_constraints, 'repair_budget': args.repair_budget is not None,
+               'adaptive': args.adaptive}
+    tidak_didukung = [nama for nama, aktif in diminta.items() if aktif and nama not in kemampuan_engine(args.engine)]
+    if tidak_didukung:
+        print(f"❌ {', '.join(KEMAMPUAN[nama] for nama in tidak_didukung)} belum didukung engine {args.engine}",
+              file=sys.stderr)
+        return 2
+    
+    if len(populasi_data) < 2:
+        print("❌ Minimal 2 jadwal diperlukan untuk menjalankan GA", file=sys.stderr)
+        return 2
+    
+    print(f"Input: {len(populasi_data)} jadwal ({ringkasan['duplikat']} duplikat dilewati)")
+    
+    ga_params = dict(
+        generations=args.generations,
+        mutation_rate=args.mutation_rate,
+        elite_size=args.elite_size,
+        early_stopping=args.early_stopping,
+        engine=args.engine,
+        population_size=args.population_size,
+        repair_budget=args.repair_budget,
+        seeding=args.seeding,
+        random_fraction=args.random_fraction,
+        patience=args.patience,
+        max_seconds=args.max_seconds,
+        max_evaluations=args.max_evaluations,
+        adaptive=args.adaptive,
+        seed=args.seed,
+        n_islands=args.islands,
+        migration_interval=args.migration_interval,
+        migration_size=args.migration_size
+    )
+    if args.soft_constraints:
+        from config.settings import KENDALA_LUNAK
+        from utils.kendala import buat_registri
+        try:
+            ga_params['kendala'] = buat_registri(KENDALA_LUNAK, databases)
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 2
+    
+    start = time.perf_counter()
+    if args.runs > 1:
+        results = run_many(populasi_data, databases, n_runs=args.runs, workers=args.workers, **ga_params)
+    else:
+        results = run_genetic_algorithm(populasi_data, databases, **ga_params)
+    waktu = time.perf_counter() - start
+    
+    export_hasil_ga_ke_csv(results, args.output)
+    history_path = args.history or f"{os.path.splitext(args.output)[0]}.history.json"
+    _tulis_history(history_path, results, args, waktu)
+    
+    stats = get_summary_stats(results)
+    print(f"Selesai dalam {waktu:.2f}s: {stats['total_generations']} generasi "
+          f"({results.get('stop_reason', 'generations')}), "
+          f"best fitness {stats['final_best_fitness']}, total konflik {stats['final_total_konflik']}")
+    if stats['generasi_terbaik'] != stats['total_generations']:
+        print(f"Hasil: populasi terbaik dari generasi {stats['generasi_terbaik']}")
+    print(f"History: {history_path}")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
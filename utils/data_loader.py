@@ -1,14 +1,14 @@
 """Fungsi untuk load data dari Excel"""
 import streamlit as st
-import pandas as pd
 from config.settings import DATABASE_PATH, KROMOSOM_PATH, COLUMN_MAPPING
+from utils.excel_cache import baca_excel, baca_kolom_unik, susun_databases
 
 
 @st.cache_data
 def load_kromosom_data():
-    """Load data dari Kromosom.xlsx"""
+    """Load data dari Kromosom.xlsx (lewat cache disk)"""
     try:
-        df = pd.read_excel(KROMOSOM_PATH)
+        df = baca_excel(KROMOSOM_PATH)
         return df
     except FileNotFoundError:
         st.error("❌ File 'Kromosom.xlsx' tidak ditemukan!")
@@ -20,27 +20,13 @@ def load_kromosom_data():
 
 @st.cache_data
 def load_databases():
-    """Load dan gabungkan data dari Kromosom.xlsx dan Databases.xlsx"""
+    """Load data pilihan dari Databases.xlsx (hanya kolom COLUMN_MAPPING, lewat cache disk)"""
     try:
-        df_kromosom = pd.read_excel(KROMOSOM_PATH)
-        df_databases = pd.read_excel(DATABASE_PATH)
-        
         # Ambil data unik dari Databases.xlsx
-        data = {}
-        for key, col_index in COLUMN_MAPPING.items():
-            if len(df_databases.columns) > col_index:
-                unique_values = df_databases.iloc[:, col_index].dropna().unique().tolist()
-                data[key] = [f"{i+1} - {str(val)}" for i, val in enumerate(unique_values)]
-            else:
-                data[key] = ['Data kosong']
-        
-        # Tambahkan opsi kosong untuk blok
-        data['blok'] = [''] + data.get('blok', [])
-        
-        return data
+        return susun_databases(baca_kolom_unik(DATABASE_PATH, COLUMN_MAPPING))
     except FileNotFoundError as e:
         st.sidebar.error(f"❌ File tidak ditemukan: {e}")
         return None
     except Exception as e:
         st.sidebar.error(f"❌ Error membaca file: {e}")
-        return None
\ No newline at end of file
+        return None
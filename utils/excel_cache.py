@@ -0,0 +1,155 @@
+"""
+Cache disk untuk file Excel
+
+openpyxl lambat dan st.cache_data hanya hidup selama satu proses server,
+jadi hasil parsing disimpan sebagai pickle di CACHE_DIR. Kunci cache adalah
+path + mtime + ukuran file (+ kolom yang dibaca): begitu spreadsheet diubah,
+entri lama otomatis tidak terpakai dan dihapus.
+"""
+
+import hashlib
+import os
+import pickle
+
+from config.settings import CACHE_DIR
+
+
+def kunci_file(path, *extra):
+    """
+    Kunci cache untuk file: path absolut, mtime, ukuran, dan parameter tambahan
+
+    Returns:
+        String hash hex
+    """
+    stat = os.stat(path)
+    raw = repr((os.path.abspath(path), stat.st_mtime_ns, stat.st_size) + extra)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def _prefix_cache(path, jenis):
+    """Prefix nama file cache: <nama file>.<jenis>-"""
+    return f"{os.path.splitext(os.path.basename(path))[0]}.{jenis}-"
+
+
+def _hapus_entri_lama(prefix, aktif, cache_dir):
+    """Hapus entri cache dengan prefix yang sama tetapi kunci lama"""
+    for nama in os.listdir(cache_dir):
+        lengkap = os.path.join(cache_dir, nama)
+        if nama.startswith(prefix) and nama.endswith('.pkl') and lengkap != aktif:
+            try:
+                os.remove(lengkap)
+            except OSError:
+                pass
+
+
+def cached(path, loader, jenis, *extra, cache_dir=CACHE_DIR):
+    """
+    Ambil hasil loader(path) dari cache disk, atau jalankan & simpan jika belum ada
+
+    Args:
+        path: Path file sumber (FileNotFoundError jika tidak ada)
+        loader: Fungsi path -> objek yang bisa di-pickle
+        jenis: Nama jenis hasil (satu file bisa punya beberapa jenis cache)
+        extra: Parameter tambahan yang ikut menentukan kunci
+        cache_dir: Folder cache
+
+    Returns:
+        Hasil loader
+    """
+    prefix = _prefix_cache(path, jenis)
+    target = os.path.join(cache_dir, f"{prefix}{kunci_file(path, *extra)}.pkl")
+
+    try:
+        with open(target, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+
+    hasil = loader(path)
+
+    # Tulis atomik agar proses lain tidak membaca file setengah jadi
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump(hasil, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+        _hapus_entri_lama(prefix, target, cache_dir)
+    except OSError:
+        pass
+
+    return hasil
+
+
+def jumlah_kolom(path):
+    """Jumlah kolom sheet aktif (dari dimensi sheet, tanpa membaca semua sel)"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True)
+    try:
+        return wb.active.max_column or 0
+    finally:
+        wb.close()
+
+
+def baca_kolom_unik(path, column_mapping, cache_dir=CACHE_DIR):
+    """
+    Baca nilai unik (tanpa kosong) untuk kolom-kolom di column_mapping saja
+
+    Args:
+        path: Path file Excel
+        column_mapping: Dictionary {nama: index kolom}
+        cache_dir: Folder cache
+
+    Returns:
+        Dictionary {nama: list nilai unik} atau {nama: None} jika kolom tidak ada
+    """
+    def _baca(path):
+        import pandas as pd
+
+        n_kolom = jumlah_kolom(path)
+        usecols = sorted({i for i in column_mapping.values() if i < n_kolom})
+        df = pd.read_excel(path, usecols=usecols) if usecols else pd.DataFrame()
+        posisi = {col_index: pos for pos, col_index in enumerate(usecols)}
+
+        return {
+            key: (df.iloc[:, posisi[col_index]].dropna().unique().tolist()
+                  if col_index in posisi else None)
+            for key, col_index in column_mapping.items()
+        }
+
+    return cached(path, _baca, 'kolom', tuple(sorted(column_mapping.items())), cache_dir=cache_dir)
+
+
+def baca_excel(path, cache_dir=CACHE_DIR):
+    """
+    Baca seluruh sheet aktif sebagai DataFrame, lewat cache disk
+
+    Returns:
+        pandas.DataFrame
+    """
+    def _baca(path):
+        import pandas as pd
+        return pd.read_excel(path)
+
+    return cached(path, _baca, 'frame', cache_dir=cache_dir)
+
+
+def susun_databases(kolom):
+    """
+    Ubah hasil baca_kolom_unik menjadi pilihan databases ('1 - Nama', ...)
+
+    Returns:
+        Dictionary {nama: list label}; kolom yang tidak ada -> ['Data kosong']
+    """
+    data = {}
+    for key, unique_values in kolom.items():
+        if unique_values is not None:
+            data[key] = [f"{i+1} - {str(val)}" for i, val in enumerate(unique_values)]
+        else:
+            data[key] = ['Data kosong']
+
+    # Tambahkan opsi kosong untuk blok
+    data['blok'] = [''] + data.get('blok', [])
+
+    return data
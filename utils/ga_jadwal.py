@@ -0,0 +1,369 @@
+"""
+Mode jadwal utuh (schedule-level) untuk Algoritma Genetika
+
+Setiap individu adalah satu jadwal lengkap: penempatan slot untuk semua
+mata kuliah input. Populasi disimpan sebagai satu matriks int32 kontigu
+(pop_size x jumlah mata kuliah); setiap sel mengemas (sks, hari, waktu,
+ruangan) menjadi satu kode, jadi 200 jadwal x 5.000 mata kuliah hanya
+~4 MB. Fitness = 1 / (1 + total konflik jadwal). Identitas mata kuliah
+(dosen, matkul, prodi, kelas) dan span SKS memakai kodebook engine NumPy.
+"""
+
+import random
+
+import numpy as np
+
+from utils.genetic_algorithm import (
+    buat_history, buat_event_generasi, rangkum_hasil, habiskan, buat_populasi_greedy, rate_mutasi
+)
+from utils.ga_numpy import (
+    ASAL_INPUT, buat_kodebook, decode_populasi, seleksi_tournament_array, slot_dari_populasi,
+    perbaiki_waktu, _waktu_mulai, _slot_acak, _susun_genes, _irisan_kelompok
+)
+
+
+# ========== ENCODING ==========
+
+def _radix(kodebook):
+    """Basis pengemasan (sks, hari, waktu, ruangan) menjadi satu kode"""
+    nilai = kodebook['nilai']
+    return len(nilai['hari']), len(nilai['waktu']), len(nilai['ruangan'])
+
+
+def kodekan_slot(slot, kodebook):
+    """Array (..., 4) [sks, hari, waktu, ruangan] -> kode int32"""
+    n_hari, n_waktu, n_ruangan = _radix(kodebook)
+    kode = ((slot[..., 0] * n_hari + slot[..., 1]) * n_waktu + slot[..., 2]) * n_ruangan + slot[..., 3]
+    return kode.astype(np.int32)
+
+
+def urai_kode(kode, kodebook):
+    """Kode int32 -> array (..., 4) [sks, hari, waktu, ruangan]"""
+    n_hari, n_waktu, n_ruangan = _radix(kodebook)
+    sisa, ruangan = np.divmod(kode.astype(np.int64), n_ruangan)
+    sisa, waktu = np.divmod(sisa, n_waktu)
+    sks, hari = np.divmod(sisa, n_hari)
+    return np.stack([sks, hari, waktu, ruangan], axis=-1)
+
+
+def jadwal_acak(n_jadwal, kodebook, rng):
+    """Matriks kode (n_jadwal x jumlah mata kuliah) dengan slot acak yang muat untuk span SKS"""
+    n = len(kodebook['kunci'])
+    slot = _slot_acak(n_jadwal * n, kodebook, rng, np.tile(kodebook['sks_input'], n_jadwal))
+    return kodekan_slot(slot, kodebook).reshape(n_jadwal, n)
+
+
+def jadwal_greedy(n_jadwal, populasi_data, databases, kodebook, rng=random):
+    """
+    Matriks kode (n_jadwal x jumlah mata kuliah) hasil buat_populasi_greedy
+    tanpa mata kuliah acak
+    
+    Args:
+        rng: random.Random (default: modul random)
+    """
+    kode = np.empty((n_jadwal, len(kodebook['kunci'])), dtype=np.int32)
+    for i in range(n_jadwal):
+        populasi = buat_populasi_greedy(populasi_data, databases, random_fraction=0.0, rng=rng)
+        kode[i] = kodekan_slot(slot_dari_populasi(populasi, kodebook), kodebook)
+    return kode
+
+
+# ========== EVALUASI ==========
+
+def hitung_konflik_jadwal(kode, kodebook):
+    """
+    Konflik setiap mata kuliah di setiap jadwal, seluruh populasi sekaligus
+    
+    Kelompok (hari, ruangan), (hari, dosen), dan (hari, prodi, kelas) diberi
+    offset nomor jadwal sehingga satu panggilan _irisan_kelompok menghitung
+    semua jadwal tanpa saling bercampur.
+    
+    Args:
+        kode: Matriks kode (pop_size x n)
+        kodebook: Kodebook dari buat_kodebook
+    
+    Returns:
+        Matriks konflik int32 (pop_size x n); total per jadwal = sum(axis=1)
+    """
+    n_jadwal, n = kode.shape
+    nilai = kodebook['nilai']
+    n_hari, _, n_ruangan = _radix(kodebook)
+    n_blok = kodebook['n_blok']
+    signature = kodebook['signature']
+    
+    slot = urai_kode(kode, kodebook)
+    # Hari unik per jadwal: kelompok jadwal berbeda tidak pernah beririsan
+    hari = np.arange(n_jadwal, dtype=np.int64)[:, None] * n_hari + slot[..., 1]
+    awal = kodebook['awal'][slot[..., 0], slot[..., 2]]
+    akhir = kodebook['akhir'][slot[..., 0], slot[..., 2]]
+    
+    awal_flat, akhir_flat = awal.ravel(), akhir.ravel()
+    konflik = _irisan_kelompok((hari * n_ruangan + slot[..., 3]).ravel(), awal_flat, akhir_flat, n_blok)
+    konflik += _irisan_kelompok((hari * len(nilai['dosen']) + signature[:, 0]).ravel(),
+                                awal_flat, akhir_flat, n_blok)
+    
+    kohort = np.flatnonzero(signature[:, 3] >= 0)
+    if len(kohort):
+        konflik = konflik.reshape(n_jadwal, n)
+        kunci = (hari[:, kohort] * len(nilai['prodi']) + signature[kohort, 2]) * len(nilai['kelas']) \
+            + signature[kohort, 3]
+        konflik[:, kohort] += _irisan_kelompok(
+            kunci.ravel(), awal[:, kohort].ravel(), akhir[:, kohort].ravel(), n_blok
+        ).reshape(n_jadwal, len(kohort))
+    
+    return konflik.reshape(n_jadwal, n).astype(np.int32)
+
+
+def _evaluasi(pop, kodebook):
+    pop['konflik'] = hitung_konflik_jadwal(pop['kode'], kodebook)
+    pop['total'] = pop['konflik'].sum(axis=1, dtype=np.int64)
+    pop['fitness'] = np.round(1.0 / (1.0 + pop['total']), 4)
+    return pop
+
+
+def _ambil(pop, idx):
+    return {key: value[idx] for key, value in pop.items()}
+
+
+# ========== OPERATORS ==========
+
+def crossover_jadwal(kode, konflik, parent1, parent2, rng):
+    """
+    Uniform crossover per mata kuliah untuk semua pasangan parent
+    
+    Setiap mata kuliah anak mewarisi slot dari salah satu parent, jadi anak
+    selalu jadwal lengkap (tiap mata kuliah tepat satu kali). Penanda
+    konflik ikut diwarisi untuk mengarahkan mutasi.
+    
+    Returns:
+        Tuple (kode anak, konflik warisan), berselang-seling [anak1_0, anak2_0, ...]
+    """
+    pilih = rng.random((len(parent1), kode.shape[1])) < 0.5
+    anak = np.stack([
+        np.where(pilih, kode[parent1], kode[parent2]),
+        np.where(pilih, kode[parent2], kode[parent1])
+    ], axis=1).reshape(-1, kode.shape[1])
+    warisan = np.stack([
+        np.where(pilih, konflik[parent1], konflik[parent2]),
+        np.where(pilih, konflik[parent2], konflik[parent1])
+    ], axis=1).reshape(-1, kode.shape[1])
+    return anak, warisan
+
+
+def mutasi_jadwal(kode, mutation_rate, konflik, kodebook, rng):
+    """
+    Mutasi satu gen (sks/hari/waktu/ruangan) per mata kuliah terpilih
+    
+    Mata kuliah yang (diwarisi) berkonflik dimutasi dengan probabilitas
+    mutation_rate; sisanya dengan 1 / jumlah mata kuliah (rata-rata satu
+    perubahan acak per jadwal).
+    
+    Args:
+        kode: Matriks kode (diubah in-place)
+        mutation_rate: Probabilitas mutasi mata kuliah berkonflik
+        konflik: Matriks konflik (warisan) dengan bentuk sama
+        kodebook: Kodebook dari buat_kodebook
+        rng: numpy.random.Generator
+    
+    Returns:
+        Matriks kode
+    """
+    peluang = np.where(konflik > 0, mutation_rate, 1.0 / kode.shape[1])
+    mask = rng.random(kode.shape) < peluang
+    m = int(mask.sum())
+    if m == 0:
+        return kode
+    
+    slot = urai_kode(kode[mask], kodebook)
+    gene_idx = rng.integers(1 if kodebook['sks_tetap'] else 0, 4, size=m)
+    batas = kodebook['kardinalitas'][gene_idx]
+    # Waktu mulai hanya dari slot yang masih muat untuk span SKS
+    batas = np.where(gene_idx == 2, kodebook['n_mulai'][slot[:, 0]], batas)
+    nilai = (rng.random(m) * batas).astype(np.int64)
+    urutan = np.minimum(nilai, kodebook['mulai'].shape[1] - 1)
+    slot[np.arange(m), gene_idx] = np.where(gene_idx == 2, _waktu_mulai(slot[:, 0], urutan, kodebook), nilai)
+    # SKS baru yang span-nya tidak muat dari waktu lama: waktu diundi ulang
+    slot[:, 2] = perbaiki_waktu(slot[:, 0], slot[:, 2], kodebook, rng)
+    kode[mask] = kodekan_slot(slot, kodebook)
+    return kode
+
+
+def decode_jadwal(kode, konflik, kodebook, gen=0):
+    """
+    Satu jadwal (baris kode) -> list Kromosom, satu per mata kuliah input
+    
+    Returns:
+        List Kromosom dengan kode input, konflik & fitness per mata kuliah
+    """
+    n = len(kode)
+    return decode_populasi({
+        'genes': _susun_genes(kodebook['signature'], urai_kode(kode, kodebook)),
+        'konflik': konflik.astype(np.int64),
+        'generation': np.full(n, gen, dtype=np.int64),
+        'asal': np.full(n, ASAL_INPUT, dtype=np.int64),
+        'nomor': np.arange(n, dtype=np.int64)
+    }, kodebook)
+
+
+# ========== MAIN ==========
+
+def evolve_jadwal(populasi_data, databases,
+                  generations=10,
+                  mutation_rate=0.15,
+                  elite_size=2,
+                  early_stopping=False,
+                  population_size=30,
+                  seeding='random',
+                  random_fraction=0.2,
+                  seed=None,
+                  rng=None):
+    """
+    Generator evolusi dengan individu berupa jadwal utuh
+    
+    Seleksi tournament pada fitness jadwal, uniform crossover per mata
+    kuliah, mutasi terarah konflik, dan elitism replacement. Tidak perlu
+    hapus duplikat / isi signature: setiap jadwal selalu lengkap.
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi(, sks(, kelas))]}
+        databases: Dictionary pilihan valid
+        generations: Jumlah generasi (default: 10)
+        mutation_rate: Probabilitas mutasi mata kuliah berkonflik (default: 0.15)
+        elite_size: Jumlah jadwal elite (default: 2)
+        early_stopping: Stop jika jadwal terbaik tanpa konflik (default: False)
+        population_size: Jumlah jadwal dalam populasi (default: 30)
+        seeding: Jadwal awal 'random' (default) atau 'greedy' (lihat buat_populasi_greedy)
+        random_fraction: Fraksi jadwal yang tetap acak untuk seeding 'greedy' (default: 0.2)
+        seed: Seed generator acak (default: None = entropi OS)
+        rng: numpy.random.Generator (default: np.random.default_rng(seed))
+    
+    Yields:
+        Snapshot per generasi (total_konflik = total konflik jadwal terbaik,
+        best_konflik = konflik terkecil satu mata kuliah di jadwal itu;
+        best_solution None karena individu berupa jadwal utuh; evaluations =
+        jumlah jadwal yang dievaluasi)
+    
+    Returns:
+        Dictionary hasil GA: populasi_awal/populasi_akhir berisi baris jadwal
+        terbaik awal/akhir, ditambah key 'jadwal' (ringkasan tingkat jadwal)
+    """
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    kodebook = buat_kodebook(populasi_data, databases)
+    population_size = max(2, population_size)
+    
+    # ========== INITIALIZATION ==========
+    if seeding == 'random':
+        kode_awal = jadwal_acak(population_size, kodebook, rng)
+    elif seeding == 'greedy':
+        n_acak = min(population_size, max(0, round(population_size * random_fraction)))
+        kode_awal = np.concatenate([
+            jadwal_greedy(population_size - n_acak, populasi_data, databases, kodebook,
+                          random.Random(int(rng.integers(2 ** 63)))),
+            jadwal_acak(n_acak, kodebook, rng)
+        ])
+    else:
+        raise ValueError(f"Seeding tidak dikenal: {seeding}")
+    populasi = _evaluasi({'kode': kode_awal,
+                          'generation': np.zeros(population_size, dtype=np.int64)}, kodebook)
+    jadwal_awal = _ambil(populasi, int(np.argmin(populasi['total'])))
+    evaluations = population_size
+    
+    history = buat_history()
+    gen = 0
+    
+    # ========== EVOLUTION ==========
+    for gen in range(1, generations + 1):
+        n_pasangan = (population_size + 1) // 2
+        
+        # ===== SELECTION & CROSSOVER =====
+        # Skor = -total konflik: fitness 4 desimal menjadi 0.0 untuk jadwal besar yang masih kacau
+        parents = seleksi_tournament_array(-populasi['total'], 2 * n_pasangan, rng)
+        kode, warisan = crossover_jadwal(populasi['kode'], populasi['konflik'],
+                                         parents[:n_pasangan], parents[n_pasangan:], rng)
+        
+        # ===== MUTATION =====
+        current_rate = rate_mutasi(mutation_rate, gen)
+        kode = mutasi_jadwal(kode[:population_size], current_rate, warisan[:population_size], kodebook, rng)
+        del warisan
+        
+        offspring = _evaluasi({'kode': kode, 'generation': np.full(len(kode), gen, dtype=np.int64)}, kodebook)
+        evaluations += len(kode)
+        
+        # ===== ELITISM REPLACEMENT =====
+        elite_idx = np.argsort(populasi['total'], kind='stable')[:elite_size]
+        combined = {key: np.concatenate([populasi[key][elite_idx], offspring[key]]) for key in populasi}
+        urutan = np.argsort(combined['total'], kind='stable')[:population_size]
+        populasi = _ambil(combined, urutan)
+        
+        # ===== TRACKING =====
+        # Sama dengan engine per kromosom: total = konflik jadwal terbaik,
+        # best_konflik = konflik terkecil satu mata kuliah di jadwal itu
+        idx_terbaik = int(np.argmin(populasi['total']))
+        total_konflik = int(populasi['total'][idx_terbaik])
+        best_konflik = int(populasi['konflik'][idx_terbaik].min())
+        
+        history['best_fitness'].append(round(float(populasi['fitness'].max()), 4))
+        history['avg_fitness'].append(round(float(populasi['fitness'].mean()), 4))
+        history['worst_fitness'].append(round(float(populasi['fitness'].min()), 4))
+        history['best_konflik'].append(best_konflik)
+        history['total_konflik'].append(total_konflik)
+        history['generations'].append(gen)
+        
+        if (yield buat_event_generasi(history, generations, total_konflik=total_konflik, evaluations=evaluations)):
+            break
+        
+        if early_stopping:
+            MIN_GENERATIONS = 5
+            if gen >= MIN_GENERATIONS and total_konflik == 0:
+                break
+    
+    # ========== FINALIZATION (DECODE JADWAL TERBAIK) ==========
+    terbaik = _ambil(populasi, int(np.argmin(populasi['total'])))
+    populasi_awal = decode_jadwal(jadwal_awal['kode'], jadwal_awal['konflik'], kodebook)
+    populasi_akhir = decode_jadwal(terbaik['kode'], terbaik['konflik'], kodebook, int(terbaik['generation']))
+    
+    hasil = rangkum_hasil(populasi_awal, populasi_akhir, history, gen, {
+        'generations': generations,
+        'mutation_rate': mutation_rate,
+        'elite_size': elite_size,
+        'population_size': population_size,
+        'early_stopping': early_stopping,
+        'engine': 'jadwal',
+        'seeding': seeding,
+        'random_fraction': random_fraction,
+        'seed': seed
+    })
+    
+    # Improvement dihitung di tingkat jadwal, bukan per baris
+    fitness_awal, fitness_akhir = float(jadwal_awal['fitness']), float(terbaik['fitness'])
+    hasil['improvement'] = {
+        'fitness_improvement': round(fitness_akhir - fitness_awal, 4),
+        'konflik_reduction': int(jadwal_awal['total']) - int(terbaik['total']),
+        'improvement_percentage': round((fitness_akhir - fitness_awal) / fitness_awal * 100, 2)
+        if fitness_awal > 0 else 0
+    }
+    hasil['jadwal'] = {
+        'konflik_awal': int(jadwal_awal['total']),
+        'konflik_akhir': int(terbaik['total']),
+        'fitness_awal': fitness_awal,
+        'fitness_akhir': fitness_akhir,
+        'n_mata_kuliah': len(populasi_akhir),
+        'population_size': population_size
+    }
+    return hasil
+
+
+def run_genetic_algorithm_jadwal(populasi_data, databases, on_generation=None, **params):
+    """
+    Jalankan evolve_jadwal sampai selesai
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
+        databases: Dictionary pilihan valid
+        on_generation: Callback(snapshot) per generasi; True = hentikan evolusi
+        **params: Parameter evolve_jadwal
+    
+    Returns:
+        Dictionary hasil GA (lihat evolve_jadwal)
+    """
+    return habiskan(evolve_jadwal(populasi_data, databases, **params), on_generation=on_generation)
@@ -0,0 +1,558 @@
+"""
+Engine NumPy untuk Algoritma Genetika
+
+Populasi disimpan sebagai satu array int (pop_size x 8) berisi kode gen:
+[dosen, matkul, prodi, sks, hari, waktu, ruangan, kelas] (kelas -1 = tidak
+diketahui). Seleksi, crossover, mutasi, dan hitung konflik berjalan
+sebagai operasi vektor. Format dict kromosom hanya dibentuk di boundary
+(hasil akhir). Span per (SKS, waktu mulai) dan waktu mulai yang muat
+diambil dari PetaSlot, sama dengan engine python.
+"""
+
+import random
+
+import numpy as np
+
+from utils.genetic_algorithm import (
+    Kromosom, PetaSlot, fitness, buat_history, buat_event_generasi, rangkum_hasil, habiskan, rate_mutasi,
+    buat_populasi_awal
+)
+
+
+# Jenis asal kromosom (untuk membentuk kode saat decode)
+ASAL_INPUT = 0
+ASAL_CROSSOVER = 1
+ASAL_FILL = 2
+ASAL_FINAL = 3
+
+GEN_MUTABLE = ('sks', 'hari', 'waktu', 'ruangan')
+
+# Kolom genes yang membentuk signature (dosen, matkul, prodi, kelas)
+KOLOM_SIGNATURE = [0, 1, 2, 7]
+
+
+# ========== ENCODING ==========
+
+def buat_kodebook(populasi_data, databases):
+    """
+    Intern semua nilai gen menjadi kode integer
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}; elemen
+                       opsional ke-4 = SKS tetap (None = acak), ke-5 = kelas
+        databases: Dictionary pilihan valid
+    
+    Returns:
+        Dictionary kodebook: daftar nilai per gen, kunci input, array
+        signature (dosen, matkul, prodi, kelas; kelas -1 = tidak diketahui)
+        dan SKS tetap (-1 = acak) untuk setiap input, serta tabel span per
+        (kode SKS, kode waktu) dari PetaSlot: blok awal/akhir, muat, dan
+        kode waktu mulai yang muat per kode SKS
+    """
+    nilai = {'dosen': [], 'matkul': [], 'prodi': [], 'kelas': []}
+    lookup = {'dosen': {}, 'matkul': {}, 'prodi': {}, 'kelas': {}}
+    signature = []
+    
+    for gen in GEN_MUTABLE:
+        nilai[gen] = list(databases[gen])
+    kardinalitas = np.array([len(nilai[gen]) for gen in GEN_MUTABLE], dtype=np.int64)
+    
+    # SKS input yang tidak ada di databases ditambahkan di belakang (tidak ikut diundi)
+    lookup_sks = {}
+    for i, value in enumerate(nilai['sks']):
+        lookup_sks.setdefault(value, i)
+    sks_input = []
+    
+    for data in populasi_data.values():
+        kode_sig = []
+        for gen, value in zip(('dosen', 'matkul', 'prodi'), data[:3]):
+            if value not in lookup[gen]:
+                lookup[gen][value] = len(nilai[gen])
+                nilai[gen].append(value)
+            kode_sig.append(lookup[gen][value])
+        
+        kelas = data[4] if len(data) > 4 else None
+        if kelas is not None and kelas not in lookup['kelas']:
+            lookup['kelas'][kelas] = len(nilai['kelas'])
+            nilai['kelas'].append(kelas)
+        kode_sig.append(-1 if kelas is None else lookup['kelas'][kelas])
+        signature.append(kode_sig)
+        
+        if len(data) > 3 and data[3] is not None:
+            if data[3] not in lookup_sks:
+                lookup_sks[data[3]] = len(nilai['sks'])
+                nilai['sks'].append(data[3])
+            sks_input.append(lookup_sks[data[3]])
+        else:
+            sks_input.append(-1)
+    
+    sks_input = np.array(sks_input, dtype=np.int64)
+    
+    # Span setiap (SKS, waktu mulai) dari PetaSlot: jam sebenarnya, tidak dipotong
+    peta = PetaSlot(databases)
+    span = [[peta.rentang(waktu, sks) + (peta.muat(waktu, sks),) for waktu in nilai['waktu']]
+            for sks in nilai['sks']]
+    span = np.array(span, dtype=np.int64).reshape(len(nilai['sks']), len(nilai['waktu']), 3)
+    muat = span[..., 2].astype(bool)
+    n_mulai = muat.sum(axis=1)
+    # mulai[s, j] = kode waktu mulai ke-j yang muat untuk SKS s (kode stabil: urutan databases)
+    mulai = np.argsort(~muat, axis=1, kind='stable')
+    
+    dipakai = set(sks_input[sks_input >= 0].tolist())
+    if (sks_input < 0).any():
+        dipakai.update(range(kardinalitas[0]))
+    for sks in sorted(dipakai):
+        if not n_mulai[sks]:
+            raise ValueError(f"SKS {nilai['sks'][sks]} tidak muat di waktu mana pun pada databases['waktu']")
+    
+    return {
+        'nilai': nilai,
+        'kunci': list(populasi_data.keys()),
+        'signature': np.array(signature, dtype=np.int64).reshape(-1, 4),
+        'sks_input': sks_input,
+        'sks_tetap': bool((sks_input >= 0).any()),
+        'awal': span[..., 0],
+        'akhir': span[..., 1],
+        'muat': muat,
+        'mulai': mulai,
+        'n_mulai': n_mulai,
+        'n_blok': int(span[..., 1].max(initial=1)),
+        'kardinalitas': kardinalitas
+    }
+
+
+def _kunci_signature(sig, kodebook):
+    """Gabungkan kolom signature (dosen, matkul, prodi, kelas) menjadi satu integer"""
+    n_matkul = len(kodebook['nilai']['matkul'])
+    n_prodi = len(kodebook['nilai']['prodi'])
+    n_kelas = len(kodebook['nilai']['kelas']) + 1
+    return ((sig[:, 0] * n_matkul + sig[:, 1]) * n_prodi + sig[:, 2]) * n_kelas + sig[:, 3] + 1
+
+
+def _susun_genes(signature, slot):
+    """Bentuk genes (n x 8) dari signature (n x 4) dan slot (n x 4)"""
+    return np.concatenate([signature[:, :3], slot, signature[:, 3:]], axis=1)
+
+
+def _waktu_mulai(sks, urutan, kodebook):
+    """
+    Kode waktu mulai ke-urutan di antara waktu yang muat per kode SKS
+    (0 <= urutan < n_mulai)
+    """
+    return kodebook['mulai'][sks, urutan]
+
+
+def _slot_acak(n, kodebook, rng, sks=None):
+    """Gen sks, hari, waktu, ruangan acak untuk n kromosom (sks >= 0 = SKS tetap)"""
+    slot = (rng.random((n, 4)) * kodebook['kardinalitas']).astype(np.int64)
+    if sks is not None:
+        slot[:, 0] = np.where(sks >= 0, sks, slot[:, 0])
+    urutan = (slot[:, 2] * kodebook['n_mulai'][slot[:, 0]]) // kodebook['kardinalitas'][2]
+    slot[:, 2] = _waktu_mulai(slot[:, 0], urutan, kodebook)
+    return slot
+
+
+def perbaiki_waktu(sks, waktu, kodebook, rng):
+    """
+    Undi ulang kode waktu mulai yang span SKS-nya tidak muat (setelah
+    crossover atau mutasi SKS), bukan memotong span di akhir hari
+    
+    Returns:
+        Array kode waktu (salinan jika ada yang diganti)
+    """
+    rusak = np.flatnonzero(~kodebook['muat'][sks, waktu])
+    if len(rusak):
+        urutan = (rng.random(len(rusak)) * kodebook['n_mulai'][sks[rusak]]).astype(np.int64)
+        waktu = waktu.copy()
+        waktu[rusak] = _waktu_mulai(sks[rusak], urutan, kodebook)
+    return waktu
+
+
+def slot_dari_populasi(populasi, kodebook):
+    """
+    Kode gen (sks, hari, waktu, ruangan) n x 4 dari list kromosom
+    
+    Dipakai untuk seeding: kromosom hasil buat_populasi_awal (urutan sama
+    dengan input kodebook) dikodekan ke array. Nilai ganda di databases
+    memakai posisi pertama.
+    """
+    lookup = [{} for _ in GEN_MUTABLE]
+    for kolom, gen in zip(lookup, GEN_MUTABLE):
+        for i, value in enumerate(kodebook['nilai'][gen]):
+            kolom.setdefault(value, i)
+    return np.array(
+        [[kolom[value] for kolom, value in zip(lookup, krom['data'][3:7])] for krom in populasi],
+        dtype=np.int64
+    ).reshape(-1, 4)
+
+
+def _kode(asal, gen, nomor, kodebook):
+    if asal == ASAL_INPUT:
+        return kodebook['kunci'][nomor]
+    if asal == ASAL_FINAL:
+        return f"FINAL_{kodebook['kunci'][nomor]}"
+    tag = 'C' if asal == ASAL_CROSSOVER else 'FILL'
+    return f"G{gen}_{tag}{nomor}"
+
+
+def decode_populasi(pop, kodebook):
+    """
+    Kembalikan populasi array ke format list of dict kromosom
+    
+    Args:
+        pop: Dictionary populasi array (genes, konflik, fitness, generation, asal, nomor)
+        kodebook: Kodebook dari buat_kodebook
+    
+    Returns:
+        List Kromosom (akses gaya dict)
+    """
+    nilai = kodebook['nilai']
+    # Kode kelas -1 (tidak diketahui) jatuh ke elemen terakhir: None
+    kolom = [nilai[gen] for gen in ('dosen', 'matkul', 'prodi') + GEN_MUTABLE] + [nilai['kelas'] + [None]]
+    populasi = []
+    
+    for row, konflik, gen, asal, nomor in zip(
+        pop['genes'].tolist(), pop['konflik'].tolist(),
+        pop['generation'].tolist(), pop['asal'].tolist(), pop['nomor'].tolist()
+    ):
+        populasi.append(Kromosom(
+            _kode(asal, gen, nomor, kodebook),
+            [values[code] for values, code in zip(kolom, row)],
+            gen, konflik, fitness(konflik)
+        ))
+    
+    return populasi
+
+
+# ========== VECTORIZED OPERATORS ==========
+
+def _irisan_kelompok(kunci, awal, akhir, n_waktu):
+    """
+    Jumlah anggota lain sekelompok yang span-nya beririsan
+    
+    anggota - (selesai <= awal) - (mulai >= akhir); kedua suku dibaca dari
+    tabel kumulatif (kelompok x slot) hasil bincount, jadi O(n) setelah
+    pengelompokan dan tanpa binary search.
+    """
+    stride = n_waktu + 1
+    if len(kunci) and kunci.max() < 4 * len(kunci):
+        # Rentang kunci kecil: kunci langsung dipakai sebagai nomor kelompok (tanpa sort)
+        inverse = kunci
+        counts = np.bincount(kunci)
+    else:
+        _, inverse, counts = np.unique(kunci, return_inverse=True, return_counts=True)
+        inverse = inverse.reshape(-1)
+    ukuran = len(counts) * stride
+    dasar = inverse * stride
+    
+    # kumulatif[g, t] = jumlah anggota kelompok g dengan nilai <= t
+    selesai = np.bincount(dasar + akhir, minlength=ukuran).reshape(-1, stride).cumsum(axis=1).ravel()
+    mulai = np.bincount(dasar + awal, minlength=ukuran).reshape(-1, stride).cumsum(axis=1).ravel()
+    
+    selesai_sebelum = selesai[dasar + awal]
+    mulai_sesudah = counts[inverse] - mulai[dasar + akhir - 1]
+    
+    return counts[inverse] - selesai_sebelum - mulai_sesudah - 1
+
+
+def hitung_konflik_array(genes, kodebook):
+    """
+    Hitung konflik ruangan, dosen & kohort untuk seluruh populasi sekaligus
+    
+    Per kelompok (hari, ruangan), (hari, dosen), dan (hari, prodi, kelas)
+    untuk baris yang kelasnya diketahui, jumlah span yang beririsan
+    dihitung dengan _irisan_kelompok, jadi O(n log n) tanpa perbandingan
+    berpasangan.
+    
+    Args:
+        genes: Array int (n x 8)
+        kodebook: Kodebook dari buat_kodebook
+    
+    Returns:
+        Array konflik (n,)
+    """
+    n_waktu = kodebook['n_blok']
+    n_ruangan = len(kodebook['nilai']['ruangan'])
+    n_dosen = len(kodebook['nilai']['dosen'])
+    n_prodi = len(kodebook['nilai']['prodi'])
+    n_kelas = len(kodebook['nilai']['kelas'])
+    
+    awal = kodebook['awal'][genes[:, 3], genes[:, 5]]
+    akhir = kodebook['akhir'][genes[:, 3], genes[:, 5]]
+    
+    konflik = _irisan_kelompok(genes[:, 4] * n_ruangan + genes[:, 6], awal, akhir, n_waktu)
+    konflik += _irisan_kelompok(genes[:, 4] * n_dosen + genes[:, 0], awal, akhir, n_waktu)
+    
+    kohort = genes[:, 7] >= 0
+    if kohort.any():
+        g = genes[kohort]
+        konflik[kohort] += _irisan_kelompok(
+            (g[:, 4] * n_prodi + g[:, 2]) * n_kelas + g[:, 7], awal[kohort], akhir[kohort], n_waktu
+        )
+    
+    return konflik
+
+
+def _evaluasi(pop, kodebook):
+    pop['konflik'] = hitung_konflik_array(pop['genes'], kodebook)
+    pop['fitness'] = np.round(1.0 / (1.0 + pop['konflik']), 4)
+    return pop
+
+
+def _ambil(pop, idx):
+    return {key: value[idx] for key, value in pop.items()}
+
+
+def _gabung(*pops):
+    return {key: np.concatenate([p[key] for p in pops]) for key in pops[0]}
+
+
+def seleksi_tournament_array(fitness_arr, n_pilih, rng, tournament_size=3):
+    """
+    Tournament selection untuk n_pilih parent sekaligus
+    
+    Peserta diambil dengan pengembalian agar seluruh tournament bisa
+    diundi dalam satu panggilan; untuk populasi besar hasilnya praktis
+    sama dengan random.sample.
+    """
+    tournament_size = min(tournament_size, len(fitness_arr))
+    peserta = rng.integers(0, len(fitness_arr), size=(n_pilih, tournament_size))
+    pemenang = np.argmax(fitness_arr[peserta], axis=1)
+    return peserta[np.arange(n_pilih), pemenang]
+
+
+def crossover_array(genes, parent1, parent2):
+    """
+    Single-point crossover setelah sks untuk semua pasangan parent
+    (kelas ikut identitas parent pertama); waktu yang tidak muat untuk
+    SKS anak diundi ulang di mutasi_array
+    
+    Returns:
+        Array offspring berselang-seling [anak1_0, anak2_0, anak1_1, ...]
+    """
+    anak1 = np.concatenate([genes[parent1, :4], genes[parent2, 4:7], genes[parent1, 7:]], axis=1)
+    anak2 = np.concatenate([genes[parent2, :4], genes[parent1, 4:7], genes[parent2, 7:]], axis=1)
+    return np.stack([anak1, anak2], axis=1).reshape(-1, genes.shape[1])
+
+
+def mutasi_array(genes, mutation_rate, kodebook, rng):
+    """
+    Mutasi satu gen (sks/hari/waktu/ruangan) per baris
+    dengan probabilitas mutation_rate
+    """
+    n = len(genes)
+    mask = rng.random(n) < mutation_rate
+    gene_idx = rng.integers(1 if kodebook['sks_tetap'] else 0, 4, size=n)
+    batas = kodebook['kardinalitas'][gene_idx]
+    # Waktu mulai hanya dari slot yang masih muat untuk span SKS baris itu
+    batas = np.where(gene_idx == 2, kodebook['n_mulai'][genes[:, 3]], batas)
+    nilai = (rng.random(n) * batas).astype(np.int64)
+    urutan = np.minimum(nilai, kodebook['mulai'].shape[1] - 1)
+    nilai = np.where(gene_idx == 2, _waktu_mulai(genes[:, 3], urutan, kodebook), nilai)
+    genes[mask, gene_idx[mask] + 3] = nilai[mask]
+    # SKS baru (atau SKS parent lain hasil crossover) yang span-nya tidak muat: waktu diundi ulang
+    genes[:, 5] = perbaiki_waktu(genes[:, 3], genes[:, 5], kodebook, rng)
+    return genes
+
+
+def _isi_signature_hilang(pop, kodebook, gen, asal, rng, batas=None):
+    """Tambahkan kromosom untuk signature input yang tidak ada di populasi (urutan input)"""
+    sig_input = _kunci_signature(kodebook['signature'], kodebook)
+    sig_ada = _kunci_signature(pop['genes'][:, KOLOM_SIGNATURE], kodebook)
+    hilang = np.flatnonzero(~np.isin(sig_input, sig_ada))
+    
+    # Satu filler per signature unik
+    _, pertama = np.unique(sig_input[hilang], return_index=True)
+    hilang = hilang[np.sort(pertama)]
+    if batas is not None:
+        hilang = hilang[:batas]
+    
+    if len(hilang) == 0:
+        return pop
+    
+    filler = {
+        'genes': _susun_genes(
+            kodebook['signature'][hilang],
+            _slot_acak(len(hilang), kodebook, rng, kodebook['sks_input'][hilang])
+        ),
+        'konflik': np.zeros(len(hilang), dtype=np.int64),
+        'fitness': np.zeros(len(hilang)),
+        'generation': np.full(len(hilang), gen, dtype=np.int64),
+        'asal': np.full(len(hilang), asal, dtype=np.int64),
+        'nomor': hilang if asal == ASAL_FINAL else np.arange(len(hilang), dtype=np.int64)
+    }
+    return _gabung(pop, filler)
+
+
+# ========== MAIN NUMPY GA ==========
+
+def evolve_numpy(populasi_data, databases,
+                 generations=10,
+                 mutation_rate=0.15,
+                 elite_size=2,
+                 early_stopping=False,
+                 seeding='random',
+                 random_fraction=0.2,
+                 seed=None,
+                 rng=None):
+    """
+    Generator evolusi dengan populasi array NumPy
+    
+    Semantik sama dengan evolve engine python (crossover setelah sks,
+    mutasi adaptif, hapus duplikat, isi signature hilang, elitism),
+    namun seluruh populasi diproses sebagai operasi vektor. Hanya
+    best_solution di snapshot yang didekode per generasi.
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
+        databases: Dictionary pilihan valid
+        generations: Jumlah generasi (default: 10)
+        mutation_rate: Probabilitas mutasi (default: 0.15)
+        elite_size: Jumlah elite (default: 2)
+        early_stopping: Stop jika optimal (default: False)
+        seeding: Populasi awal 'random' (default) atau 'greedy' (lihat buat_populasi_greedy)
+        random_fraction: Fraksi kromosom acak untuk seeding 'greedy' (default: 0.2)
+        seed: Seed generator acak (default: None = entropi OS)
+        rng: numpy.random.Generator (default: np.random.default_rng(seed))
+    
+    Yields:
+        Snapshot per generasi (kirim True untuk berhenti; evaluations = jumlah
+        kromosom yang dievaluasi)
+    
+    Returns:
+        Dictionary hasil GA dengan format sama seperti run_genetic_algorithm;
+        jika dihentikan lewat send(True), populasi dengan total konflik
+        terkecil sejauh ini
+    """
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    kodebook = buat_kodebook(populasi_data, databases)
+    n_input = len(kodebook['kunci'])
+    
+    # ========== INITIALIZATION ==========
+    if seeding == 'random':
+        slot = _slot_acak(n_input, kodebook, rng, kodebook['sks_input'])
+    else:
+        # Seeding greedy berjalan di Python: random.Random diturunkan dari rng run ini
+        acak = random.Random(int(rng.integers(2 ** 63)))
+        slot = slot_dari_populasi(buat_populasi_awal(populasi_data, databases, seeding, random_fraction, acak),
+                                  kodebook)
+    populasi = _evaluasi({
+        'genes': _susun_genes(kodebook['signature'], slot),
+        'generation': np.zeros(n_input, dtype=np.int64),
+        'asal': np.full(n_input, ASAL_INPUT, dtype=np.int64),
+        'nomor': np.arange(n_input, dtype=np.int64)
+    }, kodebook)
+    populasi_awal = _ambil(populasi, slice(None))
+    evaluations = n_input
+    
+    # Array populasi tidak diubah in-place, cukup simpan referensinya; hanya generasi
+    # yang tercatat di history, agar ringkasan cocok dengan populasi akhir
+    terbaik = None
+    kunci_terbaik = (float('inf'), float('inf'))
+    gen_terbaik = 0
+    
+    history = buat_history()
+    
+    gen = gen_populasi = 0
+    
+    # ========== EVOLUTION ==========
+    for gen in range(1, generations + 1):
+        target_size = len(populasi['genes'])
+        n_pasangan = (target_size + 1) // 2
+        
+        # ===== SELECTION & CROSSOVER =====
+        parents = seleksi_tournament_array(populasi['fitness'], 2 * n_pasangan, rng)
+        genes = crossover_array(populasi['genes'], parents[:n_pasangan], parents[n_pasangan:])[:target_size]
+        
+        # ===== MUTATION =====
+        current_rate = rate_mutasi(mutation_rate, gen)
+        genes = mutasi_array(genes, current_rate, kodebook, rng)
+        
+        # ===== REMOVE DUPLICATES =====
+        _, pertama = np.unique(_kunci_signature(genes[:, KOLOM_SIGNATURE], kodebook), return_index=True)
+        pertama = np.sort(pertama)
+        offspring = {
+            'genes': genes[pertama],
+            'generation': np.full(len(pertama), gen, dtype=np.int64),
+            'asal': np.full(len(pertama), ASAL_CROSSOVER, dtype=np.int64),
+            'nomor': pertama.astype(np.int64)
+        }
+        offspring['konflik'] = np.zeros(len(pertama), dtype=np.int64)
+        offspring['fitness'] = np.zeros(len(pertama))
+        
+        # ===== FILL MISSING =====
+        offspring = _isi_signature_hilang(
+            offspring, kodebook, gen, ASAL_FILL, rng,
+            batas=target_size - len(offspring['genes'])
+        )
+        offspring = _evaluasi(offspring, kodebook)
+        evaluations += len(offspring['genes'])
+        
+        # ===== ELITISM REPLACEMENT =====
+        elite_idx = np.argsort(-populasi['fitness'], kind='stable')[:elite_size]
+        combined = _gabung(_ambil(populasi, elite_idx), offspring)
+        urutan = np.argsort(-combined['fitness'], kind='stable')[:target_size]
+        populasi = _ambil(combined, urutan)
+        
+        # ===== TRACKING =====
+        best_fitness = float(populasi['fitness'].max())
+        avg_fitness = float(populasi['fitness'].mean())
+        worst_fitness = float(populasi['fitness'].min())
+        best_konflik = int(populasi['konflik'].min())
+        total_konflik = int(populasi['konflik'].sum())
+        if (total_konflik, best_konflik) < kunci_terbaik:
+            terbaik, kunci_terbaik, gen_terbaik = populasi, (total_konflik, best_konflik), gen
+        
+        history['best_fitness'].append(round(best_fitness, 4))
+        history['avg_fitness'].append(round(avg_fitness, 4))
+        history['worst_fitness'].append(round(worst_fitness, 4))
+        history['best_konflik'].append(best_konflik)
+        history['total_konflik'].append(total_konflik)
+        history['generations'].append(gen)
+        
+        best_solution = decode_populasi(_ambil(populasi, [int(np.argmax(populasi['fitness']))]), kodebook)[0]
+        if (yield buat_event_generasi(history, generations, best_solution, total_konflik, evaluations)):
+            populasi, gen_populasi = terbaik, gen_terbaik
+            break
+        gen_populasi = gen
+        
+        if early_stopping:
+            MIN_GENERATIONS = 5
+            if gen >= MIN_GENERATIONS and best_fitness >= 0.99 and best_konflik == 0:
+                break
+    
+    # ========== VALIDATION: ENSURE COMPLETE POPULATION ==========
+    if len(populasi['genes']) < n_input:
+        populasi = _evaluasi(_isi_signature_hilang(populasi, kodebook, gen, ASAL_FINAL, rng), kodebook)
+    
+    # ========== FINALIZATION (DECODE DI BOUNDARY) ==========
+    populasi_awal = decode_populasi(populasi_awal, kodebook)
+    populasi_akhir = decode_populasi(populasi, kodebook)
+    
+    return rangkum_hasil(populasi_awal, populasi_akhir, history, gen, {
+        'generations': generations,
+        'mutation_rate': mutation_rate,
+        'elite_size': elite_size,
+        'population_size': len(populasi_akhir),
+        'early_stopping': early_stopping,
+        'engine': 'numpy',
+        'seeding': seeding,
+        'random_fraction': random_fraction,
+        'seed': seed
+    }, generasi_terbaik=gen_populasi)
+
+
+def run_genetic_algorithm_numpy(populasi_data, databases, on_generation=None, **params):
+    """
+    Jalankan evolve_numpy sampai selesai
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
+        databases: Dictionary pilihan valid
+        on_generation: Callback(snapshot) per generasi; True = hentikan evolusi
+        **params: Parameter evolve_numpy
+    
+    Returns:
+        Dictionary hasil GA dengan format sama seperti run_genetic_algorithm
+    """
+    return habiskan(evolve_numpy(populasi_data, databases, **params), on_generation=on_generation)
@@ -2,21 +2,77 @@
 Genetic Algorithm untuk Penjadwalan
 """
 
+import os
+import re
+import bisect
+import heapq
 import random
-import copy
 import csv
+import functools
+import logging
+import time
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
 
 # ========== CORE GA FUNCTIONS ==========
 
-def buat_populasi_list(populasi_dict, databases):
+class Kromosom:
+    """
+    Kromosom ringkas berbasis __slots__ (tanpa __dict__ per objek)
+    
+    Tetap bisa diakses seperti dict lama: krom['data'], krom['fitness'],
+    krom['konflik'] = 0, krom.get('generation', 0). Key dipetakan ke atribut;
+    seperti dict, key yang tidak ada memunculkan KeyError.
+    konflik = jumlah pelanggaran hard constraint, penalti = total soft
+    constraint berbobot (lihat utils.kendala).
+    """
+    
+    __slots__ = ('kode', 'data', 'generation', 'konflik', 'fitness', 'penalti')
+    
+    __setitem__ = object.__setattr__
+    
+    def __init__(self, kode, data, generation=0, konflik=0, fitness=0.0, penalti=0.0):
+        self.kode = kode
+        self.data = data
+        self.generation = generation
+        self.konflik = konflik
+        self.fitness = fitness
+        self.penalti = penalti
+    
+    def __getitem__(self, key):
+        try:
+            return object.__getattribute__(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key):
+        return key in self.__slots__
+    
+    def __repr__(self):
+        return f"Kromosom({self.kode!r}, {self.data!r}, fitness={self.fitness}, konflik={self.konflik})"
+    
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+    
+    def keys(self):
+        return self.__slots__
+    
+    def salin(self):
+        """Salinan dangkal dengan list gen baru (pengganti deepcopy)"""
+        return Kromosom(self.kode, list(self.data), self.generation, self.konflik, self.fitness, self.penalti)
+
+
+def buat_populasi_list(populasi_dict, databases, rng=random):
     """
     Konversi dictionary populasi ke list dengan random generation
     
     Args:
-        populasi_dict: Dictionary {kode: [dosen, matkul, prodi]}
+        populasi_dict: Dictionary {kode: [dosen, matkul, prodi]}; elemen opsional
+                       ke-4 = SKS tetap (None = acak), ke-5 = kelas
         databases: Dictionary berisi pilihan valid
+        rng: random.Random per run (default: modul random)
     
     Returns:
         List kromosom lengkap
@@ -24,122 +80,731 @@ def buat_populasi_list(populasi_dict, databases):
     populasi_list = []
     
     for kode, data in populasi_dict.items():
-        kromosom = {
-            "kode": kode,
-            "data": [
-                data[0],  # dosen
-                data[1],  # matkul
-                data[2],  # prodi
-                random.choice(databases['sks']),
-                random.choice(databases['hari']),
-                random.choice(databases['waktu']),
-                random.choice(databases['ruangan'])
-            ],
-            "generation": 0
-        }
-        populasi_list.append(kromosom)
+        populasi_list.append(Kromosom(kode, buat_gen_acak(data, databases, rng)))
     
     return populasi_list
 
 
-def hitung_konflik(krom, populasi):
+# ========== SLOT & SKS ==========
+
+# 1 SKS = 50 menit; label waktu yang bukan rentang jam dianggap slot 2 jam (2 SKS)
+MENIT_PER_SKS = 50
+SKS_PER_SLOT = 2
+MENIT_PER_SLOT = SKS_PER_SLOT * MENIT_PER_SKS
+
+# Label waktu berupa rentang jam: '07:00-09:00', '08.00-09.40', atau label databases
+# bernomor '2 - 08.00–10.30' (jam dengan titik / titik dua, pemisah strip atau en dash)
+POLA_WAKTU = re.compile(r'(\d{1,2})[.:](\d{2})\s*[-–—]\s*(\d{1,2})[.:](\d{2})\s*$')
+
+
+def _nilai_sks(sks):
+    """Nilai numerik SKS ('3', 3, atau label databases '2 - 1.5'), None jika tidak terbaca"""
+    try:
+        return float(str(sks).rpartition(' - ')[2])
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def durasi_slot(sks):
+    """
+    Jumlah slot waktu berurutan yang ditempati mata kuliah (label waktu bukan rentang jam)
+    
+    Args:
+        sks: Nilai SKS ('3', 3, atau label databases '2 - 1.5')
+    
+    Returns:
+        Jumlah slot (minimal 1)
+    """
+    nilai = _nilai_sks(sks)
+    return 1 if nilai is None else max(1, -int(-nilai // SKS_PER_SLOT))
+
+
+@functools.lru_cache(maxsize=None)
+def durasi_menit(sks):
+    """Lama kuliah dalam menit (SKS x MENIT_PER_SKS), 0 jika SKS tidak terbaca"""
+    nilai = _nilai_sks(sks)
+    return 0 if nilai is None else round(nilai * MENIT_PER_SKS)
+
+
+@functools.lru_cache(maxsize=None)
+def rentang_waktu(label):
+    """
+    Jam mulai & selesai label waktu (lihat POLA_WAKTU)
+    
+    Args:
+        label: Label waktu, mis. '07:00-09:00' atau '1 - 08.00-09.40'
+    
+    Returns:
+        Tuple (mulai, selesai) dalam menit sejak 00:00, None jika label bukan rentang jam
+    """
+    cocok = POLA_WAKTU.search(str(label))
+    if cocok is None:
+        return None
+    jam_mulai, menit_mulai, jam_selesai, menit_selesai = map(int, cocok.groups())
+    mulai, selesai = jam_mulai * 60 + menit_mulai, jam_selesai * 60 + menit_selesai
+    return (mulai, selesai) if mulai < selesai else None
+
+
+def pilih_waktu(databases, sks, rng=random):
+    """Waktu mulai acak yang span SKS-nya masih muat di hari yang sama (PetaSlot.waktu_muat)"""
+    return rng.choice(PetaSlot(databases).waktu_muat(sks))
+
+
+def _sks_input(data):
+    """SKS tetap dari input (elemen ke-4), None jika acak"""
+    return data[3] if len(data) > 3 else None
+
+
+def _kelas_input(data):
+    """Kelas dari input (elemen ke-5), None jika tidak diketahui"""
+    return data[4] if len(data) > 4 else None
+
+
+def buat_gen_acak(data, databases, rng=random):
+    """
+    Gen lengkap untuk satu input: SKS tetap dari input jika ada (elemen ke-4),
+    selain itu acak; hari, waktu (muat untuk span), dan ruangan acak;
+    kelas (elemen ke-5) dibawa sebagai gen ke-8
+    
+    Args:
+        data: [dosen, matkul, prodi] atau [dosen, matkul, prodi, sks[, kelas]]
+        databases: Dictionary pilihan valid
+        rng: random.Random per run (default: modul random)
+    
+    Returns:
+        List gen [dosen, matkul, prodi, sks, hari, waktu, ruangan, kelas]
+    """
+    sks = _sks_input(data)
+    if sks is None:
+        sks = rng.choice(databases['sks'])
+    hari = rng.choice(databases['hari'])
+    return [
+        data[0], data[1], data[2], sks,
+        hari, pilih_waktu(databases, sks, rng), rng.choice(databases['ruangan']),
+        _kelas_input(data)
+    ]
+
+
+def sks_tetap(populasi_data):
+    """True jika input membawa SKS (gen sks tidak dimutasi)"""
+    return any(_sks_input(data) is not None for data in populasi_data.values())
+
+
+def kunci_kelompok(data):
+    """
+    Kelompok sumber daya per hari yang tidak boleh dipakai bersamaan:
+    ruangan, dosen, dan kohort mahasiswa (prodi, kelas) jika kelas diketahui
+    
+    Returns:
+        Tuple kunci kelompok
+    """
+    kunci = (('r', data[4], data[6]), ('d', data[4], data[0]))
+    kelas = data[7] if len(data) > 7 else None
+    if kelas is None:
+        return kunci
+    return kunci + (('k', data[4], data[2], kelas),)
+
+
+class _SumbuWaktu:
+    """Sumbu blok waktu bersama untuk satu isi (databases['waktu'], databases['sks'])"""
+    
+    __slots__ = ('posisi', 'label', 'rentang', 'batas', 'indeks_batas', 'n_blok', 'interval', 'mulai', 'asing')
+    
+    def __init__(self, waktu, sks):
+        self.label = list(dict.fromkeys(waktu))
+        self.posisi = {w: i for i, w in enumerate(self.label)}
+        rentang = [rentang_waktu(w) for w in self.label]
+        self.rentang = None if not rentang or None in rentang else rentang
+        self.batas = self.indeks_batas = None
+        self.n_blok = len(self.label)
+        
+        if self.rentang is not None:
+            # Batas blok: jam mulai/selesai setiap label dan jam selesai setiap SKS yang muat
+            selesai_hari = max(selesai for _, selesai in self.rentang)
+            batas = {jam for r in self.rentang for jam in r}
+            for mulai, _ in self.rentang:
+                for nilai in set(sks):
+                    if mulai + durasi_menit(nilai) <= selesai_hari:
+                        batas.add(mulai + durasi_menit(nilai))
+            self.batas = sorted(batas)
+            self.indeks_batas = {jam: i for i, jam in enumerate(self.batas)}
+            self.n_blok = len(self.batas) - 1
+        
+        self.interval = {}
+        self.mulai = {}
+        self.asing = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _sumbu_waktu(waktu, sks):
+    return _SumbuWaktu(waktu, sks)
+
+
+class PetaSlot:
+    """
+    Interval [awal, akhir) yang ditempati gen, dalam indeks blok waktu
+    
+    Format databases['waktu'] yang diharapkan: setiap label rentang jam,
+    mis. '07:00-09:00' atau label bernomor '1 - 08.00-09.40' (lihat
+    rentang_waktu). Label boleh tumpang tindih ('08.00-09.40' dan
+    '08.00-10.30'): kuliah menempati jam sebenarnya, dari jam mulai label
+    sampai jam selesai label atau, jika SKS butuh lebih lama, sampai jam
+    mulai + SKS x MENIT_PER_SKS. Jam dipadatkan menjadi blok di antara
+    semua batas jam yang mungkin, jadi interval tetap indeks kecil untuk
+    bitmask OkupansiSlot dan dua kuliah beririsan tepat jika jamnya
+    beririsan (durasi SKS di luar databases['sks'] dibulatkan ke batas
+    blok berikutnya). Jika ada label yang bukan rentang jam, setiap label
+    dianggap satu blok terpisah sesuai urutannya dan span = durasi_slot(SKS).
+    
+    Span yang melewati akhir hari (jam selesai terakhir / blok terakhir)
+    tidak dipotong: muat() bernilai False, interval-nya masuk blok luapan
+    sesudah akhir hari, dan operator hanya memilih waktu mulai dari
+    waktu_muat(). Tanpa databases, setiap nilai waktu dianggap slot
+    tersendiri dengan span 1 (perilaku lama: konflik hanya jika waktu
+    persis sama).
+    """
+    
+    __slots__ = ('_sumbu', '_span')
+    
+    def __init__(self, databases=None):
+        self._span = databases is not None
+        databases = databases or {}
+        self._sumbu = _sumbu_waktu(tuple(databases.get('waktu', ())), tuple(databases.get('sks', ())))
+    
+    @property
+    def n_blok(self):
+        """Jumlah blok waktu dalam sehari (blok luapan & waktu di luar databases di belakangnya)"""
+        return self._sumbu.n_blok
+    
+    def _hitung(self, waktu, sks):
+        sumbu = self._sumbu
+        posisi = sumbu.posisi.get(waktu)
+        if posisi is None or not self._span:
+            if posisi is None:
+                # Waktu di luar databases: blok tersendiri di belakang blok luapan
+                posisi = sumbu.asing.setdefault(waktu, sumbu.n_blok + 1 + len(sumbu.asing))
+            return posisi, posisi + 1, True
+        
+        if sumbu.rentang is None:
+            akhir = posisi + durasi_slot(sks)
+        else:
+            mulai, selesai = sumbu.rentang[posisi]
+            posisi = sumbu.indeks_batas[mulai]
+            akhir = bisect.bisect_left(sumbu.batas, max(selesai, mulai + durasi_menit(sks)))
+        if akhir > sumbu.n_blok:
+            return posisi, sumbu.n_blok + 1, False
+        return posisi, akhir, True
+    
+    def rentang(self, waktu, sks):
+        """Interval blok [awal, akhir) untuk kuliah dengan SKS sks yang mulai di label waktu"""
+        hasil = self._sumbu.interval.get((waktu, sks))
+        if hasil is None:
+            hasil = self._sumbu.interval[waktu, sks] = self._hitung(waktu, sks)
+        return hasil[:2]
+    
+    def interval(self, data):
+        """Interval blok [awal, akhir) yang ditempati gen data"""
+        return self.rentang(data[5], data[3])
+    
+    def muat(self, waktu, sks):
+        """True jika span SKS yang mulai di label waktu selesai sebelum akhir hari"""
+        self.rentang(waktu, sks)
+        return self._sumbu.interval[waktu, sks][2]
+    
+    def waktu_muat(self, sks):
+        """
+        Label waktu mulai yang span SKS-nya muat, urutan databases
+        
+        Raises:
+            ValueError: Tidak ada label waktu yang muat untuk SKS ini
+        """
+        pilihan = self._sumbu.mulai.get(sks)
+        if pilihan is None:
+            pilihan = tuple(w for w in self._sumbu.label if self.muat(w, sks))
+            if not pilihan:
+                raise ValueError(f"SKS {sks} tidak muat di waktu mana pun pada databases['waktu']")
+            self._sumbu.mulai[sks] = pilihan
+        return pilihan
+    
+    def interval_slot(self, data):
+        """
+        Interval (mulai, selesai) dalam satuan slot bawaan (MENIT_PER_SLOT menit)
+        
+        Dipakai soft constraint yang mengukur lama kuliah atau celah: label
+        rentang jam dihitung dari menit sebenarnya, selain itu satu blok = satu slot.
+        """
+        sumbu = self._sumbu
+        posisi = sumbu.posisi.get(data[5])
+        if not self._span or sumbu.rentang is None or posisi is None:
+            return self.interval(data)
+        mulai, selesai = sumbu.rentang[posisi]
+        selesai = max(selesai, mulai + durasi_menit(data[3]))
+        return mulai / MENIT_PER_SLOT, selesai / MENIT_PER_SLOT
+
+
+class OkupansiSlot:
+    """
+    Multiset interval [awal, akhir) dalam satu hari, disimpan bit-sliced
+    
+    _awal[k] memuat bit ke-k dari jumlah interval yang mulai di setiap
+    slot (bit s = slot s); _akhir sama untuk slot selesai. Jumlah interval
+    yang beririsan dengan [a, b) = total - (selesai <= a) - (mulai >= b),
+    dan setiap suku dihitung dengan popcount(plane & mask) per plane,
+    tanpa membandingkan pasangan interval.
+    """
+    
+    __slots__ = ('jumlah', '_awal', '_akhir')
+    
+    def __init__(self):
+        self.jumlah = 0
+        self._awal = []
+        self._akhir = []
+    
+    @staticmethod
+    def _naik(planes, bit):
+        for k, plane in enumerate(planes):
+            if not plane & bit:
+                planes[k] = plane | bit
+                return
+            planes[k] = plane ^ bit
+        planes.append(bit)
+    
+    @staticmethod
+    def _turun(planes, bit):
+        for k, plane in enumerate(planes):
+            if plane & bit:
+                planes[k] = plane ^ bit
+                return
+            planes[k] = plane | bit
+    
+    @staticmethod
+    def _hitung(planes, mask):
+        return sum((plane & mask).bit_count() << k for k, plane in enumerate(planes))
+    
+    def tambah(self, awal, akhir):
+        self.jumlah += 1
+        self._naik(self._awal, 1 << awal)
+        self._naik(self._akhir, 1 << akhir)
+    
+    def hapus(self, awal, akhir):
+        self.jumlah -= 1
+        self._turun(self._awal, 1 << awal)
+        self._turun(self._akhir, 1 << akhir)
+    
+    def beririsan(self, awal, akhir):
+        """Jumlah interval (termasuk dirinya sendiri) yang beririsan dengan [awal, akhir)"""
+        selesai_sebelum = self._hitung(self._akhir, (2 << awal) - 1)
+        mulai_sesudah = self._hitung(self._awal, ~((1 << akhir) - 1))
+        return self.jumlah - selesai_sebelum - mulai_sesudah
+
+
+def hitung_konflik(krom, populasi, databases=None):
     """
     Hitung konflik untuk kromosom
     Index: [dosen, matkul, prodi, sks, hari, waktu, ruangan]
            [0,     1,      2,     3,   4,    5,     6]
+    
+    Dua kromosom di hari yang sama bentrok jika span slot-nya beririsan
+    (span dari SKS, lihat PetaSlot); tanpa databases span selalu 1 slot.
+    Gen ke-8 (kelas, opsional) menentukan kohort mahasiswa.
     """
+    peta = PetaSlot(databases)
+    awal, akhir = peta.interval(krom["data"])
+    kelas = krom["data"][7] if len(krom["data"]) > 7 else None
     konflik = 0
     
     for other in populasi:
         if krom["kode"] == other["kode"]:
             continue
         
-        same_hari = krom["data"][4] == other["data"][4]
-        same_waktu = krom["data"][5] == other["data"][5]
+        if krom["data"][4] != other["data"][4]:
+            continue
         
-        if same_hari and same_waktu:
-            # Konflik ruangan (ruangan, hari, waktu sama)
+        awal_lain, akhir_lain = peta.interval(other["data"])
+        if awal_lain < akhir and awal < akhir_lain:
+            # Konflik ruangan (ruangan sama, slot beririsan)
             if krom["data"][6] == other["data"][6]:
                 konflik += 1
             
-            # Konflik dosen (dosen, hari, waktu sama)
+            # Konflik dosen (dosen sama, slot beririsan)
             if krom["data"][0] == other["data"][0]:
                 konflik += 1
+            
+            # Konflik kohort (prodi & kelas sama, slot beririsan)
+            if (kelas is not None and krom["data"][2] == other["data"][2]
+                    and len(other["data"]) > 7 and other["data"][7] == kelas):
+                konflik += 1
     
     return konflik
 
 
-def fitness(konflik):
+def fitness(konflik, penalti=0):
     """
-    Hitung fitness HANYA dari konflik
-    Formula: 1 / (1 + konflik)
+    Hitung fitness dari konflik dan penalti soft constraint
+    Formula: 1 / (1 + konflik + penalti)
     
     Args:
-        konflik: Jumlah konflik
+        konflik: Jumlah konflik (hard constraint)
+        penalti: Total penalti soft constraint berbobot (default: 0)
     
     Returns:
         Fitness score (0.0 - 1.0)
     """
-    return round(1 / (1 + konflik), 4)
+    return round(1 / (1 + konflik + penalti), 4)
 
 
-def evaluasi_populasi(populasi):
-    """Evaluasi fitness untuk semua kromosom"""
-    for krom in populasi:
-        konflik = hitung_konflik(krom, populasi)
+def _irisan_kode_sama(anggota):
+    """Pasangan (index, interval) dengan kode sama: jumlah yang beririsan per anggota (termasuk diri)"""
+    return [
+        sum(1 for _, (a2, b2) in anggota if a2 < b and a < b2)
+        for _, (a, b) in anggota
+    ]
+
+
+def hitung_konflik_populasi(populasi, databases=None):
+    """
+    Hitung konflik semua kromosom sekaligus (near-linear)
+    
+    Kromosom dikelompokkan per hari untuk setiap sumber daya (ruangan,
+    dosen, kohort prodi/kelas; lihat kunci_kelompok); tiap kelompok
+    menyimpan OkupansiSlot sehingga jumlah anggota yang span-nya
+    beririsan didapat dari bitmask + popcount, bukan perbandingan
+    berpasangan. Anggota dengan kode sama dikecualikan, persis seperti
+    hitung_konflik.
+    
+    Args:
+        populasi: List kromosom
+        databases: Dictionary pilihan valid (urutan waktu & span SKS);
+                   tanpa databases span selalu 1 slot
+    
+    Returns:
+        List jumlah konflik, urutan sama dengan populasi
+    """
+    peta = PetaSlot(databases)
+    okupansi = defaultdict(OkupansiSlot)
+    per_kode = defaultdict(list)
+    kunci_list = []
+    
+    for i, krom in enumerate(populasi):
+        data = krom["data"]
+        interval = peta.interval(data)
+        kunci = kunci_kelompok(data)
+        kunci_list.append((kunci, interval))
+        
+        for k in kunci:
+            okupansi[k].tambah(*interval)
+        per_kode[krom["kode"]].append(i)
+    
+    konflik = [
+        sum(okupansi[k].beririsan(*interval) for k in kunci)
+        for kunci, interval in kunci_list
+    ]
+    
+    # Kecualikan diri sendiri dan kromosom lain dengan kode sama
+    for anggota in per_kode.values():
+        if len(anggota) == 1:
+            konflik[anggota[0]] -= len(kunci_list[anggota[0]][0])
+            continue
+        kelompok = defaultdict(list)
+        for i in anggota:
+            kunci, interval = kunci_list[i]
+            for k in kunci:
+                kelompok[k].append((i, interval))
+        for isi in kelompok.values():
+            for (i, _), n in zip(isi, _irisan_kode_sama(isi)):
+                konflik[i] -= n
+    
+    return konflik
+
+
+def evaluasi_populasi(populasi, databases=None, kendala=None):
+    """
+    Evaluasi fitness untuk semua kromosom
+    
+    Args:
+        populasi: List kromosom
+        databases: Dictionary pilihan valid (urutan waktu & span SKS)
+        kendala: RegistriKendala soft constraint (opsional, lihat utils.kendala)
+    
+    Returns:
+        Populasi yang sama, konflik/penalti/fitness terisi
+    """
+    penalti = kendala.evaluasi(populasi, databases) if kendala else [0] * len(populasi)
+    
+    for krom, konflik, p in zip(populasi, hitung_konflik_populasi(populasi, databases), penalti):
         krom["konflik"] = konflik
-        krom["fitness"] = fitness(konflik)
+        krom["penalti"] = p
+        krom["fitness"] = fitness(konflik, p)
     
     return populasi
 
 
-def seleksi_tournament(populasi, tournament_size=3):
+class IndeksKonflik:
+    """
+    Indeks konflik persisten untuk satu populasi
+    
+    Menyimpan anggota dan OkupansiSlot setiap kelompok sumber daya per
+    hari (kunci_kelompok), sehingga perubahan satu gen hanya menyentuh
+    kelompok lama dan kelompok baru, bukan seluruh populasi. Kromosom
+    yang span-nya beririsan dengan perubahan ditandai "kotor" dan baru
+    di-skor ulang saat perbarui_skor() dipanggil. Jika diberi registry
+    soft constraint, penaltinya dilacak incremental lewat SkorKendala
+    (dengan running total per kendala) dan kromosom yang penaltinya
+    berubah ikut ditandai kotor. Indeks boleh dipakai lintas generasi:
+    anggota lama dikeluarkan (hapus) saat offspring masuk (tambah).
+    """
+    
+    GEN_SLOT = (0, 2, 3, 4, 5, 6, 7)  # gen yang menentukan kelompok / span
+    
+    def __init__(self, populasi=(), databases=None, kendala=None):
+        self._peta = PetaSlot(databases)
+        self._lunak = kendala.lacak(databases) if kendala else None
+        self._anggota = defaultdict(list)
+        self._okupansi = defaultdict(OkupansiSlot)
+        self._kunci = {}
+        self._populasi = {}
+        self._jumlah_kode = defaultdict(int)
+        self._kotor = {}
+        
+        for krom in populasi:
+            self.tambah(krom)
+    
+    def __len__(self):
+        return len(self._kunci)
+    
+    def __contains__(self, krom):
+        return id(krom) in self._kunci
+    
+    def anggota(self):
+        """List kromosom di indeks, urut sesuai waktu masuk"""
+        return list(self._populasi.values())
+    
+    def _tandai(self, kunci, awal, akhir):
+        kotor = self._kotor
+        interval = self._kunci
+        for krom in self._anggota.get(kunci, ()):
+            a, b = interval[id(krom)][-1]
+            if a < akhir and awal < b:
+                kotor[id(krom)] = krom
+    
+    def tambah(self, krom):
+        """Masukkan kromosom ke indeks"""
+        data = krom["data"]
+        interval = self._peta.interval(data)
+        kunci = kunci_kelompok(data)
+        
+        self._kunci[id(krom)] = kunci + (interval,)
+        self._populasi[id(krom)] = krom
+        self._jumlah_kode[krom["kode"]] += 1
+        for k in kunci:
+            self._anggota[k].append(krom)
+            self._okupansi[k].tambah(*interval)
+            self._tandai(k, *interval)
+        
+        if self._lunak is not None:
+            for lain in self._lunak.tambah(krom):
+                self._kotor[id(lain)] = lain
+    
+    def hapus(self, krom):
+        """Keluarkan kromosom dari indeks"""
+        *kunci, interval = self._kunci.pop(id(krom))
+        
+        del self._populasi[id(krom)]
+        self._kotor.pop(id(krom), None)
+        self._jumlah_kode[krom["kode"]] -= 1
+        if not self._jumlah_kode[krom["kode"]]:
+            del self._jumlah_kode[krom["kode"]]
+        for k in kunci:
+            anggota = self._anggota[k]
+            for i, lain in enumerate(anggota):
+                if lain is krom:
+                    del anggota[i]
+                    break
+            if anggota:
+                self._okupansi[k].hapus(*interval)
+                self._tandai(k, *interval)
+            else:
+                del self._anggota[k]
+                del self._okupansi[k]
+        
+        if self._lunak is not None:
+            for lain in self._lunak.hapus(krom):
+                self._kotor[id(lain)] = lain
+    
+    def hapus_banyak(self, populasi):
+        """
+        Keluarkan banyak kromosom sekaligus (mis. offspring generasi sebelumnya);
+        jika semua anggota keluar, struktur indeks dikosongkan langsung
+        """
+        populasi = list(populasi)
+        if len(populasi) < len(self._kunci) or not all(id(krom) in self._kunci for krom in populasi):
+            for krom in populasi:
+                self.hapus(krom)
+            return
+        
+        self._anggota.clear()
+        self._okupansi.clear()
+        self._kunci.clear()
+        self._populasi.clear()
+        self._jumlah_kode.clear()
+        self._kotor = {}
+        if self._lunak is not None:
+            self._lunak.hapus_banyak(populasi)
+    
+    def ubah_gen(self, krom, gene_idx, nilai):
+        """Ubah satu gen dan pindahkan kromosom ke kelompok/span barunya"""
+        if gene_idx not in self.GEN_SLOT or id(krom) not in self._kunci:
+            krom["data"][gene_idx] = nilai
+            return
+        
+        self.hapus(krom)
+        krom["data"][gene_idx] = nilai
+        self.tambah(krom)
+    
+    def konflik(self, krom):
+        """Jumlah konflik kromosom terhadap anggota indeks lainnya (kode sama dikecualikan)"""
+        *kunci, (awal, akhir) = self._kunci[id(krom)]
+        kode = krom["kode"]
+        duplikat_kode = self._jumlah_kode[kode] > 1
+        
+        konflik = 0
+        for k in kunci:
+            konflik += self._okupansi[k].beririsan(awal, akhir)
+            if not duplikat_kode:
+                konflik -= 1
+                continue
+            for lain in self._anggota[k]:
+                if lain["kode"] == kode:
+                    a, b = self._kunci[id(lain)][-1]
+                    if a < akhir and awal < b:
+                        konflik -= 1
+        
+        return konflik
+    
+    def perbarui_skor(self):
+        """
+        Skor ulang hanya kromosom yang kelompok/span-nya terdampak perubahan
+        
+        Returns:
+            Jumlah kromosom yang di-skor ulang
+        """
+        return len(self.skor_ulang())
+    
+    def skor_ulang(self):
+        """
+        Seperti perbarui_skor, tetapi mengembalikan kromosom yang di-skor ulang
+        
+        Returns:
+            List kromosom yang di-skor ulang
+        """
+        kotor = list(self._kotor.values())
+        self._kotor = {}
+        
+        for krom in kotor:
+            konflik = self.konflik(krom)
+            penalti = self._lunak.penalti(krom) if self._lunak is not None else 0
+            krom["konflik"] = konflik
+            krom["penalti"] = penalti
+            krom["fitness"] = fitness(konflik, penalti)
+        
+        return kotor
+    
+    def hitung_irisan(self, kunci, awal, akhir):
+        """Jumlah anggota kelompok kunci yang span-nya beririsan dengan [awal, akhir)"""
+        okupansi = self._okupansi.get(kunci)
+        return okupansi.beririsan(awal, akhir) if okupansi is not None else 0
+    
+    @property
+    def total_penalti(self):
+        """Running total penalti soft constraint seluruh anggota (0 tanpa registry)"""
+        return self._lunak.total if self._lunak is not None else 0
+    
+    def penalti_per_kendala(self):
+        """Running total penalti berbobot per kendala seluruh anggota ({} tanpa registry)"""
+        return self._lunak.per_kendala() if self._lunak is not None else {}
+
+
+def seleksi_tournament(populasi, tournament_size=3, rng=random):
     """
     Tournament Selection untuk memilih parent
     
     Args:
         populasi: List kromosom
         tournament_size: Ukuran tournament
+        rng: random.Random per run (default: modul random)
     
     Returns:
         1 parent terpilih
     """
     tournament_size = min(tournament_size, len(populasi))
-    tournament = random.sample(populasi, tournament_size)
+    tournament = rng.sample(populasi, tournament_size)
     return max(tournament, key=lambda x: x['fitness'])
 
 
-def crossover(parent1, parent2, gen_number):
+def crossover(parent1, parent2, gen_number, indeks=None, rng=random, databases=None):
     """
-    Single-point crossover setelah prodi (index 2)
-    Bagian tetap: dosen, matkul, prodi (0-2)
-    Bagian crossover: sks, hari, waktu, ruangan (3-6)
+    Single-point crossover setelah sks (index 3)
+    Bagian tetap: dosen, matkul, prodi, sks (0-3); sks menentukan span
+    slot sehingga ikut identitas mata kuliah
+    Bagian crossover: hari, waktu, ruangan (4-6)
     
     Args:
         parent1, parent2: Parent kromosom
         gen_number: Nomor generasi
+        indeks: IndeksKonflik offspring (opsional), offspring langsung didaftarkan
+        rng: random.Random per run (default: modul random)
+        databases: Dictionary pilihan valid (opsional); jika diberikan, waktu
+                   offspring yang span SKS-nya tidak muat diundi ulang
     
     Returns:
         2 offspring
     """
-    cut_point = 3
+    cut_point = 4
     
-    offspring1 = {
-        "kode": f"G{gen_number}_C{random.randint(100, 999)}",
-        "data": parent1["data"][:cut_point] + parent2["data"][cut_point:],
-        "generation": gen_number
-    }
+    # Gen ke-8 (kelas) ikut identitas parent pertama
+    offspring1 = Kromosom(
+        f"G{gen_number}_C{rng.randint(100, 999)}",
+        parent1["data"][:cut_point] + parent2["data"][cut_point:7] + parent1["data"][7:],
+        gen_number
+    )
     
-    offspring2 = {
-        "kode": f"G{gen_number}_C{random.randint(100, 999)}",
-        "data": parent2["data"][:cut_point] + parent1["data"][cut_point:],
-        "generation": gen_number
-    }
+    offspring2 = Kromosom(
+        f"G{gen_number}_C{rng.randint(100, 999)}",
+        parent2["data"][:cut_point] + parent1["data"][cut_point:7] + parent2["data"][7:],
+        gen_number
+    )
+    
+    if databases is not None:
+        perbaiki_span(offspring1['data'], databases, rng)
+        perbaiki_span(offspring2['data'], databases, rng)
+    
+    if indeks is not None:
+        indeks.tambah(offspring1)
+        indeks.tambah(offspring2)
     
     return [offspring1, offspring2]
 
 
-def mutasi(kromosom, mutation_rate, databases):
+def perbaiki_span(data, databases, rng=random):
+    """
+    Ganti waktu mulai jika span SKS tidak muat di hari itu (mis. SKS
+    parent pertama dengan waktu parent kedua, atau SKS hasil mutasi)
+    
+    Returns:
+        True jika waktu diganti
+    """
+    if PetaSlot(databases).muat(data[5], data[3]):
+        return False
+    data[5] = pilih_waktu(databases, data[3], rng)
+    return True
+
+
+GEN_MUTASI = (3, 4, 5, 6)          # sks, hari, waktu, ruangan
+GEN_MUTASI_SKS_TETAP = (4, 5, 6)   # SKS dari input tidak dimutasi
+
+
+def mutasi(kromosom, mutation_rate, databases, indeks=None, genes=GEN_MUTASI, rng=random):
     """
     Mutasi gen (sks, hari, waktu, ruangan)
     
@@ -147,11 +812,14 @@ def mutasi(kromosom, mutation_rate, databases):
         kromosom: Kromosom yang akan dimutasi
         mutation_rate: Probabilitas mutasi
         databases: Dictionary berisi data valid
+        indeks: IndeksKonflik (opsional), diperbarui in-place
+        genes: Index gen yang boleh dimutasi (GEN_MUTASI_SKS_TETAP jika SKS dari input)
+        rng: random.Random per run (default: modul random)
     
     Returns:
         Kromosom yang sudah dimutasi
     """
-    if random.random() < mutation_rate:
+    if rng.random() < mutation_rate:
         # Pilih gen mana yang dimutasi (index 3-6)
         gene_map = {
             3: 'sks',
@@ -160,31 +828,54 @@ def mutasi(kromosom, mutation_rate, databases):
             6: 'ruangan'
         }
         
-        gene_idx = random.choice([3, 4, 5, 6])
-        kromosom['data'][gene_idx] = random.choice(databases[gene_map[gene_idx]])
+        gene_idx = rng.choice(genes)
+        if gene_idx == 5:
+            nilai = pilih_waktu(databases, kromosom['data'][3], rng)
+        else:
+            nilai = rng.choice(databases[gene_map[gene_idx]])
+        
+        if indeks is not None:
+            indeks.ubah_gen(kromosom, gene_idx, nilai)
+        else:
+            kromosom['data'][gene_idx] = nilai
+        
+        # SKS baru yang span-nya tidak muat dari waktu lama: waktu mulai ikut diundi ulang
+        if gene_idx == 3 and not PetaSlot(databases).muat(kromosom['data'][5], nilai):
+            waktu = pilih_waktu(databases, nilai, rng)
+            if indeks is not None:
+                indeks.ubah_gen(kromosom, 5, waktu)
+            else:
+                kromosom['data'][5] = waktu
     
     return kromosom
 
 
-def mutasi_kuat(kromosom, databases):
+def mutasi_kuat(kromosom, databases, sks_dari_input=False, rng=random):
     """
     Mutasi kuat untuk diversity (ubah semua gen mutable)
     
     Args:
         kromosom: Kromosom yang akan dimutasi
         databases: Dictionary berisi data valid
+        sks_dari_input: True jika SKS tetap (tidak diacak)
+        rng: random.Random per run (default: modul random)
     
     Returns:
         Kromosom yang sudah dimutasi kuat
     """
-    kromosom['data'][3] = random.choice(databases['sks'])
-    kromosom['data'][4] = random.choice(databases['hari'])
-    kromosom['data'][5] = random.choice(databases['waktu'])
-    kromosom['data'][6] = random.choice(databases['ruangan'])
+    if not sks_dari_input:
+        kromosom['data'][3] = rng.choice(databases['sks'])
+    kromosom['data'][4] = rng.choice(databases['hari'])
+    kromosom['data'][5] = pilih_waktu(databases, kromosom['data'][3], rng)
+    kromosom['data'][6] = rng.choice(databases['ruangan'])
     
     return kromosom
 
 
+def _ambil_fitness(krom):
+    return krom['fitness']
+
+
 def elitism_replacement(old_pop, new_pop, elite_size):
     """
     Replacement dengan elitism
@@ -197,18 +888,14 @@ def elitism_replacement(old_pop, new_pop, elite_size):
     Returns:
         Populasi baru dengan elite
     """
-    # Sort dan ambil elite
-    sorted_old = sorted(old_pop, key=lambda x: x['fitness'], reverse=True)
-    elites = sorted_old[:elite_size]
-    
-    # Gabung dan sort
-    combined = elites + new_pop
-    combined_sorted = sorted(combined, key=lambda x: x['fitness'], reverse=True)
+    # Ambil elite (nlargest stabil, sama dengan sorted(...)[:n] tanpa full sort)
+    elites = heapq.nlargest(elite_size, old_pop, key=_ambil_fitness)
     
-    return combined_sorted[:len(old_pop)]
+    # Gabung dan ambil yang terbaik
+    return heapq.nlargest(len(old_pop), elites + new_pop, key=_ambil_fitness)
 
 
-def create_immigrant(gen_number, populasi_data, databases):
+def create_immigrant(gen_number, populasi_data, databases, rng=random, key=None):
     """
     Buat immigrant untuk diversity
     
@@ -216,229 +903,588 @@ def create_immigrant(gen_number, populasi_data, databases):
         gen_number: Nomor generasi
         populasi_data: Data populasi awal
         databases: Database untuk mutasi
+        rng: random.Random per run (default: modul random)
+        key: Kode input immigrant (default: None = dipilih acak)
     
     Returns:
         Kromosom immigrant baru
     """
-    keys = list(populasi_data.keys())
-    key = random.choice(keys)
+    if key is None:
+        key = rng.choice(list(populasi_data.keys()))
+        kode = f"G{gen_number}_IMM{rng.randint(100, 999)}"
+    else:
+        kode = f"G{gen_number}_IMM_{key}"
     base = populasi_data[key]
     
-    immigrant = {
-        'kode': f"G{gen_number}_IMM{random.randint(100, 999)}",
-        'data': [
-            base[0], base[1], base[2],
-            random.choice(databases['sks']),
-            random.choice(databases['hari']),
-            random.choice(databases['waktu']),
-            random.choice(databases['ruangan'])
-        ],
-        'generation': gen_number
-    }
+    immigrant = Kromosom(kode, buat_gen_acak(base, databases, rng), gen_number)
     
-    return mutasi_kuat(immigrant, databases)
+    return mutasi_kuat(immigrant, databases, sks_dari_input=_sks_input(base) is not None, rng=rng)
 
 
-def remove_duplicates(populasi):
+def signature(krom):
+    """Signature kromosom: (dosen, matkul, prodi, kelas)"""
+    data = krom['data']
+    return (data[0], data[1], data[2], data[7] if len(data) > 7 else None)
+
+
+def buat_indeks_signature(populasi_data):
+    """
+    Indeks signature -> kode input, dibangun sekali per run
+    Urutan mengikuti urutan input (deterministik); signature ganda memakai kode pertama
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
+    
+    Returns:
+        Dictionary {(dosen, matkul, prodi, kelas): kode}
     """
-    Hapus duplikat berdasarkan (Dosen, Matkul, Prodi)
+    indeks_sig = {}
+    for key, data in populasi_data.items():
+        indeks_sig.setdefault((data[0], data[1], data[2], _kelas_input(data)), key)
+    return indeks_sig
+
+
+def remove_duplicates(populasi, indeks=None, seen=None):
+    """
+    Hapus duplikat berdasarkan (Dosen, Matkul, Prodi, Kelas)
     Setiap kombinasi hanya boleh muncul 1x dalam populasi
     
     Args:
         populasi: List kromosom
+        indeks: IndeksKonflik (opsional), duplikat ikut dikeluarkan
+        seen: Set signature (opsional), diisi signature yang dipertahankan
+              agar bisa dipakai ulang oleh isi_signature_hilang
     
     Returns:
-        List kromosom tanpa duplikat (dosen, matkul, prodi)
+        List kromosom tanpa duplikat (dosen, matkul, prodi, kelas)
     """
-    seen = set()
+    seen = set() if seen is None else seen
     unique = []
     
     for krom in populasi:
-        # Signature: (dosen, matkul, prodi)
-        signature = (krom['data'][0], krom['data'][1], krom['data'][2])
+        sig = signature(krom)
         
-        if signature not in seen:
-            seen.add(signature)
+        if sig not in seen:
+            seen.add(sig)
             unique.append(krom)
+        elif indeks is not None:
+            indeks.hapus(krom)
     
     return unique
 
 
-# ========== MAIN GA FUNCTION ==========
-
-def run_genetic_algorithm(populasi_data, databases, 
-                          generations=10, 
-                          mutation_rate=0.15,
-                          elite_size=2,
-                          early_stopping=False):
+def isi_signature_hilang(indeks_sig, populasi_data, databases, gen, ada, kode_filler, batas=None, rng=random):
     """
-    Algoritma Genetika OPTIMIZED untuk penjadwalan
+    Repair satu pass: buat filler untuk setiap signature input yang belum ada
     
     Args:
+        indeks_sig: Hasil buat_indeks_signature
         populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
         databases: Dictionary pilihan valid
-        generations: Jumlah generasi (default: 10)
-        mutation_rate: Probabilitas mutasi (default: 0.15)
-        elite_size: Jumlah elite (default: 2)
-        early_stopping: Stop jika optimal (default: False) ✅ BARU
+        gen: Nomor generasi filler
+        ada: Set signature yang sudah ada di populasi (ikut diperbarui)
+        kode_filler: Fungsi kode_input -> kode filler
+        batas: Jumlah filler maksimum (default: tanpa batas)
+        rng: random.Random per run (default: modul random)
     
     Returns:
-        Dictionary hasil GA lengkap
+        List filler, urut sesuai urutan input
     """
+    fillers = []
     
-    # ========== INITIALIZATION ==========
-    populasi = buat_populasi_list(populasi_data, databases)
-    populasi = evaluasi_populasi(populasi)
-    populasi_awal = copy.deepcopy(populasi)
+    for sig, key in indeks_sig.items():
+        if batas is not None and len(fillers) >= batas:
+            break
+        if sig in ada:
+            continue
+        
+        fillers.append(Kromosom(kode_filler(key), buat_gen_acak(populasi_data[key], databases, rng), gen))
+        ada.add(sig)
     
-    # History tracking
-    history = {
-        'best_fitness': [],
-        'avg_fitness': [],
-        'worst_fitness': [],
-        'best_konflik': [],
-        'generations': []
-    }
+    return fillers
+
+
+# ========== LOCAL SEARCH (REPAIR) ==========
+
+class IndeksSlotBebas:
+    """
+    Indeks ruangan terisi per (hari, waktu) untuk repair min-conflicts
     
-    # ========== EVOLUTION ==========
-    for gen in range(1, generations + 1):
-        offspring = []
-        target_size = len(populasi)
-        
-        # ===== CROSSOVER =====
-        while len(offspring) < target_size:
-            parent1 = seleksi_tournament(populasi, tournament_size=3)
-            parent2 = seleksi_tournament(populasi, tournament_size=3)
-            
-            children = crossover(parent1, parent2, gen)
-            
-            for child in children:
-                offspring.append(child)
-                if len(offspring) >= target_size:
-                    break
-        
-        # Trim to size
-        offspring = offspring[:target_size]
+    Setiap (hari, waktu) menyimpan bitmask ruangan yang terisi (dengan
+    hitungan per ruangan agar bisa dihapus), sehingga ruangan bebas untuk
+    satu span didapat dari OR beberapa bitmask, bukan memindai ruangan
+    atau populasi. Diperbarui setiap kali kromosom dipindahkan. Putaran
+    acak cari_slot memakai rng run (default: modul random).
+    """
+    
+    def __init__(self, databases, populasi=(), rng=random):
+        self._peta = PetaSlot(databases)
+        self._rng = rng
+        # Urutan unik sama dengan PetaSlot (waktu ganda memakai posisi pertama)
+        self._hari = list(dict.fromkeys(databases['hari']))
+        self._ruangan = list(dict.fromkeys(databases['ruangan']))
+        self._idx_ruangan = {r: i for i, r in enumerate(self._ruangan)}
+        self._penuh = (1 << len(self._ruangan)) - 1
+        self._hitung = defaultdict(int)
+        self._terisi = defaultdict(int)
         
-        # ===== MUTATION =====
-        # Adaptive mutation: higher in early generations
-        current_rate = mutation_rate * (1.5 if gen <= 3 else 1.0)
+        for krom in populasi:
+            self.tambah(krom)
+    
+    def _sel(self, data):
+        awal, akhir = self._peta.interval(data)
+        return data[4], range(awal, akhir), self._idx_ruangan.get(data[6])
+    
+    def tambah(self, krom):
+        hari, span, r = self._sel(krom["data"])
+        if r is None:
+            return
+        for t in span:
+            self._hitung[hari, t, r] += 1
+            self._terisi[hari, t] |= 1 << r
+    
+    def hapus(self, krom):
+        hari, span, r = self._sel(krom["data"])
+        if r is None:
+            return
+        for t in span:
+            self._hitung[hari, t, r] -= 1
+            if not self._hitung[hari, t, r]:
+                del self._hitung[hari, t, r]
+                self._terisi[hari, t] &= ~(1 << r)
+    
+    def cari_slot(self, data, indeks, tabu=(), aspirasi=0):
+        """
+        Slot (hari, waktu, ruangan) dengan konflik paling sedikit untuk data
         
-        for child in offspring:
-            mutasi(child, current_rate, databases)
+        Kromosom yang dicari harus sudah dikeluarkan dari indeks & self.
+        Konflik dosen/kohort dihitung dari OkupansiSlot IndeksKonflik (O(1)),
+        ruangan bebas dari bitmask; ruangan hanya dipindai satu per satu jika
+        semua ruangan terisi di span itu. Urutan hari/waktu diputar acak agar
+        kromosom tidak menumpuk di slot pertama.
         
-        # ===== EVALUATION =====
-        offspring = evaluasi_populasi(offspring)
+        Args:
+            data: Gen kromosom yang dicarikan slot
+            indeks: IndeksKonflik populasi (tanpa kromosom ini)
+            tabu: Set (hari, waktu) terlarang (tabu search, lihat utils.lokal)
+            aspirasi: Slot tabu tetap boleh jika konfliknya < aspirasi
         
-        # ===== REMOVE DUPLICATES =====
-        offspring = remove_duplicates(offspring)
+        Returns:
+            Tuple (konflik, hari, waktu, ruangan) atau None
+        """
+        n_hari = len(self._hari)
+        if not n_hari or not self._peta.n_blok or not self._ruangan:
+            return None
+        # Hanya waktu mulai yang span SKS-nya muat (lihat PetaSlot)
+        mulai = self._peta.waktu_muat(data[3])
+        n_mulai = len(mulai)
+        kelas = data[7] if len(data) > 7 else None
+        geser_hari, geser_waktu = self._rng.randrange(n_hari), self._rng.randrange(n_mulai)
+        terbaik = None
         
-        # ===== FILL MISSING (DETERMINISTIC) =====
-        # Ensure all input signatures are present
-        while len(offspring) < target_size:
-            # Get existing signatures
-            existing_sigs = {(k['data'][0], k['data'][1], k['data'][2]) for k in offspring}
-            
-            # Get all input signatures
-            all_sigs = {(populasi_data[key][0], populasi_data[key][1], populasi_data[key][2]) 
-                       for key in populasi_data.keys()}
-            
-            # Find missing
-            missing_sigs = all_sigs - existing_sigs
-            
-            if missing_sigs:
-                # Pick first missing signature
-                missing_sig = list(missing_sigs)[0]
+        for i in range(n_hari):
+            hari = self._hari[(i + geser_hari) % n_hari]
+            for j in range(n_mulai):
+                waktu = mulai[(j + geser_waktu) % n_mulai]
+                awal, akhir = self._peta.rentang(waktu, data[3])
                 
-                # Find the key for this signature
-                for key, data in populasi_data.items():
-                    if (data[0], data[1], data[2]) == missing_sig:
-                        filler = {
-                            'kode': f"G{gen}_FILL{random.randint(100, 999)}",
-                            'data': [
-                                data[0], data[1], data[2],
-                                random.choice(databases['sks']),
-                                random.choice(databases['hari']),
-                                random.choice(databases['waktu']),
-                                random.choice(databases['ruangan'])
-                            ],
-                            'generation': gen
-                        }
-                        offspring.append(filler)
-                        break
-            else:
-                # All signatures present, break
-                break
-        
-        # Trim to exact size
-        offspring = offspring[:target_size]
+                konflik = indeks.hitung_irisan(('d', hari, data[0]), awal, akhir)
+                if kelas is not None:
+                    konflik += indeks.hitung_irisan(('k', hari, data[2], kelas), awal, akhir)
+                if terbaik is not None and konflik >= terbaik[0]:
+                    continue
+                dilarang = (hari, waktu) in tabu
+                if dilarang and konflik >= aspirasi:
+                    continue
+                
+                terisi = 0
+                for t in range(awal, akhir):
+                    terisi |= self._terisi.get((hari, t), 0)
+                bebas = self._penuh & ~terisi
+                
+                if bebas:
+                    r = (bebas & -bebas).bit_length() - 1
+                    terbaik = (konflik, hari, waktu, self._ruangan[r])
+                    if konflik == 0:
+                        return terbaik
+                    continue
+                
+                # Semua ruangan terisi: minimal satu konflik ruangan
+                if terbaik is not None and konflik + 1 >= terbaik[0]:
+                    continue
+                for ruangan in self._ruangan:
+                    total = konflik + indeks.hitung_irisan(('r', hari, ruangan), awal, akhir)
+                    if dilarang and total >= aspirasi:
+                        continue
+                    if terbaik is None or total < terbaik[0]:
+                        terbaik = (total, hari, waktu, ruangan)
+                        if total == konflik + 1:
+                            break
         
-        # Re-evaluate after filling
-        offspring = evaluasi_populasi(offspring)
+        return terbaik
+
+
+def _ambil_konflik(krom):
+    return krom['konflik']
+
+
+def perbaiki_konflik(populasi, indeks, databases, batas_waktu=None, rng=random):
+    """
+    Repair min-conflicts (hill climbing) untuk kromosom yang berkonflik
+    
+    Kromosom dengan konflik terbanyak diproses lebih dulu; masing-masing
+    dipindah ke slot (hari, waktu, ruangan) dengan konflik paling sedikit
+    jika lebih baik dari posisinya sekarang. SKS (span) tidak diubah.
+    
+    Args:
+        populasi: List kromosom yang terdaftar di indeks
+        indeks: IndeksKonflik populasi (diperbarui in-place, skor ikut diperbarui)
+        databases: Dictionary pilihan valid
+        batas_waktu: Batas waktu dalam detik (None = tanpa batas)
+        rng: random.Random per run (default: modul random)
+    
+    Returns:
+        Jumlah kromosom yang dipindahkan
+    """
+    batas = None if batas_waktu is None else time.perf_counter() + batas_waktu
+    indeks.perbarui_skor()
+    
+    kandidat = sorted((k for k in populasi if k['konflik'] > 0), key=_ambil_konflik, reverse=True)
+    if not kandidat:
+        return 0
+    
+    slot_bebas = IndeksSlotBebas(databases, populasi, rng)
+    dipindah = 0
+    
+    for krom in kandidat:
+        if batas is not None and time.perf_counter() >= batas:
+            break
         
-        # ===== ELITISM REPLACEMENT =====
-        populasi = elitism_replacement(populasi, offspring, elite_size)
+        konflik = indeks.konflik(krom)
+        if konflik == 0:
+            continue
         
-        # ===== TRACKING =====
-        fitness_values = [k['fitness'] for k in populasi]
-        konflik_values = [k['konflik'] for k in populasi]
+        indeks.hapus(krom)
+        slot_bebas.hapus(krom)
+        slot = slot_bebas.cari_slot(krom['data'], indeks)
         
-        best_fitness = max(fitness_values)
-        avg_fitness = sum(fitness_values) / len(fitness_values)
-        worst_fitness = min(fitness_values)
-        best_konflik = min(konflik_values)
+        if slot is not None and slot[0] < konflik:
+            krom['data'][4], krom['data'][5], krom['data'][6] = slot[1:]
+            dipindah += 1
         
-        history['best_fitness'].append(round(best_fitness, 4))
-        history['avg_fitness'].append(round(avg_fitness, 4))
-        history['worst_fitness'].append(round(worst_fitness, 4))
-        history['best_konflik'].append(best_konflik)
-        history['generations'].append(gen)
+        indeks.tambah(krom)
+        slot_bebas.tambah(krom)
+    
+    indeks.perbarui_skor()
+    return dipindah
+
+
+# ========== SEEDING ==========
+
+SEEDING = ('random', 'greedy')
+
+
+def _kunci_beban(data):
+    """Sumber daya yang membatasi penempatan: dosen dan kohort (jika kelas diketahui)"""
+    kelas = data[7] if len(data) > 7 else None
+    return (('d', data[0]),) if kelas is None else (('d', data[0]), ('k', data[2], kelas))
+
+
+def buat_populasi_greedy(populasi_dict, databases, random_fraction=0.2, rng=random):
+    """
+    Populasi awal dengan penempatan greedy teracak (gaya DSATUR)
+    
+    Sebagian kromosom (random_fraction) tetap ditempatkan acak untuk
+    keberagaman. Sisanya diurutkan dari yang paling terkendala (total span
+    dosen & kohortnya terbesar, lalu span terpanjang; seri diacak) dan
+    satu per satu ditempatkan di slot dengan konflik paling sedikit
+    terhadap kromosom yang sudah ada (IndeksSlotBebas.cari_slot).
+    
+    Args:
+        populasi_dict: Dictionary {kode: [dosen, matkul, prodi(, sks(, kelas))]}
+        databases: Dictionary pilihan valid
+        random_fraction: Fraksi kromosom yang ditempatkan acak (default: 0.2)
+        rng: random.Random per run (default: modul random)
+    
+    Returns:
+        List kromosom (urutan sama dengan input, belum dievaluasi)
+    """
+    populasi = buat_populasi_list(populasi_dict, databases, rng)
+    indeks = IndeksKonflik(databases=databases)
+    slot_bebas = IndeksSlotBebas(databases, rng=rng)
+    
+    n_acak = min(len(populasi), max(0, round(len(populasi) * random_fraction)))
+    acak = set(rng.sample(range(len(populasi)), n_acak))
+    greedy = []
+    beban = defaultdict(int)
+    
+    for i, krom in enumerate(populasi):
+        for kunci in _kunci_beban(krom['data']):
+            beban[kunci] += durasi_slot(krom['data'][3])
+        if i in acak:
+            indeks.tambah(krom)
+            slot_bebas.tambah(krom)
+        else:
+            greedy.append(krom)
+    
+    urutan = sorted(
+        greedy,
+        key=lambda krom: (sum(beban[k] for k in _kunci_beban(krom['data'])),
+                          durasi_slot(krom['data'][3]), rng.random()),
+        reverse=True
+    )
+    for krom in urutan:
+        slot = slot_bebas.cari_slot(krom['data'], indeks)
+        if slot is not None:
+            krom['data'][4], krom['data'][5], krom['data'][6] = slot[1:]
+        indeks.tambah(krom)
+        slot_bebas.tambah(krom)
+    
+    return populasi
+
+
+def buat_populasi_awal(populasi_dict, databases, seeding='random', random_fraction=0.2, rng=random):
+    """
+    Populasi awal sesuai mode seeding
+    
+    Args:
+        seeding: 'random' (buat_populasi_list) atau 'greedy' (buat_populasi_greedy)
+        random_fraction: Fraksi kromosom acak untuk seeding 'greedy'
+        rng: random.Random per run (default: modul random)
+    
+    Returns:
+        List kromosom (urutan sama dengan input, belum dievaluasi)
+    """
+    if seeding == 'random':
+        return buat_populasi_list(populasi_dict, databases, rng)
+    if seeding == 'greedy':
+        return buat_populasi_greedy(populasi_dict, databases, random_fraction, rng)
+    raise ValueError(f"Seeding tidak dikenal: {seeding}")
+
+
+# ========== MAIN GA FUNCTION ==========
+
+# Pemanasan: mutation rate lebih tinggi di generasi awal (semua engine GA, kecuali adaptive)
+GENERASI_PEMANASAN = 3
+BOOST_PEMANASAN = 1.5
+
+
+def rate_mutasi(mutation_rate, gen, pemanasan=True):
+    """
+    Mutation rate generasi gen: dinaikkan BOOST_PEMANASAN selama
+    GENERASI_PEMANASAN generasi pertama (pemanasan=False: rate tetap)
+    """
+    if pemanasan and gen <= GENERASI_PEMANASAN:
+        return mutation_rate * BOOST_PEMANASAN
+    return mutation_rate
+
+
+def jalankan_generasi(populasi, populasi_data, databases, gen, mutation_rate, elite_size,
+                      indeks_sig=None, kendala=None, repair_budget=None, rng=random, pemanasan=True,
+                      indeks=None):
+    """
+    Jalankan satu generasi: seleksi, crossover, mutasi, hapus duplikat,
+    isi signature yang hilang, evaluasi, repair (opsional), dan elitism replacement
+    
+    Args:
+        populasi: Populasi generasi sebelumnya (sudah dievaluasi)
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
+        databases: Dictionary pilihan valid
+        gen: Nomor generasi
+        mutation_rate: Probabilitas mutasi dasar
+        elite_size: Jumlah elite
+        indeks_sig: Hasil buat_indeks_signature(populasi_data); bangun sekali per run
+        kendala: RegistriKendala soft constraint (opsional)
+        repair_budget: Batas waktu repair min-conflicts per generasi dalam detik
+                       (None = tanpa repair, lihat perbaiki_konflik)
+        rng: random.Random per run (default: modul random)
+        pemanasan: Naikkan mutation rate di generasi awal (lihat rate_mutasi);
+                   False jika mutation rate sudah diatur pemanggil (adaptive)
+        indeks: IndeksKonflik offspring yang dipakai lintas generasi (opsional,
+                dibuat dengan kendala yang sama); offspring generasi sebelumnya
+                dikeluarkan sehingga running total penaltinya tetap berlaku.
+                Default: indeks baru untuk generasi ini
+    
+    Returns:
+        Populasi generasi baru
+    """
+    if indeks_sig is None:
+        indeks_sig = buat_indeks_signature(populasi_data)
+    
+    offspring = []
+    target_size = len(populasi)
+    if indeks is None:
+        indeks = IndeksKonflik(databases=databases, kendala=kendala)
+    else:
+        # Offspring generasi ini menggantikan offspring generasi sebelumnya
+        indeks.hapus_banyak(indeks.anggota())
+    genes = GEN_MUTASI_SKS_TETAP if sks_tetap(populasi_data) else GEN_MUTASI
+    
+    # ===== CROSSOVER =====
+    while len(offspring) < target_size:
+        parent1 = seleksi_tournament(populasi, tournament_size=3, rng=rng)
+        parent2 = seleksi_tournament(populasi, tournament_size=3, rng=rng)
         
-        print(f"Gen {gen}: Best Fitness={best_fitness:.4f}, Avg Fitness={avg_fitness:.4f}, Konflik={best_konflik}")
+        children = crossover(parent1, parent2, gen, indeks, rng, databases)
         
-        # ===== EARLY STOPPING (OPTIONAL) =====
-        if early_stopping:
-            MIN_GENERATIONS = 5
-            if gen >= MIN_GENERATIONS and best_fitness >= 0.99 and best_konflik == 0:
-                print(f"✓ Optimal solution found at generation {gen} (early stopping)!")
-                break
+        for child in children:
+            if len(offspring) < target_size:
+                offspring.append(child)
+            else:
+                indeks.hapus(child)
+    
+    # ===== MUTATION =====
+    current_rate = rate_mutasi(mutation_rate, gen, pemanasan)
+    
+    for child in offspring:
+        mutasi(child, current_rate, databases, indeks, genes, rng)
+    
+    # ===== REMOVE DUPLICATES =====
+    ada = set()
+    offspring = remove_duplicates(offspring, indeks, seen=ada)
+    
+    # ===== FILL MISSING (DETERMINISTIC, SATU PASS) =====
+    # Signature input yang hilang diisi sesuai urutan input sampai ukuran target
+    fillers = isi_signature_hilang(
+        indeks_sig, populasi_data, databases, gen, ada,
+        kode_filler=lambda key: f"G{gen}_FILL{rng.randint(100, 999)}",
+        batas=target_size - len(offspring),
+        rng=rng
+    )
+    for filler in fillers:
+        offspring.append(filler)
+        indeks.tambah(filler)
+    
+    # ===== EVALUATION =====
+    # Hanya kromosom yang bucket-nya berubah yang di-skor ulang
+    indeks.perbarui_skor()
+    
+    # ===== LOCAL SEARCH (OPTIONAL) =====
+    if repair_budget is not None:
+        perbaiki_konflik(offspring, indeks, databases, repair_budget, rng)
+    
+    # ===== ELITISM REPLACEMENT =====
+    return elitism_replacement(populasi, offspring, elite_size)
+
+
+def catat_generasi(history, populasi, gen):
+    """
+    Catat statistik fitness & konflik satu generasi ke history
+    (total_konflik = jumlah konflik semua kromosom = konflik seluruh jadwal)
     
-    # ========== VALIDATION: ENSURE COMPLETE POPULATION ==========
+    Returns:
+        Tuple (best_fitness, avg_fitness, best_konflik)
+    """
+    fitness_values = [k['fitness'] for k in populasi]
+    konflik_values = [k['konflik'] for k in populasi]
+    
+    best_fitness = max(fitness_values)
+    avg_fitness = sum(fitness_values) / len(fitness_values)
+    worst_fitness = min(fitness_values)
+    best_konflik = min(konflik_values)
+    
+    history['best_fitness'].append(round(best_fitness, 4))
+    history['avg_fitness'].append(round(avg_fitness, 4))
+    history['worst_fitness'].append(round(worst_fitness, 4))
+    history['best_konflik'].append(best_konflik)
+    history['total_konflik'].append(sum(konflik_values))
+    history['generations'].append(gen)
+    
+    return best_fitness, avg_fitness, best_konflik
+
+
+def buat_event_generasi(history, total_generations, best_solution=None, total_konflik=None, evaluations=None):
+    """
+    Snapshot ringan untuk generasi terakhir di history
+    
+    Args:
+        total_konflik: Total konflik jadwal yang sedang dievolusi (jumlah
+                       konflik semua kromosomnya), None jika tidak diketahui
+        evaluations: Jumlah evaluasi kumulatif sejak awal run (lihat max_evaluations
+                     di evolve), None jika tidak dihitung
+    
+    Returns:
+        Dictionary {generation, total_generations, best_fitness, avg_fitness,
+        worst_fitness, best_konflik, total_konflik, evaluations, best_solution}
+    """
+    return {
+        'generation': history['generations'][-1],
+        'total_generations': total_generations,
+        'best_fitness': history['best_fitness'][-1],
+        'avg_fitness': history['avg_fitness'][-1],
+        'worst_fitness': history['worst_fitness'][-1],
+        'best_konflik': history['best_konflik'][-1],
+        'total_konflik': total_konflik,
+        'evaluations': evaluations,
+        'best_solution': best_solution
+    }
+
+
+def buat_history():
+    """
+    History tracking kosong
+    
+    Sama untuk semua engine: best_konflik = konflik terkecil satu mata kuliah,
+    total_konflik = total konflik jadwal (engine per jadwal: jadwal terbaik)
+    """
+    return {
+        'best_fitness': [],
+        'avg_fitness': [],
+        'worst_fitness': [],
+        'best_konflik': [],
+        'total_konflik': [],
+        'generations': []
+    }
+
+
+def lengkapi_populasi(populasi, populasi_data, databases, gen, indeks_sig=None, kendala=None, rng=random):
+    """
+    Pastikan populasi memuat semua signature input
+    Signature yang hilang diisi kromosom FINAL_<kode> lalu populasi dievaluasi ulang
+    
+    Args:
+        indeks_sig: Hasil buat_indeks_signature (opsional, dipakai ulang dari run)
+        kendala: RegistriKendala soft constraint (opsional)
+        rng: random.Random per run (default: modul random)
+    
+    Returns:
+        Populasi lengkap
+    """
     # Make sure populasi has all input signatures
     expected_size = len(populasi_data)
     actual_size = len(populasi)
     
     if actual_size < expected_size:
-        print(f"[INFO] Filling missing chromosomes ({actual_size}/{expected_size})...")
-        
-        # Get existing signatures
-        existing_sigs = {(k['data'][0], k['data'][1], k['data'][2]) for k in populasi}
-        
-        # Find and fill missing
-        for key, data in populasi_data.items():
-            sig = (data[0], data[1], data[2])
-            if sig not in existing_sigs:
-                filler = {
-                    'kode': f"FINAL_{key}",
-                    'data': [
-                        data[0], data[1], data[2],
-                        random.choice(databases['sks']),
-                        random.choice(databases['hari']),
-                        random.choice(databases['waktu']),
-                        random.choice(databases['ruangan'])
-                    ],
-                    'generation': gen,
-                    'konflik': 0,
-                    'fitness': 0.0
-                }
-                populasi.append(filler)
-                existing_sigs.add(sig)
+        logger.info("Filling missing chromosomes (%d/%d)...", actual_size, expected_size)
+        
+        if indeks_sig is None:
+            indeks_sig = buat_indeks_signature(populasi_data)
+        
+        existing_sigs = {signature(k) for k in populasi}
+        populasi.extend(isi_signature_hilang(
+            indeks_sig, populasi_data, databases, gen, existing_sigs,
+            kode_filler=lambda key: f"FINAL_{key}",
+            rng=rng
+        ))
         
         # Re-evaluate after filling
-        populasi = evaluasi_populasi(populasi)
-        print(f"[INFO] Population size after validation: {len(populasi)}/{expected_size}")
+        populasi = evaluasi_populasi(populasi, databases, kendala)
+        logger.info("Population size after validation: %d/%d", len(populasi), expected_size)
     
-    # ========== FINALIZATION ==========
+    return populasi
+
+
+def rangkum_hasil(populasi_awal, populasi, history, total_generations, parameters, generasi_terbaik=None):
+    """
+    Susun dictionary hasil GA (format yang dipakai halaman Results)
+    
+    Args:
+        generasi_terbaik: Generasi asal populasi (default: total_generations); berbeda
+                          jika run dipotong dan populasi terbaik sejauh ini yang dikembalikan
+    
+    Returns:
+        Dictionary hasil GA lengkap
+    """
     best_solution = max(populasi, key=lambda x: x['fitness'])
     best_initial = max(populasi_awal, key=lambda x: x['fitness'])
     
@@ -457,72 +1503,781 @@ def run_genetic_algorithm(populasi_data, databases,
         'best_initial': best_initial,
         'improvement': improvement,
         'history': history,
-        'total_generations': gen,
-        'parameters': {
-            'generations': generations,
-            'mutation_rate': mutation_rate,
-            'elite_size': elite_size,
-            'population_size': len(populasi),
-            'early_stopping': early_stopping
-        }
+        'total_generations': total_generations,
+        'generasi_terbaik': total_generations if generasi_terbaik is None else generasi_terbaik,
+        'parameters': parameters
+    }
+
+
+# ========== STOPPING & ADAPTASI ==========
+
+# Alasan berhenti (hasil['stop_reason'])
+STOP_GENERATIONS = 'generations'   # semua generasi dijalankan
+STOP_OPTIMAL = 'optimal'           # early_stopping: solusi tanpa konflik
+STOP_STAGNATION = 'stagnation'     # patience generasi tanpa perbaikan
+STOP_TIME_LIMIT = 'time_limit'     # max_seconds terlampaui
+STOP_EVALUATION_LIMIT = 'evaluation_limit'  # max_evaluations terlampaui
+STOP_CANCELLED = 'cancelled'       # consumer menghentikan generator
+
+# Adaptasi (adaptive=True, engine python)
+AMBANG_KERAGAMAN = 0.5   # keragaman slot di bawah ini dianggap kolaps
+STAGNASI_ADAPTIF = 3     # generasi tanpa perbaikan sebelum adaptasi
+BOOST_MUTASI = 2.0       # pengali mutation rate per adaptasi beruntun
+FRAKSI_IMIGRAN = 0.1     # fraksi kromosom terburuk yang diganti immigrant
+
+
+class PemantauStagnasi:
+    """
+    Pantau perbaikan antar generasi dan budget run (jam monotonic, jumlah evaluasi)
+    
+    Generasi dianggap membaik jika best_konflik, total_konflik (jika
+    diketahui), atau best_fitness lebih baik dari semua generasi sebelumnya.
+    """
+    
+    def __init__(self, patience=None, max_seconds=None, max_evaluations=None):
+        """
+        Args:
+            patience: Berhenti setelah N generasi tanpa perbaikan (None = nonaktif)
+            max_seconds: Berhenti setelah N detik (None = nonaktif)
+            max_evaluations: Berhenti setelah N evaluasi (None = nonaktif)
+        """
+        self.patience = patience
+        self.max_seconds = max_seconds
+        self.max_evaluations = max_evaluations
+        self.mulai = time.monotonic()
+        self.stagnan = 0
+        self._konflik = self._total = float('inf')
+        self._fitness = float('-inf')
+    
+    def catat(self, best_konflik, best_fitness, total_konflik=None, evaluations=None):
+        """
+        Catat statistik satu generasi
+        
+        Args:
+            evaluations: Jumlah evaluasi kumulatif (None = tidak dihitung)
+        
+        Returns:
+            Alasan berhenti (STOP_STAGNATION / STOP_TIME_LIMIT /
+            STOP_EVALUATION_LIMIT) atau None
+        """
+        membaik = False
+        if best_konflik < self._konflik:
+            self._konflik, membaik = best_konflik, True
+        if total_konflik is not None and total_konflik < self._total:
+            self._total, membaik = total_konflik, True
+        if best_fitness > self._fitness:
+            self._fitness, membaik = best_fitness, True
+        self.stagnan = 0 if membaik else self.stagnan + 1
+        
+        if self.patience is not None and self.stagnan >= self.patience:
+            return STOP_STAGNATION
+        if self.max_seconds is not None and time.monotonic() - self.mulai >= self.max_seconds:
+            return STOP_TIME_LIMIT
+        if (self.max_evaluations is not None and evaluations is not None
+                and evaluations >= self.max_evaluations):
+            return STOP_EVALUATION_LIMIT
+        return None
+
+
+def alasan_selesai(hasil):
+    """Alasan berhenti untuk run yang selesai sendiri (semua generasi atau early_stopping)"""
+    if hasil['total_generations'] < hasil['parameters']['generations']:
+        return STOP_OPTIMAL
+    return STOP_GENERATIONS
+
+
+def pantau_solver(stream, pemantau, cancel_event=None):
+    """
+    Bungkus generator solver dengan PemantauStagnasi
+    
+    Snapshot diteruskan apa adanya; jika consumer, cancel_event (Event yang
+    sudah di-set, mis. dari run_many di proses lain) atau pemantau meminta
+    berhenti, solver dihentikan lewat send(True) dan mengembalikan hasil
+    terbaik sejauh ini. Hasil akhir ditambah key 'stop_reason' dan
+    'evaluations' (kecuali solver sudah mencatatnya sendiri, mis. island yang
+    menghitung satu epoch sekaligus); patience dan budget dicatat di parameters.
+    """
+    alasan = None
+    evaluations = 0
+    try:
+        snapshot = next(stream)
+        while True:
+            evaluations = snapshot['evaluations']
+            if (yield snapshot) or (cancel_event is not None and cancel_event.is_set()):
+                alasan = STOP_CANCELLED
+            else:
+                alasan = pemantau.catat(snapshot['best_konflik'], snapshot['best_fitness'],
+                                        snapshot['total_konflik'], evaluations)
+            snapshot = stream.send(alasan is not None)
+    except StopIteration as selesai:
+        hasil = selesai.value
+    hasil['parameters'].update(patience=pemantau.patience, max_seconds=pemantau.max_seconds,
+                               max_evaluations=pemantau.max_evaluations)
+    hasil['stop_reason'] = alasan or alasan_selesai(hasil)
+    hasil.setdefault('evaluations', evaluations)
+    return hasil
+
+
+def keragaman_slot(populasi, databases):
+    """
+    Keragaman populasi: jumlah slot (hari, waktu, ruangan) berbeda dibagi
+    jumlah maksimum yang mungkin (ukuran populasi atau kapasitas slot)
+    
+    Returns:
+        Nilai 0.0 - 1.0 (1.0 = setiap kromosom di slot berbeda)
+    """
+    kapasitas = len(set(databases['hari'])) * len(set(databases['waktu'])) * len(set(databases['ruangan']))
+    batas = min(len(populasi), kapasitas)
+    if not batas:
+        return 1.0
+    return len({(k['data'][4], k['data'][5], k['data'][6]) for k in populasi}) / batas
+
+
+def suntik_imigran(populasi, populasi_data, databases, gen, indeks_sig=None, kendala=None, rng=random):
+    """
+    Ganti FRAKSI_IMIGRAN kromosom terburuk dengan immigrant untuk signature
+    yang sama (slot acak baru), lalu evaluasi ulang; setiap signature input
+    tetap muncul tepat satu kali
+    
+    Args:
+        indeks_sig: Hasil buat_indeks_signature (opsional, dipakai ulang dari run)
+    
+    Returns:
+        Tuple (populasi baru, jumlah immigrant)
+    """
+    if indeks_sig is None:
+        indeks_sig = buat_indeks_signature(populasi_data)
+    
+    n_imigran = max(1, round(len(populasi) * FRAKSI_IMIGRAN))
+    urutan = sorted(populasi, key=_ambil_fitness, reverse=True)
+    diganti = urutan[len(urutan) - n_imigran:]
+    ada = {signature(k) for k in urutan[:len(urutan) - n_imigran]}
+    
+    imigran = []
+    for krom in diganti:
+        sig = signature(krom)
+        key = indeks_sig.get(sig)
+        if key is None or sig in ada:
+            # Signature di luar input (tidak terjadi pada populasi dari evolve): pertahankan
+            imigran.append(krom)
+            continue
+        imigran.append(Kromosom(f"G{gen}_IMM_{key}", buat_gen_acak(populasi_data[key], databases, rng), gen))
+        ada.add(sig)
+    
+    populasi = urutan[:len(urutan) - n_imigran] + imigran
+    return evaluasi_populasi(populasi, databases, kendala), n_imigran
+
+
+# Solver per engine: engine -> (modul, generator, parameter evolve yang diteruskan).
+# Setiap solver menerima (populasi_data, databases, generations=..., early_stopping=...,
+# **parameter), membuat generator acak sendiri dari seed, yield buat_event_generasi
+# per generasi, berhenti dan mengembalikan hasil terbaik sejauh ini jika menerima
+# send(True), lalu mengembalikan dictionary rangkum_hasil (history, best_solution, ...).
+# Kemampuan opsional (KEMAMPUAN) didukung solver jika namanya ada di daftar parameter.
+SOLVER = {
+    'python': ('utils.genetic_algorithm', 'evolve_python',
+               ('mutation_rate', 'elite_size', 'seeding', 'random_fraction', 'seed',
+                'kendala', 'repair_budget', 'adaptive', 'patience')),
+    'numpy': ('utils.ga_numpy', 'evolve_numpy',
+              ('mutation_rate', 'elite_size', 'seeding', 'random_fraction', 'seed')),
+    'jadwal': ('utils.ga_jadwal', 'evolve_jadwal',
+               ('mutation_rate', 'elite_size', 'population_size', 'seeding', 'random_fraction', 'seed')),
+    'annealing': ('utils.lokal', 'evolve_annealing', ('seeding', 'random_fraction', 'seed')),
+    'tabu': ('utils.lokal', 'evolve_tabu', ('seeding', 'random_fraction', 'seed')),
+    'island': ('utils.island', 'evolve_island',
+               ('mutation_rate', 'elite_size', 'seeding', 'random_fraction', 'seed', 'kendala', 'repair_budget',
+                'n_islands', 'migration_interval', 'migration_size'))
+}
+ENGINES = tuple(SOLVER)
+
+# Parameter opsional yang hanya didukung sebagian solver -> nama untuk pesan error
+KEMAMPUAN = {
+    'kendala': 'Soft constraint',
+    'repair_budget': 'Repair min-conflicts',
+    'adaptive': 'Mutasi adaptif'
+}
+
+
+def ambil_solver(engine):
+    """
+    Generator evolve untuk engine di SOLVER (modul di-import saat dipakai)
+    
+    Returns:
+        Tuple (fungsi generator, nama parameter evolve yang diteruskan)
+    """
+    if engine not in SOLVER:
+        raise ValueError(f"Engine tidak dikenal: {engine}")
+    import importlib
+    
+    modul, fungsi, parameter = SOLVER[engine]
+    return getattr(importlib.import_module(modul), fungsi), parameter
+
+
+def kemampuan_engine(engine):
+    """Nama KEMAMPUAN yang didukung engine (tanpa meng-import modulnya)"""
+    return frozenset(nama for nama in KEMAMPUAN if nama in SOLVER[engine][2])
+
+
+def evolve_python(populasi_data, databases,
+                  generations=10,
+                  mutation_rate=0.15,
+                  elite_size=2,
+                  early_stopping=False,
+                  kendala=None,
+                  repair_budget=None,
+                  seeding='random',
+                  random_fraction=0.2,
+                  adaptive=False,
+                  patience=None,
+                  seed=None,
+                  rng=None):
+    """
+    Generator GA per kromosom (engine 'python', lihat SOLVER)
+    
+    Satu kromosom per input; setiap generasi dijalankan jalankan_generasi.
+    Penghentian (patience, budget, pembatalan) diatur pemanggil lewat
+    send(True), lihat evolve dan pantau_solver.
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi(, sks(, kelas))]}
+        databases: Dictionary pilihan valid
+        generations: Jumlah generasi (default: 10)
+        mutation_rate: Probabilitas mutasi (default: 0.15)
+        elite_size: Jumlah elite (default: 2)
+        early_stopping: Stop jika optimal (default: False)
+        kendala: RegistriKendala soft constraint (opsional)
+        repair_budget: Detik per generasi untuk repair min-conflicts (default: None = nonaktif)
+        seeding: Populasi awal 'random' (default) atau 'greedy'
+        random_fraction: Fraksi kromosom acak untuk seeding 'greedy' (default: 0.2)
+        adaptive: Mutasi adaptif + immigrant saat stagnan (default: False)
+        patience: Patience run (hanya untuk ambang adaptasi, default: None)
+        seed: Seed generator acak (default: None = entropi OS)
+        rng: random.Random (default: random.Random(seed))
+    
+    Yields:
+        Snapshot per generasi (evaluations = jumlah kromosom yang dievaluasi)
+    
+    Returns:
+        Dictionary hasil GA lengkap, ditambah 'kendala_lunak' (jika kendala dipakai)
+        dan 'adaptasi' (jika adaptive). Jika dihentikan lewat send(True), populasi
+        dengan total konflik terkecil sejauh ini yang dikembalikan
+    """
+    rng = rng if rng is not None else random.Random(seed)
+    
+    # ========== INITIALIZATION ==========
+    populasi = buat_populasi_awal(populasi_data, databases, seeding, random_fraction, rng)
+    populasi = evaluasi_populasi(populasi, databases, kendala)
+    populasi_awal = [krom.salin() for krom in populasi]
+    indeks_sig = buat_indeks_signature(populasi_data)
+    # Indeks offspring (dan running total penalti) dipakai ulang setiap generasi
+    indeks = IndeksKonflik(databases=databases, kendala=kendala)
+    evaluations = len(populasi)
+    
+    # Populasi terbaik sejauh ini (disalin: evaluasi ulang mengubah skor kromosom elite);
+    # hanya dari generasi yang tercatat di history, agar ringkasan cocok dengan populasi akhir
+    terbaik = None
+    kunci_terbaik = (float('inf'), float('inf'))
+    gen_terbaik = 0
+    
+    # History tracking
+    history = buat_history()
+    gen = gen_populasi = 0
+    boost = 1.0
+    adaptasi = []
+    # Stagnasi untuk adaptasi; adaptasi harus sempat berjalan sebelum patience menghentikan run
+    stagnasi = PemantauStagnasi()
+    ambang_stagnan = STAGNASI_ADAPTIF if patience is None else max(1, min(STAGNASI_ADAPTIF, patience // 2))
+    
+    # ========== EVOLUTION ==========
+    for gen in range(1, generations + 1):
+        evaluations += len(populasi)
+        # Adaptive mengatur mutation rate sendiri: tanpa pemanasan generasi awal
+        populasi = jalankan_generasi(populasi, populasi_data, databases, gen, mutation_rate * boost, elite_size,
+                                     indeks_sig, kendala, repair_budget, rng, pemanasan=not adaptive,
+                                     indeks=indeks)
+        
+        # ===== TRACKING =====
+        best_fitness, avg_fitness, best_konflik = catat_generasi(history, populasi, gen)
+        total_konflik = history['total_konflik'][-1]
+        if (total_konflik, best_konflik) < kunci_terbaik:
+            terbaik = [krom.salin() for krom in populasi]
+            kunci_terbaik = (total_konflik, best_konflik)
+            gen_terbaik = gen
+        
+        # ===== SNAPSHOT (CONSUMER BISA MENGHENTIKAN) =====
+        best_solution = max(populasi, key=_ambil_fitness)
+        if (yield buat_event_generasi(history, generations, best_solution, total_konflik, evaluations)):
+            # Run dipotong: kembalikan terbaik sejauh ini
+            populasi, gen_populasi = terbaik, gen_terbaik
+            break
+        gen_populasi = gen
+        
+        # ===== EARLY STOPPING (OPTIONAL) =====
+        if early_stopping:
+            MIN_GENERATIONS = 5
+            if gen >= MIN_GENERATIONS and best_fitness >= 0.99 and best_konflik == 0:
+                break
+        
+        # ===== ADAPTASI (OPTIONAL) =====
+        # Keragaman kolaps / stagnan: mutasi dinaikkan bertahap dan immigrant disuntikkan
+        stagnasi.catat(best_konflik, best_fitness, total_konflik)
+        if adaptive and gen < generations:
+            keragaman = keragaman_slot(populasi, databases)
+            if keragaman < AMBANG_KERAGAMAN or stagnasi.stagnan >= ambang_stagnan:
+                boost = min(boost * BOOST_MUTASI, 1.0 / max(mutation_rate, 1e-9))
+                populasi, n_imigran = suntik_imigran(populasi, populasi_data, databases, gen,
+                                                     indeks_sig, kendala, rng)
+                evaluations += len(populasi)
+                adaptasi.append({'generation': gen, 'keragaman': round(keragaman, 4),
+                                 'mutation_rate': round(mutation_rate * boost, 4), 'immigrants': n_imigran})
+            else:
+                boost = 1.0
+    
+    # ========== VALIDATION: ENSURE COMPLETE POPULATION ==========
+    populasi = lengkapi_populasi(populasi, populasi_data, databases, gen, indeks_sig, kendala, rng)
+    
+    # ========== FINALIZATION ==========
+    hasil = rangkum_hasil(populasi_awal, populasi, history, gen, {
+        'generations': generations,
+        'mutation_rate': mutation_rate,
+        'elite_size': elite_size,
+        'population_size': len(populasi),
+        'early_stopping': early_stopping,
+        'engine': 'python',
+        'repair_budget': repair_budget,
+        'seeding': seeding,
+        'random_fraction': random_fraction,
+        'adaptive': adaptive,
+        'seed': seed
+    }, generasi_terbaik=gen_populasi)
+    if adaptive:
+        hasil['adaptasi'] = adaptasi
+    if kendala:
+        hasil['kendala_lunak'] = kendala.rangkum(populasi, databases)
+    return hasil
+
+
+def _aktif(nilai):
+    """True jika parameter kemampuan opsional diisi (None / False = nonaktif)"""
+    return nilai is not None and nilai is not False
+
+
+def evolve(populasi_data, databases,
+           generations=10,
+           mutation_rate=0.15,
+           elite_size=2,
+           early_stopping=False,
+           engine='python',
+           kendala=None,
+           population_size=30,
+           repair_budget=None,
+           seeding='random',
+           random_fraction=0.2,
+           patience=None,
+           max_seconds=None,
+           max_evaluations=None,
+           adaptive=False,
+           seed=None,
+           n_islands=4,
+           migration_interval=5,
+           migration_size=2,
+           cancel_event=None):
+    """
+    Generator evolusi GA: yield satu snapshot ringan per generasi
+    
+    Snapshot berisi generation, best/avg/worst fitness, best_konflik,
+    total_konflik, dan best_solution generasi itu (lihat buat_event_generasi).
+    Populasi antar generasi tidak disimpan. Consumer boleh berhenti kapan
+    saja; untuk berhenti sekaligus mendapat hasil lengkap, kirim True lewat
+    stream.send(True) (atau pakai habiskan dengan callback). Saat selesai,
+    generator mengembalikan dictionary hasil GA (StopIteration.value).
+    Setiap engine adalah solver di SOLVER yang dibungkus pantau_solver.
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}; elemen ke-4
+                       opsional berisi SKS tetap (menentukan span slot waktu),
+                       elemen ke-5 opsional berisi kelas (konflik kohort)
+        databases: Dictionary pilihan valid
+        generations: Jumlah generasi (default: 10)
+        mutation_rate: Probabilitas mutasi (default: 0.15)
+        elite_size: Jumlah elite (default: 2)
+        early_stopping: Stop jika optimal (default: False)
+        engine: 'python' (default, lihat evolve_python), 'numpy' (populasi array,
+                lihat utils.ga_numpy), 'jadwal' (individu = jadwal utuh, lihat
+                utils.ga_jadwal), solver trajectory 'annealing' / 'tabu' (lihat
+                utils.lokal), atau 'island' (model pulau multi-core, lihat
+                utils.island); daftar di SOLVER
+        kendala: RegistriKendala soft constraint (opsional, kemampuan 'kendala');
+                 konflik tetap jumlah hard constraint, fitness ikut penalti
+        population_size: Jumlah jadwal per populasi untuk engine 'jadwal' (default: 30);
+                         engine lain memakai satu kromosom per input
+        repair_budget: Detik per generasi untuk repair min-conflicts (default: None =
+                       nonaktif; kemampuan 'repair_budget', lihat perbaiki_konflik)
+        seeding: Populasi awal 'random' (default) atau 'greedy' (lihat buat_populasi_greedy)
+        random_fraction: Fraksi acak untuk seeding 'greedy' (default: 0.2): fraksi
+                         kromosom untuk engine per kromosom, fraksi jadwal untuk 'jadwal'
+        patience: Berhenti setelah N generasi tanpa perbaikan (default: None = nonaktif)
+        max_seconds: Berhenti setelah N detik, dicek di batas generasi (default: None)
+        max_evaluations: Berhenti setelah N evaluasi, dicek di batas generasi (default:
+                         None). Satuan evaluasi per engine: satu kromosom (python, numpy,
+                         island), satu jadwal utuh (jadwal), atau satu langkah (annealing, tabu).
+                         Engine island menghitung satu epoch sekaligus, jadi patience dan
+                         budget berlaku di akhir epoch
+        adaptive: Saat keragaman slot kolaps atau stagnan STAGNASI_ADAPTIF generasi
+                  (paling lama patience // 2), naikkan mutation rate dan suntikkan
+                  immigrant (default: False, kemampuan 'adaptive')
+        seed: Seed generator acak run ini (default: None = diambil dari modul random).
+              Setiap run memakai random.Random sendiri (engine numpy/jadwal:
+              numpy Generator), sehingga run paralel di thread lain tidak saling
+              mengganggu; seed yang dipakai dicatat di parameters['seed']
+        n_islands: Jumlah pulau untuk engine 'island' (default: 4)
+        migration_interval: Migrasi setiap N generasi untuk engine 'island' (default: 5)
+        migration_size: Jumlah migran per pulau untuk engine 'island' (default: 2)
+        cancel_event: Event pembatalan (threading.Event atau Manager().Event());
+                      dicek di batas generasi, bila di-set run dibatalkan (default: None)
+    
+    Yields:
+        Snapshot per generasi
+    
+    Returns:
+        Dictionary hasil GA lengkap, ditambah 'stop_reason' (STOP_*), 'evaluations',
+        dan 'kendala_lunak' (total penalti per kendala populasi akhir, jika kendala dipakai).
+        Run yang dipotong (budget, stagnasi, atau dibatalkan) mengembalikan populasi
+        dengan total konflik terkecil sejauh ini, bukan populasi generasi terakhir
+    
+    Raises:
+        ValueError: Engine tidak dikenal atau kemampuan yang diminta tidak didukung engine
+    """
+    solver, parameter = ambil_solver(engine)
+    pemantau = PemantauStagnasi(patience, max_seconds, max_evaluations)
+    if seed is None:
+        # random.seed() di pemanggil tetap menentukan run; seed dicatat agar run bisa diulang
+        seed = random.getrandbits(32)
+    opsi = {'mutation_rate': mutation_rate, 'elite_size': elite_size, 'population_size': population_size,
+            'seeding': seeding, 'random_fraction': random_fraction, 'seed': seed, 'kendala': kendala,
+            'repair_budget': repair_budget, 'adaptive': adaptive, 'patience': patience,
+            'n_islands': n_islands, 'migration_interval': migration_interval, 'migration_size': migration_size}
+    for nama, label in KEMAMPUAN.items():
+        if _aktif(opsi[nama]) and nama not in parameter:
+            raise ValueError(f"{label} belum didukung engine {engine}")
+    
+    return (yield from pantau_solver(solver(
+        populasi_data, databases,
+        generations=generations,
+        early_stopping=early_stopping,
+        **{nama: opsi[nama] for nama in parameter}
+    ), pemantau, cancel_event))
+
+
+def habiskan(stream, on_generation=None):
+    """
+    Konsumsi generator evolve sampai selesai
+    
+    Args:
+        stream: Generator dari evolve
+        on_generation: Callback(snapshot) per generasi; jika mengembalikan
+                       True, evolusi dihentikan dan hasil sejauh ini dikembalikan
+    
+    Returns:
+        Dictionary hasil GA lengkap
+    """
+    try:
+        snapshot = next(stream)
+        while True:
+            berhenti = on_generation is not None and bool(on_generation(snapshot))
+            snapshot = stream.send(berhenti)
+    except StopIteration as selesai:
+        return selesai.value
+
+
+def run_genetic_algorithm(populasi_data, databases, 
+                          generations=10, 
+                          mutation_rate=0.15,
+                          elite_size=2,
+                          early_stopping=False,
+                          engine='python',
+                          on_generation=None,
+                          kendala=None,
+                          population_size=30,
+                          repair_budget=None,
+                          seeding='random',
+                          random_fraction=0.2,
+                          patience=None,
+                          max_seconds=None,
+                          max_evaluations=None,
+                          adaptive=False,
+                          seed=None,
+                          n_islands=4,
+                          migration_interval=5,
+                          migration_size=2,
+                          cancel_event=None):
+    """
+    Algoritma Genetika OPTIMIZED untuk penjadwalan
+    Wrapper yang menghabiskan generator evolve
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
+        databases: Dictionary pilihan valid
+        generations: Jumlah generasi (default: 10)
+        mutation_rate: Probabilitas mutasi (default: 0.15)
+        elite_size: Jumlah elite (default: 2)
+        early_stopping: Stop jika optimal (default: False) ✅ BARU
+        engine: Salah satu ENGINES: 'python' (default), 'numpy', 'jadwal',
+                'annealing', 'tabu', atau 'island' (lihat evolve)
+        on_generation: Callback(snapshot) setiap generasi selesai (lihat buat_event_generasi);
+                       jika mengembalikan True, evolusi dihentikan (dibatalkan)
+        kendala: RegistriKendala soft constraint (opsional, lihat utils.kendala)
+        population_size: Jumlah jadwal per populasi untuk engine 'jadwal' (default: 30)
+        repair_budget: Detik per generasi untuk repair min-conflicts (default: None = nonaktif)
+        seeding: Populasi awal 'random' (default) atau 'greedy'
+        random_fraction: Fraksi acak untuk seeding 'greedy' (default: 0.2)
+        patience: Berhenti setelah N generasi tanpa perbaikan (default: None = nonaktif)
+        max_seconds: Batas waktu run dalam detik (default: None = tanpa batas)
+        max_evaluations: Batas jumlah evaluasi (default: None = tanpa batas, satuan lihat evolve)
+        adaptive: Mutasi adaptif + immigrant saat stagnan (default: False, engine python)
+        seed: Seed run (default: None = acak); seed yang sama + parameter sama = hasil sama,
+              kecuali batas berbasis waktu (repair_budget, max_seconds) memotong lebih awal
+        n_islands: Jumlah pulau untuk engine 'island' (default: 4)
+        migration_interval: Migrasi setiap N generasi untuk engine 'island' (default: 5)
+        migration_size: Jumlah migran per pulau untuk engine 'island' (default: 2)
+        cancel_event: Event pembatalan, dicek di batas generasi (default: None, lihat evolve)
+    
+    Returns:
+        Dictionary hasil GA lengkap (alasan berhenti di 'stop_reason')
+    """
+    return habiskan(
+        evolve(
+            populasi_data, databases,
+            generations=generations,
+            mutation_rate=mutation_rate,
+            elite_size=elite_size,
+            early_stopping=early_stopping,
+            engine=engine,
+            kendala=kendala,
+            population_size=population_size,
+            repair_budget=repair_budget,
+            seeding=seeding,
+            random_fraction=random_fraction,
+            patience=patience,
+            max_seconds=max_seconds,
+            max_evaluations=max_evaluations,
+            adaptive=adaptive,
+            seed=seed,
+            n_islands=n_islands,
+            migration_interval=migration_interval,
+            migration_size=migration_size,
+            cancel_event=cancel_event
+        ),
+        on_generation=on_generation
+    )
+
+
+def turunkan_seed(seed, n):
+    """
+    Seed untuk n run / worker independen, diturunkan dari satu seed induk
+    
+    Args:
+        seed: Seed induk (None = dari modul random)
+        n: Jumlah seed turunan
+    
+    Returns:
+        List n seed 32-bit; seed induk sama = daftar sama
+    """
+    induk = random if seed is None else random.Random(seed)
+    return [induk.getrandbits(32) for _ in range(n)]
+
+
+def _jalankan_restart(args):
+    """Worker run_many: satu run GA independen dengan seed sendiri"""
+    populasi_data, databases, seed, ga_params = args
+    return run_genetic_algorithm(populasi_data, databases, seed=seed, **ga_params)
+
+
+def _ringkas_run(run, seed, hasil):
+    """Ringkasan satu run untuk tabel restart"""
+    return dict(
+        run=run, seed=seed,
+        total_konflik=sum(k['konflik'] for k in hasil['populasi_akhir']),
+        **get_summary_stats(hasil)
+    )
+
+
+def run_many(populasi_data, databases, n_runs=4, seeds=None, workers=None,
+             on_run_complete=None, seed=None, cancel_event=None, **ga_params):
+    """
+    Jalankan beberapa run GA independen (multi-restart) secara paralel
+    dan ambil hasil terbaik
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
+        databases: Dictionary pilihan valid
+        n_runs: Jumlah restart (default: 4)
+        seeds: List seed per run (default: turunkan_seed(seed, n_runs))
+        workers: Jumlah proses (default: min(n_runs, jumlah CPU)); 1 = tanpa process pool
+        on_run_complete: Callback(ringkasan_run) setiap run selesai; jika
+                         mengembalikan True, run yang belum mulai dibatalkan dan
+                         run yang sedang berjalan berhenti di batas generasi berikutnya
+        seed: Seed induk untuk seed per run (default: None = acak)
+        cancel_event: threading.Event pembatalan dari pemanggil (default: None); bila
+                      di-set, run yang belum mulai dibatalkan dan run yang sedang
+                      berjalan berhenti di batas generasi berikutnya dengan hasil sejauh ini
+        **ga_params: Parameter lain untuk run_genetic_algorithm
+    
+    Returns:
+        Dictionary hasil GA terbaik, ditambah key 'restarts' berisi
+        ringkasan get_summary_stats setiap run yang selesai. Bila dibatalkan
+        sebelum satu run pun mulai, run pertama dijalankan sampai batas
+        generasi pertamanya sehingga hasil selalu berisi minimal satu run
+    
+    Raises:
+        ValueError: Jika n_runs kurang dari 1 atau jumlah seeds tidak sama dengan n_runs
+    """
+    if n_runs < 1:
+        raise ValueError(f"n_runs harus minimal 1 (diterima {n_runs})")
+    if seeds is None:
+        seeds = turunkan_seed(seed, n_runs)
+    if len(seeds) != n_runs:
+        raise ValueError(f"Jumlah seed ({len(seeds)}) harus sama dengan n_runs ({n_runs})")
+    
+    workers = workers or min(n_runs, os.cpu_count() or 1)
+    selesai = {}
+    
+    def _catat(i, hasil):
+        selesai[i] = hasil
+        ringkasan = dict(_ringkas_run(i + 1, seeds[i], hasil), n_runs=n_runs, n_selesai=len(selesai))
+        return on_run_complete is not None and on_run_complete(ringkasan)
+    
+    if workers <= 1:
+        params = dict(ga_params, cancel_event=cancel_event)
+        for i, seed in enumerate(seeds):
+            if _catat(i, _jalankan_restart((populasi_data, databases, seed, params))):
+                break
+            if cancel_event is not None and cancel_event.is_set():
+                break
+    else:
+        # Import di sini: multiprocessing mahal dan tidak dibutuhkan run tunggal
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        from multiprocessing import Manager
+        
+        with Manager() as manager:
+            # Event lintas proses: dicek evolve di setiap batas generasi worker
+            batal = manager.Event()
+            params = dict(ga_params, cancel_event=batal)
+            executor = ProcessPoolExecutor(max_workers=workers)
+            try:
+                futures = {executor.submit(_jalankan_restart, (populasi_data, databases, seed, params)): i
+                           for i, seed in enumerate(seeds)}
+                berjalan = set(futures)
+                while berjalan:
+                    # Timeout pendek agar cancel_event pemanggil ikut dicek selama menunggu
+                    done, berjalan = wait(berjalan, timeout=0.1, return_when=FIRST_COMPLETED)
+                    hentikan = [_catat(futures[f], f.result()) for f in done if not f.cancelled()]
+                    if cancel_event is not None and cancel_event.is_set():
+                        # Run yang sedang berjalan tetap ditunggu: berhenti dalam satu
+                        # generasi dan hasil sejauh ini ikut dibandingkan
+                        batal.set()
+                        for pending in berjalan:
+                            pending.cancel()
+                    elif any(hentikan):
+                        break
+            finally:
+                # Run yang belum mulai dibuang; run yang sedang berjalan berhenti
+                # sendiri di batas generasi berikutnya, tidak perlu ditunggu
+                batal.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    if not selesai:
+        # Semua run dibatalkan sebelum mulai: cancel_event sudah di-set, jadi
+        # run pertama berhenti di batas generasi pertama dengan status dibatalkan
+        params = dict(ga_params, cancel_event=cancel_event)
+        _catat(0, _jalankan_restart((populasi_data, databases, seeds[0], params)))
+    
+    runs = [_ringkas_run(i + 1, seeds[i], selesai[i]) for i in sorted(selesai)]
+    
+    # Terbaik: konflik solusi terbaik, lalu total konflik populasi akhir paling kecil
+    best_run = min(
+        runs,
+        key=lambda r: (r['final_konflik'], r['total_konflik'], -r['final_avg_fitness'])
+    )
+    
+    best = selesai[best_run['run'] - 1]
+    best['restarts'] = {
+        'n_runs': n_runs,
+        'workers': workers,
+        'best_run': best_run['run'],
+        'runs': runs
     }
+    
+    return best
 
 
 # ========== HELPER FUNCTIONS ==========
 
 def get_summary_stats(results):
-    """Get statistik ringkasan dari hasil GA"""
+    """
+    Get statistik ringkasan dari hasil GA
+    
+    Nilai final_* diambil dari generasi populasi akhir (generasi_terbaik),
+    bukan generasi terakhir yang dijalankan: run yang dipotong mengembalikan
+    populasi terbaik sejauh ini
+    """
     history = results['history']
+    i = history['generations'].index(results.get('generasi_terbaik', results['total_generations']))
     
     return {
         'initial_best_fitness': history['best_fitness'][0],
-        'final_best_fitness': history['best_fitness'][-1],
+        'final_best_fitness': history['best_fitness'][i],
         'initial_avg_fitness': history['avg_fitness'][0],
-        'final_avg_fitness': history['avg_fitness'][-1],
+        'final_avg_fitness': history['avg_fitness'][i],
         'initial_konflik': history['best_konflik'][0],
-        'final_konflik': history['best_konflik'][-1],
+        'final_konflik': history['best_konflik'][i],
+        'initial_total_konflik': history['total_konflik'][0],
+        'final_total_konflik': history['total_konflik'][i],
         'total_generations': results['total_generations'],
+        'generasi_terbaik': history['generations'][i],
         'fitness_improvement': round(
-            history['best_fitness'][-1] - history['best_fitness'][0], 4
+            history['best_fitness'][i] - history['best_fitness'][0], 4
         ),
-        'reached_optimal': history['best_konflik'][-1] == 0
+        'reached_optimal': history['total_konflik'][i] == 0
     }
 
 
 def format_kromosom_detail(kromosom):
     """
     Format detail kromosom untuk display
-    Struktur: [dosen, matkul, prodi, sks, hari, waktu, ruangan]
+    Struktur: [dosen, matkul, prodi, sks, hari, waktu, ruangan, kelas]
     """
     return {
         'Kode': kromosom['kode'],
         'Dosen': kromosom['data'][0],
         'Mata Kuliah': kromosom['data'][1],
         'Prodi': kromosom['data'][2],
+        'Kelas': signature(kromosom)[3],
         'SKS': kromosom['data'][3],
         'Hari': kromosom['data'][4],
         'Waktu': kromosom['data'][5],
         'Ruangan': kromosom['data'][6],
         'Fitness': kromosom['fitness'],
         'Konflik': kromosom['konflik'],
+        'Penalti': kromosom['penalti'],
         'Generasi': kromosom.get('generation', 0)
     }
 
 
 def filter_unique_dosen_matkul_prodi(populasi):
     """
-    Filter: 1 jadwal terbaik per kombinasi (dosen, matkul, prodi)
+    Filter: 1 jadwal terbaik per kombinasi (dosen, matkul, prodi, kelas)
     
     Args:
         populasi: List kromosom
     
     Returns:
-        List kromosom tanpa duplikasi (dosen, matkul, prodi)
+        List kromosom tanpa duplikasi (dosen, matkul, prodi, kelas)
     """
     unique_dict = {}
     
     for krom in populasi:
-        key = (krom['data'][0], krom['data'][1], krom['data'][2])
+        key = signature(krom)
         
         if key not in unique_dict or krom['fitness'] > unique_dict[key]['fitness']:
             unique_dict[key] = krom
@@ -558,12 +2313,14 @@ def buat_tabel_rekomendasi_jadwal(results, filter_duplicates=True):
             'Dosen': krom['data'][0],
             'Mata Kuliah': krom['data'][1],
             'Prodi': krom['data'][2],
+            'Kelas': signature(krom)[3],
             'SKS': krom['data'][3],
             'Hari': krom['data'][4],
             'Waktu': krom['data'][5],
             'Ruangan': krom['data'][6],
             'Fitness': krom['fitness'],
-            'Konflik': krom['konflik']
+            'Konflik': krom['konflik'],
+            'Penalti': krom['penalti']
         }
         tabel_rekomendasi.append(rekomendasi)
     
@@ -590,8 +2347,8 @@ def export_hasil_ga_ke_csv(results, output_file, filter_duplicates=True):
     
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
         fieldnames = [
-            'Kode', 'Dosen', 'Mata Kuliah', 'Prodi', 'SKS',
-            'Hari', 'Waktu', 'Ruangan', 'Fitness', 'Konflik', 'Generasi'
+            'Kode', 'Dosen', 'Mata Kuliah', 'Prodi', 'Kelas', 'SKS',
+            'Hari', 'Waktu', 'Ruangan', 'Fitness', 'Konflik', 'Penalti', 'Generasi'
         ]
         
         writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -603,12 +2360,14 @@ def export_hasil_ga_ke_csv(results, output_file, filter_duplicates=True):
                 'Dosen': krom['data'][0],
                 'Mata Kuliah': krom['data'][1],
                 'Prodi': krom['data'][2],
+                'Kelas': signature(krom)[3],
                 'SKS': krom['data'][3],
                 'Hari': krom['data'][4],
                 'Waktu': krom['data'][5],
                 'Ruangan': krom['data'][6],
                 'Fitness': krom['fitness'],
                 'Konflik': krom['konflik'],
+                'Penalti': krom['penalti'],
                 'Generasi': krom.get('generation', 0)
             })
     
@@ -620,6 +2379,15 @@ def export_hasil_ga_ke_csv(results, output_file, filter_duplicates=True):
 
 # ========== PARSE INPUT ==========
 
+# Pilihan slot bawaan untuk input tanpa Databases.xlsx
+DATABASES_DEFAULT = {
+    'sks': ['2', '3', '4'],
+    'hari': ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat'],
+    'waktu': ['07:00-09:00', '09:00-11:00', '11:00-13:00', '13:00-15:00', '15:00-17:00'],
+    'ruangan': ['R101', 'R102', 'R103', 'R201', 'R202', 'R203', 'Lab1', 'Lab2']
+}
+
+
 def parse_csv_input(csv_file):
     """
     Parse CSV input: Dosen, Mata Kuliah, Prodi
@@ -632,12 +2400,7 @@ def parse_csv_input(csv_file):
     """
     populasi_dict = {}
     
-    databases = {
-        'sks': ['2', '3', '4'],
-        'hari': ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat'],
-        'waktu': ['07:00-09:00', '09:00-11:00', '11:00-13:00', '13:00-15:00', '15:00-17:00'],
-        'ruangan': ['R101', 'R102', 'R103', 'R201', 'R202', 'R203', 'Lab1', 'Lab2']
-    }
+    databases = {key: list(values) for key, values in DATABASES_DEFAULT.items()}
     
     with open(csv_file, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
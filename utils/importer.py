@@ -0,0 +1,219 @@
+"""
+Import massal populasi_data dari draft penugasan (Excel) atau CSV
+
+Dibaca secara streaming (openpyxl read_only + iter_rows, csv.reader) sehingga
+memori tetap kecil untuk sheet besar, lalu dipetakan ke populasi_data dalam
+satu pass: {kode: [dosen, matkul, prodi]}, ditambah SKS mata kuliah sebagai
+elemen ke-4 jika file memuatnya (SKS tetap, menentukan span slot waktu) dan
+kelas sebagai elemen ke-5 (kohort mahasiswa untuk konflik kelas).
+"""
+
+import csv
+import io
+import os
+
+
+# ========== READERS ==========
+
+def _teks(nilai):
+    """Nilai sel -> string rapi (None jika kosong)"""
+    if nilai is None:
+        return None
+    teks = str(nilai).strip()
+    return teks or None
+
+
+def _cari_kolom(header, *kata):
+    """Index kolom pertama di header yang memuat salah satu kata (case-insensitive)"""
+    for i, nilai in enumerate(header):
+        teks = (_teks(nilai) or '').lower()
+        if any(k in teks for k in kata):
+            return i
+    return None
+
+
+def baca_draft_excel(sumber, sheet=None):
+    """
+    Baca draft penugasan dosen (format Draft_Penugasan_*.xlsx) baris per baris
+    
+    Format: baris header memuat 'Nama Dosen', 'Nama Matakuliah', 'SKS', 'Prodi',
+    dan opsional 'Kelas' (kolom SKS pertama = SKS mata kuliah).
+    Nama dosen hanya terisi pada baris pertama kelompoknya (di-forward-fill),
+    baris tanpa matakuliah adalah pertemuan kedua, dan baris
+    'Jumlah Beban SKS' dilewati.
+    
+    Args:
+        sumber: Path atau file-like object .xlsx
+        sheet: Nama sheet (default: sheet pertama, tempat draft penugasan)
+    
+    Yields:
+        Tuple (dosen, matkul, prodi, sks, kelas); sks/kelas None jika kosong
+    """
+    from openpyxl import load_workbook
+    
+    wb = load_workbook(sumber, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.worksheets[0]
+        kolom = None
+        dosen = None
+        
+        for row in ws.iter_rows(values_only=True):
+            if kolom is None:
+                idx_dosen = _cari_kolom(row, 'nama dosen')
+                if idx_dosen is None:
+                    continue
+                kolom = (idx_dosen,
+                         _cari_kolom(row, 'matakuliah', 'mata kuliah'),
+                         _cari_kolom(row, 'prodi'),
+                         _cari_kolom(row, 'sks'),
+                         _cari_kolom(row, 'kelas'))
+                if None in kolom[:3]:
+                    raise ValueError("Header draft harus memuat kolom Nama Dosen, Nama Matakuliah, dan Prodi")
+                continue
+            
+            nilai = [_teks(row[i]) if i is not None and i < len(row) else None for i in kolom]
+            pertama = _teks(row[0]) if row else None
+            
+            # Header yang diulang tiap halaman, baris penomoran kolom ([1], [2], ...), dan baris total
+            if nilai[0] and nilai[0].lower().startswith('nama dosen'):
+                continue
+            if pertama and (pertama.startswith('[') or pertama.lower().startswith('jumlah')):
+                continue
+            
+            if nilai[0]:
+                dosen = nilai[0]
+            if not nilai[1] or not dosen:
+                continue
+            
+            yield dosen, nilai[1], nilai[2] or '', nilai[3], nilai[4]
+        
+        if kolom is None:
+            raise ValueError("Header draft (kolom 'Nama Dosen') tidak ditemukan")
+    finally:
+        wb.close()
+
+
+def baca_csv(sumber):
+    """
+    Baca CSV dengan kolom: Dosen, Mata Kuliah, Prodi (format parse_csv_input),
+    ditambah kolom SKS dan Kelas opsional
+    
+    Args:
+        sumber: Path, file teks, atau file biner (mis. hasil upload)
+    
+    Yields:
+        Tuple (dosen, matkul, prodi, sks, kelas); sks/kelas None jika tidak ada
+    """
+    if isinstance(sumber, (str, os.PathLike)):
+        with open(sumber, 'r', encoding='utf-8-sig', newline='') as f:
+            yield from baca_csv(f)
+        return
+    
+    if isinstance(sumber.read(0), bytes):
+        sumber = io.TextIOWrapper(sumber, encoding='utf-8-sig', newline='')
+    
+    reader = csv.DictReader(sumber)
+    hilang = {'Dosen', 'Mata Kuliah', 'Prodi'} - set(reader.fieldnames or [])
+    if hilang:
+        raise ValueError(f"Kolom CSV tidak ditemukan: {', '.join(sorted(hilang))}")
+    
+    for row in reader:
+        dosen, matkul, prodi = (_teks(row[k]) for k in ('Dosen', 'Mata Kuliah', 'Prodi'))
+        if dosen and matkul:
+            yield dosen, matkul, prodi or '', _teks(row.get('SKS')), _teks(row.get('Kelas'))
+
+
+# ========== MAPPING ==========
+
+def _normal(teks):
+    """Kunci pencocokan nama: huruf kecil tanpa spasi ('M. Kom' == 'M.Kom')"""
+    return ''.join(teks.lower().split())
+
+
+def _peta_label(options):
+    """Nama mentah -> label databases ('12 - Nama') agar sama dengan input sidebar"""
+    peta = {}
+    for label in options or []:
+        _, sep, nama = label.partition(' - ')
+        peta.setdefault(_normal(nama if sep else label), label)
+    return peta
+
+
+def impor_populasi(baris, populasi_data=None, databases=None):
+    """
+    Petakan baris (dosen, matkul, prodi[, sks[, kelas]]) ke populasi_data dalam satu pass
+    
+    Kombinasi (dosen, matkul, prodi, kelas) yang sudah ada dilewati karena GA
+    hanya mempertahankan satu kromosom per kombinasi.
+    
+    Args:
+        baris: Iterable tuple (dosen, matkul, prodi), (dosen, matkul, prodi, sks),
+               atau (dosen, matkul, prodi, sks, kelas)
+        populasi_data: populasi_data yang sudah ada (tidak diubah)
+        databases: Hasil load_databases (opsional), untuk memetakan nama ke label
+    
+    Returns:
+        Tuple (populasi_data baru, ringkasan {'ditambahkan', 'duplikat', 'total'})
+    """
+    hasil = dict(populasi_data or {})
+    peta = {key: _peta_label(databases.get(key)) if databases else {}
+            for key in ('dosen', 'matkul', 'prodi', 'kelas')}
+    
+    seen = {(*data[:3], data[4] if len(data) > 4 else None) for data in hasil.values()}
+    nomor = len(hasil)
+    total = duplikat = 0
+    
+    for dosen, matkul, prodi, *opsional in baris:
+        total += 1
+        sks, kelas = (list(opsional) + [None, None])[:2]
+        data = [
+            peta['dosen'].get(_normal(dosen), dosen),
+            peta['matkul'].get(_normal(matkul), matkul),
+            peta['prodi'].get(_normal(prodi), prodi)
+        ]
+        if kelas is not None:
+            kelas = peta['kelas'].get(_normal(kelas), kelas)
+        
+        sig = (*data, kelas)
+        if sig in seen:
+            duplikat += 1
+            continue
+        seen.add(sig)
+        
+        # Elemen ke-4 tetap posisi SKS (None = acak) bila kelas ikut diisi
+        if kelas is not None:
+            data += [sks, kelas]
+        elif sks is not None:
+            data.append(sks)
+        
+        nomor += 1
+        while f"C{nomor}" in hasil:
+            nomor += 1
+        hasil[f"C{nomor}"] = data
+    
+    return hasil, {'ditambahkan': len(hasil) - len(populasi_data or {}), 'duplikat': duplikat, 'total': total}
+
+
+def impor_file(nama_file, sumber, populasi_data=None, databases=None):
+    """
+    Import file .xlsx (draft penugasan) atau .csv ke populasi_data
+    
+    Args:
+        nama_file: Nama file (menentukan format dari ekstensinya)
+        sumber: Path atau file-like object
+        populasi_data: populasi_data yang sudah ada
+        databases: Hasil load_databases (opsional)
+    
+    Returns:
+        Tuple (populasi_data baru, ringkasan)
+    """
+    ext = os.path.splitext(nama_file)[1].lower()
+    
+    if ext in ('.xlsx', '.xlsm'):
+        baris = baca_draft_excel(sumber)
+    elif ext == '.csv':
+        baris = baca_csv(sumber)
+    else:
+        raise ValueError(f"Format file tidak didukung: {ext or nama_file}")
+    
+    return impor_populasi(baris, populasi_data, databases)
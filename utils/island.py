@@ -0,0 +1,332 @@
+"""
+Island-model Genetic Algorithm
+
+Beberapa populasi (pulau) berevolusi secara independen di process pool.
+Setiap migration_interval generasi, kromosom terbaik tiap pulau bermigrasi
+ke pulau berikutnya (topologi ring) memakai semantik elitism_replacement.
+Terdaftar sebagai engine 'island' di SOLVER (genetic_algorithm).
+"""
+
+import contextlib
+import os
+import random
+
+from utils.genetic_algorithm import (
+    buat_populasi_awal,
+    evaluasi_populasi,
+    jalankan_generasi,
+    catat_generasi,
+    buat_history,
+    buat_indeks_signature,
+    buat_event_generasi,
+    IndeksKonflik,
+    elitism_replacement,
+    create_immigrant,
+    remove_duplicates,
+    lengkapi_populasi,
+    rangkum_hasil,
+    habiskan
+)
+
+
+def _evolusi_pulau(args):
+    """
+    Worker: evolusikan satu pulau selama beberapa generasi
+    
+    Args:
+        args: Tuple (populasi, populasi_data, databases, gen_awal, n_gen,
+              mutation_rate, elite_size, seed, kendala, repair_budget);
+              seed diturunkan dari generator run induk per pulau per epoch
+    
+    Returns:
+        Tuple (populasi, history potongan generasi ini)
+    """
+    (populasi, populasi_data, databases, gen_awal, n_gen, mutation_rate, elite_size, seed,
+     kendala, repair_budget) = args
+    
+    # Stream acak sendiri per tugas: tidak bergantung state random yang diwarisi worker
+    rng = random.Random(seed)
+    
+    history = buat_history()
+    indeks_sig = buat_indeks_signature(populasi_data)
+    indeks = IndeksKonflik(databases=databases, kendala=kendala)
+    for gen in range(gen_awal, gen_awal + n_gen):
+        populasi = jalankan_generasi(populasi, populasi_data, databases, gen, mutation_rate, elite_size,
+                                     indeks_sig, kendala, repair_budget, rng, indeks=indeks)
+        catat_generasi(history, populasi, gen)
+    
+    return populasi, history
+
+
+def migrasi(pulau, migration_size, gen, populasi_data, databases, kendala=None, rng=random, indeks_sig=None):
+    """
+    Migrasi ring: elite pulau i-1 bersaing dengan populasi pulau i
+    
+    Elite sumber digabung ke pulau tujuan dengan elitism_replacement,
+    kromosom yang tergeser (signature menjadi duplikat) diganti immigrant
+    create_immigrant untuk signature input yang hilang, lalu pulau tujuan
+    dievaluasi ulang (konflik selalu relatif terhadap pulaunya).
+    
+    Args:
+        pulau: List populasi per pulau
+        migration_size: Jumlah migran per pulau
+        gen: Nomor generasi saat migrasi
+        populasi_data: Data populasi awal
+        databases: Database untuk filler
+        kendala: RegistriKendala soft constraint (opsional)
+        rng: random.Random per run (default: modul random)
+        indeks_sig: Hasil buat_indeks_signature (opsional, dipakai ulang dari run)
+    
+    Returns:
+        List populasi per pulau setelah migrasi
+    """
+    if indeks_sig is None:
+        indeks_sig = buat_indeks_signature(populasi_data)
+    hasil = []
+    
+    for i, target in enumerate(pulau):
+        sumber = pulau[i - 1]
+        id_sumber = {id(k) for k in sumber}
+        
+        baru = [
+            k.salin() if id(k) in id_sumber else k
+            for k in elitism_replacement(sumber, target, migration_size)
+        ]
+        
+        ada = set()
+        unik = remove_duplicates(baru, seen=ada)
+        tergeser = len(baru) - len(unik)
+        # Urutan input (deterministik): satu immigrant per signature yang hilang
+        for sig, key in indeks_sig.items():
+            if tergeser == 0:
+                break
+            if sig not in ada:
+                unik.append(create_immigrant(gen, populasi_data, databases, rng, key=key))
+                ada.add(sig)
+                tergeser -= 1
+        
+        hasil.append(evaluasi_populasi(unik, databases, kendala))
+    
+    return hasil
+
+
+def _gabung_history(history_pulau):
+    """
+    Gabungkan history semua pulau per generasi
+    (best dan total konflik = terbaik antar pulau)
+    """
+    history = buat_history()
+    
+    for baris in zip(*(zip(h['generations'], h['best_fitness'], h['avg_fitness'],
+                           h['worst_fitness'], h['best_konflik'], h['total_konflik'])
+                           for h in history_pulau)):
+        history['generations'].append(baris[0][0])
+        history['best_fitness'].append(max(b[1] for b in baris))
+        history['avg_fitness'].append(round(sum(b[2] for b in baris) / len(baris), 4))
+        history['worst_fitness'].append(min(b[3] for b in baris))
+        history['best_konflik'].append(min(b[4] for b in baris))
+        history['total_konflik'].append(min(b[5] for b in baris))
+    
+    return history
+
+
+def _kunci_pulau(populasi):
+    """Urutan pulau terbaik: total konflik, konflik terkecil, lalu fitness tertinggi"""
+    return (sum(k['konflik'] for k in populasi), min(k['konflik'] for k in populasi),
+            -max(k['fitness'] for k in populasi))
+
+
+@contextlib.contextmanager
+def _peta_tugas(workers):
+    """
+    Fungsi map untuk tugas pulau
+    Langsung di proses ini untuk 1 worker, selain itu process pool
+    """
+    if workers <= 1:
+        yield map
+        return
+    
+    # Import di sini: multiprocessing mahal dan tidak dibutuhkan run satu worker
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield executor.map
+
+
+def evolve_island(populasi_data, databases,
+                  generations=10,
+                  mutation_rate=0.15,
+                  elite_size=2,
+                  early_stopping=False,
+                  n_islands=4,
+                  migration_interval=5,
+                  migration_size=2,
+                  workers=None,
+                  kendala=None,
+                  repair_budget=None,
+                  seeding='random',
+                  random_fraction=0.2,
+                  seed=None,
+                  rng=None):
+    """
+    Generator GA model pulau (engine 'island', lihat SOLVER di genetic_algorithm)
+    
+    Setiap epoch (migration_interval generasi) semua pulau berevolusi
+    paralel, lalu snapshot setiap generasi epoch itu di-yield berurutan.
+    Populasi hanya tersedia di akhir epoch, jadi permintaan berhenti
+    (send(True)) dan early_stopping berlaku di batas epoch: generasi epoch
+    yang sudah dihitung tetap masuk history. Snapshot di tengah epoch membawa
+    best_solution dari batas epoch sebelumnya (atau populasi awal).
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi(, sks(, kelas))]}
+        databases: Dictionary pilihan valid
+        generations: Jumlah generasi per pulau (default: 10)
+        mutation_rate: Probabilitas mutasi (default: 0.15)
+        elite_size: Jumlah elite (default: 2)
+        early_stopping: Stop jika optimal, dicek di batas epoch (default: False)
+        n_islands: Jumlah pulau (default: 4)
+        migration_interval: Migrasi setiap N generasi (default: 5)
+        migration_size: Jumlah kromosom terbaik yang bermigrasi (default: 2)
+        workers: Jumlah proses (default: min(n_islands, jumlah CPU)); 1 = tanpa process pool
+        kendala: RegistriKendala soft constraint (opsional, lihat utils.kendala)
+        repair_budget: Detik per generasi untuk repair min-conflicts tiap pulau (default: None)
+        seeding: Populasi awal tiap pulau 'random' (default) atau 'greedy'
+        random_fraction: Fraksi kromosom acak untuk seeding 'greedy' (default: 0.2)
+        seed: Seed run (default: None = diambil dari modul random); setiap tugas
+              worker mendapat seed turunan dari generator run ini
+        rng: random.Random (default: random.Random(seed))
+    
+    Yields:
+        Snapshot per generasi (best/total konflik = terbaik antar pulau;
+        evaluations = jumlah kromosom yang dievaluasi di semua pulau)
+    
+    Returns:
+        Dictionary hasil GA (format sama dengan run_genetic_algorithm) untuk
+        pulau dengan total konflik terkecil, ditambah 'evaluations' dan
+        'kendala_lunak' (jika kendala dipakai). Jika dihentikan, pulau terbaik
+        dari batas epoch sejauh ini yang dikembalikan (lihat generasi_terbaik)
+    """
+    workers = workers or min(n_islands, os.cpu_count() or 1)
+    migration_interval = max(1, migration_interval)
+    if seed is None:
+        seed = random.getrandbits(32)
+    rng = rng if rng is not None else random.Random(seed)
+    
+    # ========== INITIALIZATION ==========
+    pulau = [
+        evaluasi_populasi(buat_populasi_awal(populasi_data, databases, seeding, random_fraction, rng),
+                          databases, kendala)
+        for _ in range(n_islands)
+    ]
+    pulau_awal = [[krom.salin() for krom in populasi] for populasi in pulau]
+    indeks_sig = buat_indeks_signature(populasi_data)
+    evaluations = sum(len(populasi) for populasi in pulau)
+    
+    # Pulau terbaik di batas epoch sejauh ini: (kunci, indeks pulau, salinan populasi, generasi)
+    terbaik = None
+    # Solusi terbaik yang terakhir diketahui: dipakai snapshot di tengah epoch
+    i = min(range(n_islands), key=lambda i: _kunci_pulau(pulau[i]))
+    best_solution = max(pulau[i], key=lambda k: k['fitness']).salin()
+    history = buat_history()
+    gen = 0
+    berhenti = False
+    
+    # ========== EVOLUTION (PER EPOCH) ==========
+    with _peta_tugas(workers) as peta:
+        while gen < generations and not berhenti:
+            n_gen = min(migration_interval, generations - gen)
+            
+            tugas = [
+                (populasi, populasi_data, databases, gen + 1, n_gen,
+                 mutation_rate, elite_size, rng.getrandbits(32), kendala, repair_budget)
+                for populasi in pulau
+            ]
+            
+            pulau, history_pulau = [], []
+            for populasi, history_epoch in peta(_evolusi_pulau, tugas):
+                pulau.append(populasi)
+                history_pulau.append(history_epoch)
+            epoch = _gabung_history(history_pulau)
+            gen += n_gen
+            
+            # ===== PULAU TERBAIK =====
+            i = min(range(n_islands), key=lambda i: _kunci_pulau(pulau[i]))
+            kunci = _kunci_pulau(pulau[i])
+            if terbaik is None or kunci < terbaik[0]:
+                terbaik = (kunci, i, [krom.salin() for krom in pulau[i]], gen)
+            best_epoch = max(pulau[i], key=lambda k: k['fitness']).salin()
+            
+            # ===== SNAPSHOT PER GENERASI (CONSUMER BISA MENGHENTIKAN) =====
+            per_generasi = sum(len(populasi) for populasi in pulau)
+            for j in range(n_gen):
+                for key, values in epoch.items():
+                    history[key].append(values[j])
+                if berhenti:
+                    continue
+                evaluations += per_generasi
+                if j == n_gen - 1:
+                    best_solution = best_epoch
+                if (yield buat_event_generasi(history, generations, best_solution,
+                                              history['total_konflik'][-1], evaluations)):
+                    # Generasi epoch ini sudah dihitung: tetap dicatat, evaluasinya ikut dihitung
+                    berhenti = True
+                    evaluations += per_generasi * (n_gen - 1 - j)
+            
+            # ===== EARLY STOPPING (OPTIONAL) =====
+            if early_stopping:
+                MIN_GENERATIONS = 5
+                if gen >= MIN_GENERATIONS and history['best_fitness'][-1] >= 0.99 and history['best_konflik'][-1] == 0:
+                    break
+            
+            # ===== MIGRATION =====
+            if not berhenti and gen < generations and n_islands > 1 and migration_size > 0:
+                pulau = migrasi(pulau, migration_size, gen, populasi_data, databases, kendala, rng, indeks_sig)
+                evaluations += sum(len(populasi) for populasi in pulau)
+    
+    # ========== PILIH PULAU TERBAIK ==========
+    if berhenti:
+        # Run dipotong: kembalikan pulau terbaik sejauh ini
+        _, i, populasi, gen_populasi = terbaik
+    else:
+        i = min(range(n_islands), key=lambda i: _kunci_pulau(pulau[i]))
+        populasi, gen_populasi = pulau[i], gen
+    populasi = lengkapi_populasi(populasi, populasi_data, databases, gen_populasi, indeks_sig, kendala, rng)
+    
+    hasil = rangkum_hasil(pulau_awal[i], populasi, history, gen, {
+        'generations': generations,
+        'mutation_rate': mutation_rate,
+        'elite_size': elite_size,
+        'population_size': len(populasi),
+        'early_stopping': early_stopping,
+        'engine': 'island',
+        'n_islands': n_islands,
+        'migration_interval': migration_interval,
+        'migration_size': migration_size,
+        'workers': workers,
+        'repair_budget': repair_budget,
+        'seeding': seeding,
+        'random_fraction': random_fraction,
+        'seed': seed
+    }, generasi_terbaik=gen_populasi)
+    # Evaluasi dihitung di sini: generasi setelah permintaan berhenti tetap dijalankan worker
+    hasil['evaluations'] = evaluations
+    if kendala:
+        hasil['kendala_lunak'] = kendala.rangkum(populasi, databases)
+    return hasil
+
+
+def run_island_model(populasi_data, databases, on_generation=None, **params):
+    """
+    Jalankan evolve_island sampai selesai
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
+        databases: Dictionary pilihan valid
+        on_generation: Callback(snapshot) per generasi; True = hentikan evolusi di batas epoch
+        **params: Parameter evolve_island
+    
+    Returns:
+        Dictionary hasil GA dengan format sama seperti run_genetic_algorithm
+    """
+    return habiskan(evolve_island(populasi_data, databases, **params), on_generation=on_generation)
@@ -0,0 +1,393 @@
+"""
+Soft constraint berbobot untuk fitness penjadwalan
+
+Setiap kendala melaporkan penalti per kromosom. Kendala yang bergantung
+pada kromosom lain (beban dosen per hari, celah jadwal kohort)
+mengelompokkan kromosom lewat kunci(), sehingga perubahan satu gen hanya
+menghitung ulang kelompok lama dan kelompok barunya. SkorKendala menyimpan
+kontribusi berbobot setiap kromosom dan running total per kendala;
+IndeksKonflik memakainya untuk menandai kromosom yang penaltinya ikut berubah.
+Konflik (hard constraint) tetap dihitung terpisah di genetic_algorithm.
+"""
+
+import functools
+from collections import defaultdict
+
+from utils.genetic_algorithm import PetaSlot
+
+
+@functools.lru_cache(maxsize=None)
+def nama_label(label):
+    """Label databases '3 - Nama' -> 'Nama' (label tanpa nomor dikembalikan apa adanya)"""
+    _, sep, nama = str(label).partition(' - ')
+    return (nama if sep else str(label)).strip()
+
+
+def _normal(teks):
+    """Kunci pencocokan nama: huruf kecil tanpa spasi"""
+    return ''.join(teks.lower().split())
+
+
+# ========== KENDALA ==========
+
+class Kendala:
+    """
+    Basis soft constraint
+    
+    Kendala lokal (lokal = True) dinilai per kromosom. Kendala kelompok
+    menilai semua anggota dengan kunci() yang sama sekaligus; kunci None
+    berarti kendala tidak berlaku untuk kromosom itu.
+    """
+    
+    nama = 'kendala'
+    lokal = True
+    
+    def __init__(self, bobot=1.0):
+        self.bobot = bobot
+    
+    def kunci(self, data):
+        """Kunci kelompok untuk kendala kelompok (None = tidak berlaku)"""
+        return None
+    
+    def periksa(self, databases):
+        """Validasi parameter terhadap databases aktif; ValueError jika tidak cocok"""
+    
+    def penalti(self, anggota, interval):
+        """
+        Penalti (belum berbobot) untuk setiap anggota
+        
+        Args:
+            anggota: List data gen (satu elemen untuk kendala lokal)
+            interval: List (mulai, selesai) setiap anggota dalam satuan slot
+                      bawaan (PetaSlot.interval_slot: menit sebenarnya / MENIT_PER_SLOT)
+        
+        Returns:
+            List penalti, urutan sama dengan anggota
+        """
+        raise NotImplementedError
+
+
+class HariPreferensi(Kendala):
+    """Dosen mengajar di luar hari yang diinginkan: penalti 1"""
+    
+    nama = 'hari_preferensi'
+    
+    def __init__(self, preferensi, bobot=1.0):
+        """
+        Args:
+            preferensi: Dictionary {dosen: [hari, ...]} (nama atau label databases)
+            bobot: Bobot penalti
+        """
+        super().__init__(bobot)
+        self.preferensi = {
+            _normal(nama_label(dosen)): {_normal(nama_label(h)) for h in hari}
+            for dosen, hari in preferensi.items()
+        }
+    
+    def penalti(self, anggota, interval):
+        hasil = []
+        for data in anggota:
+            hari = self.preferensi.get(_normal(nama_label(data[0])))
+            hasil.append(0 if hari is None or _normal(nama_label(data[4])) in hari else 1)
+        return hasil
+
+
+class BatasJamHarian(Kendala):
+    """
+    Slot mengajar dosen dalam satu hari melebihi batas (1 slot = MENIT_PER_SLOT menit)
+    
+    Kelebihan slot dibagi ke anggota sebanding panjang span-nya, sehingga
+    jumlah penalti kelompok sama dengan kelebihannya.
+    """
+    
+    nama = 'batas_jam_harian'
+    lokal = False
+    
+    def __init__(self, batas=3, bobot=1.0):
+        """
+        Args:
+            batas: Jumlah slot waktu maksimum per dosen per hari
+            bobot: Bobot penalti per slot kelebihan
+        """
+        super().__init__(bobot)
+        self.batas = batas
+    
+    def kunci(self, data):
+        return (data[4], data[0])
+    
+    def penalti(self, anggota, interval):
+        durasi = [akhir - awal for awal, akhir in interval]
+        total = sum(durasi)
+        lebih = total - self.batas
+        if lebih <= 0:
+            return [0] * len(anggota)
+        return [lebih * d / total for d in durasi]
+
+
+class CelahKohort(Kendala):
+    """
+    Slot kosong di antara kuliah satu kohort (prodi, kelas) dalam sehari
+    
+    Jumlah slot celah dibagi rata ke anggota kelompok. Hanya berlaku untuk
+    kromosom yang kelasnya diketahui.
+    """
+    
+    nama = 'celah_kohort'
+    lokal = False
+    
+    def kunci(self, data):
+        kelas = data[7] if len(data) > 7 else None
+        return None if kelas is None else (data[4], data[2], kelas)
+    
+    def penalti(self, anggota, interval):
+        terisi = 0
+        ujung = None
+        for awal, akhir in sorted(interval):
+            if ujung is None or awal >= ujung:
+                terisi += akhir - awal
+                ujung = akhir
+            elif akhir > ujung:
+                terisi += akhir - ujung
+                ujung = akhir
+        
+        celah = max(akhir for _, akhir in interval) - min(awal for awal, _ in interval) - terisi
+        return [celah / len(anggota)] * len(anggota)
+
+
+class RuangLab(Kendala):
+    """Mata kuliah praktikum/lab yang tidak ditempatkan di ruang lab: penalti 1"""
+    
+    nama = 'ruang_lab'
+    
+    def __init__(self, ruangan=('Lab1', 'Lab2', '77.3.08', '77.2.07'), kata_kunci=('praktikum', 'lab'),
+                 bobot=1.0):
+        """
+        Args:
+            ruangan: Nama ruang lab (nama atau label databases; default: ruang lab
+                     DATABASES_DEFAULT dan ruang praktikum Databases.xlsx)
+            kata_kunci: Awalan kata pada nama mata kuliah yang menandai mata kuliah lab
+            bobot: Bobot penalti
+        """
+        super().__init__(bobot)
+        self.ruangan = {_normal(nama_label(r)) for r in ruangan}
+        self.kata_kunci = tuple(k.lower() for k in kata_kunci)
+    
+    def mata_kuliah_lab(self, matkul):
+        """True jika ada kata di nama mata kuliah yang diawali kata kunci lab"""
+        return any(kata.startswith(self.kata_kunci) for kata in nama_label(matkul).lower().split())
+    
+    def periksa(self, databases):
+        if not any(_normal(nama_label(r)) in self.ruangan for r in databases['ruangan']):
+            raise ValueError(
+                f"Tidak ada ruang lab kendala {self.nama} di databases['ruangan']: "
+                "semua mata kuliah lab akan dipenalti; sesuaikan parameter 'ruangan'"
+            )
+    
+    def penalti(self, anggota, interval):
+        return [
+            1 if self.mata_kuliah_lab(data[1]) and _normal(nama_label(data[6])) not in self.ruangan else 0
+            for data in anggota
+        ]
+
+
+JENIS_KENDALA = {cls.nama: cls for cls in (HariPreferensi, BatasJamHarian, CelahKohort, RuangLab)}
+
+
+# ========== REGISTRY & SKOR INCREMENTAL ==========
+
+class RegistriKendala:
+    """
+    Daftar kendala berbobot yang dipakai fitness
+    
+    Dikirim ke run_genetic_algorithm(kendala=...); fitness kromosom menjadi
+    1 / (1 + konflik + penalti berbobot).
+    """
+    
+    def __init__(self, kendala=()):
+        self.kendala = list(kendala)
+    
+    def __iter__(self):
+        return iter(self.kendala)
+    
+    def __len__(self):
+        return len(self.kendala)
+    
+    def daftar(self, kendala):
+        """Tambahkan kendala ke registry"""
+        self.kendala.append(kendala)
+        return kendala
+    
+    def lacak(self, databases=None, populasi=()):
+        """State incremental (SkorKendala) untuk satu populasi"""
+        return SkorKendala(self, databases, populasi)
+    
+    def evaluasi(self, populasi, databases=None):
+        """Penalti berbobot per kromosom, urutan sama dengan populasi"""
+        skor = self.lacak(databases, populasi)
+        return [skor.penalti(krom) for krom in populasi]
+    
+    def rangkum(self, populasi, databases=None):
+        """Total penalti berbobot per kendala untuk satu populasi"""
+        return self.lacak(databases, populasi).per_kendala()
+
+
+def buat_registri(spesifikasi, databases=None):
+    """
+    Bangun registry dari spesifikasi {nama_kendala: {parameter}}
+    
+    Args:
+        spesifikasi: Dictionary, mis. {'batas_jam_harian': {'batas': 3, 'bobot': 0.3}}
+        databases: Databases yang akan dipakai run (opsional); jika diberikan,
+                   setiap kendala divalidasi terhadapnya (Kendala.periksa)
+    
+    Returns:
+        RegistriKendala
+    """
+    registri = RegistriKendala()
+    for nama, parameter in spesifikasi.items():
+        if nama not in JENIS_KENDALA:
+            raise ValueError(f"Kendala tidak dikenal: {nama}")
+        kendala = registri.daftar(JENIS_KENDALA[nama](**(parameter or {})))
+        if databases is not None:
+            kendala.periksa(databases)
+    return registri
+
+
+class SkorKendala:
+    """
+    Kontribusi penalti per kromosom per kendala, dengan running total
+    
+    tambah/hapus hanya menghitung ulang kendala lokal kromosom itu dan
+    kelompok yang disentuhnya, lalu mengembalikan kromosom lain yang
+    penaltinya ikut berubah (untuk ditandai "kotor" oleh IndeksKonflik).
+    """
+    
+    def __init__(self, registri, databases=None, populasi=()):
+        self._kendala = list(registri)
+        self._peta = PetaSlot(databases)
+        self._anggota = [defaultdict(list) for _ in self._kendala]
+        self._kunci = {}
+        self._kontribusi = {}
+        self._total = [0.0] * len(self._kendala)
+        
+        # Muat massal: setiap kelompok dinilai sekali
+        populasi = list(populasi)
+        for krom in populasi:
+            self._daftar(krom)
+        for i, kendala in enumerate(self._kendala):
+            if kendala.lokal:
+                for krom in populasi:
+                    self._nilai(i, [krom])
+            else:
+                for anggota in self._anggota[i].values():
+                    self._nilai(i, anggota)
+    
+    def __len__(self):
+        return len(self._kunci)
+    
+    def _daftar(self, krom):
+        data = krom["data"]
+        kunci = [None if k.lokal else k.kunci(data) for k in self._kendala]
+        self._kunci[id(krom)] = (self._peta.interval_slot(data), kunci)
+        self._kontribusi[id(krom)] = [0.0] * len(self._kendala)
+        for i, k in enumerate(kunci):
+            if k is not None:
+                self._anggota[i][k].append(krom)
+        return kunci
+    
+    def _nilai(self, i, anggota):
+        kendala = self._kendala[i]
+        penalti = kendala.penalti(
+            [krom["data"] for krom in anggota],
+            [self._kunci[id(krom)][0] for krom in anggota]
+        )
+        for krom, nilai in zip(anggota, penalti):
+            kontribusi = self._kontribusi[id(krom)]
+            nilai = kendala.bobot * nilai
+            self._total[i] += nilai - kontribusi[i]
+            kontribusi[i] = nilai
+    
+    def tambah(self, krom):
+        """
+        Masukkan kromosom dan nilai ulang kelompok yang disentuhnya
+        
+        Returns:
+            List kromosom yang penaltinya berubah (termasuk krom)
+        """
+        kunci = self._daftar(krom)
+        berubah = {id(krom): krom}
+        
+        for i, kendala in enumerate(self._kendala):
+            if kendala.lokal:
+                self._nilai(i, [krom])
+            elif kunci[i] is not None:
+                anggota = self._anggota[i][kunci[i]]
+                self._nilai(i, anggota)
+                for lain in anggota:
+                    berubah[id(lain)] = lain
+        
+        return list(berubah.values())
+    
+    def hapus(self, krom):
+        """
+        Keluarkan kromosom dan nilai ulang kelompok lamanya
+        
+        Returns:
+            List kromosom tersisa yang penaltinya berubah
+        """
+        _, kunci = self._kunci.pop(id(krom))
+        kontribusi = self._kontribusi.pop(id(krom))
+        berubah = {}
+        
+        for i, k in enumerate(kunci):
+            self._total[i] -= kontribusi[i]
+            if k is None:
+                continue
+            anggota = self._anggota[i][k]
+            for j, lain in enumerate(anggota):
+                if lain is krom:
+                    del anggota[j]
+                    break
+            if anggota:
+                self._nilai(i, anggota)
+                for lain in anggota:
+                    berubah[id(lain)] = lain
+            else:
+                del self._anggota[i][k]
+        
+        return list(berubah.values())
+    
+    def hapus_banyak(self, populasi):
+        """
+        Keluarkan banyak kromosom sekaligus; jika semua keluar, running
+        total kembali nol tanpa sisa pembulatan
+        
+        Returns:
+            List kromosom tersisa yang penaltinya berubah
+        """
+        populasi = list(populasi)
+        if len(populasi) < len(self._kunci) or not all(id(krom) in self._kunci for krom in populasi):
+            berubah = {}
+            for krom in populasi:
+                for lain in self.hapus(krom):
+                    berubah[id(lain)] = lain
+            return [lain for lain in berubah.values() if id(lain) in self._kunci]
+        
+        self._anggota = [defaultdict(list) for _ in self._kendala]
+        self._kunci.clear()
+        self._kontribusi.clear()
+        self._total = [0.0] * len(self._kendala)
+        return []
+    
+    def penalti(self, krom):
+        """Penalti berbobot kromosom (jumlah semua kendala)"""
+        return round(sum(self._kontribusi[id(krom)]), 4)
+    
+    @property
+    def total(self):
+        """Running total penalti berbobot semua kromosom yang dilacak"""
+        return round(sum(self._total), 4)
+    
+    def per_kendala(self):
+        """Running total penalti berbobot per kendala"""
+        return {k.nama: round(t, 4) for k, t in zip(self._kendala, self._total)}
@@ -0,0 +1,444 @@
+"""
+Solver trajectory untuk penjadwalan: simulated annealing dan tabu search
+
+Berbeda dengan GA, solver ini memperbaiki satu jadwal: satu kromosom per
+input (sama dengan populasi engine python) yang terdaftar di
+IndeksKonflik. Satu langkah memindahkan satu mata kuliah ke (hari, waktu,
+ruangan) lain; konflik posisi baru dibaca dari OkupansiSlot kelompoknya,
+jadi biaya per langkah tidak bergantung pada jumlah mata kuliah. Satu
+generasi = langkah_per_generasi langkah, sehingga snapshot, history, dan
+dictionary hasil sama dengan engine GA (lihat SOLVER di genetic_algorithm).
+"""
+
+import math
+import random
+
+from utils.genetic_algorithm import (
+    IndeksKonflik, IndeksSlotBebas, PetaSlot, buat_populasi_awal, evaluasi_populasi,
+    fitness, buat_history, buat_event_generasi, rangkum_hasil, habiskan
+)
+
+
+# ========== STATE JADWAL ==========
+
+class JadwalLintasan:
+    """
+    Satu jadwal lengkap dengan indeks konflik dan total konflik berjalan
+    
+    total = jumlah konflik semua kromosom (setiap pasangan bentrok
+    terhitung dua kali, sama dengan total konflik populasi_akhir engine
+    lain). Kromosom berkonflik disimpan sebagai list + posisi agar bisa
+    dipilih acak dalam O(1). Solusi terbaik tidak disalin setiap kali
+    membaik: langkah sejak solusi terbaik dicatat di log dan dibatalkan
+    di akhir; snapshot penuh hanya dibuat jika log lebih panjang dari
+    jumlah mata kuliah.
+    """
+    
+    def __init__(self, populasi_data, databases, slot_bebas=False, seeding='random', random_fraction=0.2,
+                 rng=random):
+        """
+        Args:
+            populasi_data: Dictionary {kode: [dosen, matkul, prodi(, sks(, kelas))]}
+            databases: Dictionary pilihan valid
+            slot_bebas: Juga pelihara IndeksSlotBebas (untuk cari_slot)
+            seeding: Jadwal awal 'random' atau 'greedy' (lihat buat_populasi_awal)
+            random_fraction: Fraksi mata kuliah acak untuk seeding 'greedy'
+            rng: random.Random untuk jadwal awal dan cari_slot (default: modul random)
+        """
+        self.populasi = buat_populasi_awal(populasi_data, databases, seeding, random_fraction, rng)
+        self.indeks = IndeksKonflik(self.populasi, databases)
+        self.indeks.perbarui_skor()
+        self.slot_bebas = IndeksSlotBebas(databases, self.populasi, rng) if slot_bebas else None
+        
+        self.peta = PetaSlot(databases)
+        self.hari = list(dict.fromkeys(databases['hari']))
+        self.ruangan = list(dict.fromkeys(databases['ruangan']))
+        
+        self._konflik = []
+        self._posisi = {}
+        for krom in self.populasi:
+            self._tandai(krom)
+        
+        self.total = sum(krom['konflik'] for krom in self.populasi)
+        self.total_terbaik = self.total
+        self.konflik_min_terbaik = self._konflik_min()
+        self._log = []
+        self._terbaik = None
+    
+    # ===== KROMOSOM BERKONFLIK =====
+    
+    def _tandai(self, krom):
+        ada = id(krom) in self._posisi
+        if krom['konflik'] and not ada:
+            self._posisi[id(krom)] = len(self._konflik)
+            self._konflik.append(krom)
+        elif not krom['konflik'] and ada:
+            i = self._posisi.pop(id(krom))
+            terakhir = self._konflik.pop()
+            if terakhir is not krom:
+                self._konflik[i] = terakhir
+                self._posisi[id(terakhir)] = i
+    
+    @property
+    def n_konflik(self):
+        """Jumlah kromosom yang masih berkonflik"""
+        return len(self._konflik)
+    
+    def _konflik_min(self):
+        """Konflik terkecil satu kromosom (0 kecuali semua kromosom berkonflik)"""
+        if len(self._konflik) < len(self.populasi):
+            return 0
+        return min(krom['konflik'] for krom in self.populasi)
+    
+    def pilih(self, rng, p_konflik=1.0):
+        """Kromosom acak: berkonflik dengan peluang p_konflik, selain itu sembarang"""
+        if self._konflik and rng.random() < p_konflik:
+            return self._konflik[rng.randrange(len(self._konflik))]
+        return self.populasi[rng.randrange(len(self.populasi))]
+    
+    # ===== LANGKAH =====
+    
+    def konflik_di(self, krom, hari, waktu, ruangan):
+        """
+        Konflik krom jika dipindah ke (hari, waktu mulai, ruangan)
+        
+        Krom masih terdaftar di indeks; irisan dengan posisinya sendiri
+        dikurangkan.
+        """
+        data = krom['data']
+        awal, akhir = self.peta.rentang(waktu, data[3])
+        kelas = data[7] if len(data) > 7 else None
+        irisan = self.indeks.hitung_irisan
+        
+        konflik = irisan(('r', hari, ruangan), awal, akhir) + irisan(('d', hari, data[0]), awal, akhir)
+        if kelas is not None:
+            konflik += irisan(('k', hari, data[2], kelas), awal, akhir)
+        
+        if hari == data[4]:
+            a, b = self.peta.interval(data)
+            if a < akhir and awal < b:
+                konflik -= 1 + (kelas is not None) + (ruangan == data[6])
+        return konflik
+    
+    def lepas(self, krom):
+        """Keluarkan krom dari indeks sebelum dipindah (lihat pasang)"""
+        self.indeks.hapus(krom)
+        if self.slot_bebas is not None:
+            self.slot_bebas.hapus(krom)
+    
+    def pasang(self, krom, hari, waktu, ruangan, konflik_baru):
+        """
+        Tempatkan krom yang sudah dilepas di (hari, waktu, ruangan)
+        
+        Args:
+            konflik_baru: Konflik krom di posisi baru (untuk total berjalan)
+        """
+        data = krom['data']
+        lama = (krom, data[4], data[5], data[6])
+        data[4], data[5], data[6] = hari, waktu, ruangan
+        
+        self.indeks.tambah(krom)
+        if self.slot_bebas is not None:
+            self.slot_bebas.tambah(krom)
+        
+        self.total += 2 * (konflik_baru - krom['konflik'])
+        for lain in self.indeks.skor_ulang():
+            self._tandai(lain)
+        
+        # ===== SOLUSI TERBAIK =====
+        if self.total < self.total_terbaik:
+            self.total_terbaik = self.total
+            self.konflik_min_terbaik = self._konflik_min()
+            self._log.clear()
+            self._terbaik = None
+        elif self._terbaik is None:
+            self._log.append(lama)
+            if len(self._log) > len(self.populasi):
+                self._terbaik = self._slot_terbaik()
+                self._log.clear()
+    
+    def pindah(self, krom, hari, waktu, ruangan, konflik_baru):
+        """Pindahkan krom ke (hari, waktu mulai, ruangan)"""
+        self.lepas(krom)
+        self.pasang(krom, hari, waktu, ruangan, konflik_baru)
+    
+    # ===== SOLUSI TERBAIK =====
+    
+    def _slot_terbaik(self):
+        slot = {id(krom): tuple(krom['data'][4:7]) for krom in self.populasi}
+        for krom, hari, waktu, ruangan in reversed(self._log):
+            slot[id(krom)] = (hari, waktu, ruangan)
+        return slot
+    
+    def pulihkan_terbaik(self):
+        """Kembalikan jadwal ke solusi terbaik (indeks tidak lagi dipakai setelahnya)"""
+        if self._terbaik is None and not self._log:
+            return
+        slot = self._slot_terbaik() if self._terbaik is None else self._terbaik
+        for krom in self.populasi:
+            krom['data'][4], krom['data'][5], krom['data'][6] = slot[id(krom)]
+        self.total = self.total_terbaik
+        self._log.clear()
+        self._terbaik = None
+
+
+# ========== HASIL ==========
+
+def _catat(history, gen, lintasan):
+    """
+    History tingkat jadwal: best = solusi terbaik, avg/worst = jadwal saat ini
+    
+    Seperti engine lain, total_konflik = total konflik jadwal terbaik dan
+    best_konflik = konflik terkecil satu mata kuliah di jadwal itu.
+    """
+    history['best_fitness'].append(fitness(lintasan.total_terbaik))
+    history['avg_fitness'].append(fitness(lintasan.total))
+    history['worst_fitness'].append(fitness(lintasan.total))
+    history['best_konflik'].append(lintasan.konflik_min_terbaik)
+    history['total_konflik'].append(lintasan.total_terbaik)
+    history['generations'].append(gen)
+
+
+def _rangkum(lintasan, populasi_awal, total_awal, history, gen, databases, parameters, langkah, diterima):
+    """Dictionary hasil solver trajectory (format rangkum_hasil + key 'lintasan')"""
+    lintasan.pulihkan_terbaik()
+    populasi = evaluasi_populasi(lintasan.populasi, databases)
+    total_akhir = sum(krom['konflik'] for krom in populasi)
+    
+    hasil = rangkum_hasil(populasi_awal, populasi, history, gen, parameters)
+    
+    # Improvement dihitung di tingkat jadwal, seperti engine jadwal
+    fitness_awal, fitness_akhir = fitness(total_awal), fitness(total_akhir)
+    hasil['improvement'] = {
+        'fitness_improvement': round(fitness_akhir - fitness_awal, 4),
+        'konflik_reduction': total_awal - total_akhir,
+        'improvement_percentage': round((fitness_akhir - fitness_awal) / fitness_awal * 100, 2)
+        if fitness_awal > 0 else 0
+    }
+    hasil['lintasan'] = {
+        'konflik_awal': total_awal,
+        'konflik_akhir': total_akhir,
+        'langkah': langkah,
+        'langkah_diterima': diterima,
+        'n_mata_kuliah': len(populasi)
+    }
+    return hasil
+
+
+# ========== SIMULATED ANNEALING ==========
+
+def evolve_annealing(populasi_data, databases,
+                     generations=10,
+                     early_stopping=False,
+                     langkah_per_generasi=None,
+                     suhu_awal=1.5,
+                     suhu_akhir=0.05,
+                     p_konflik=0.8,
+                     seeding='random',
+                     random_fraction=0.2,
+                     seed=None,
+                     rng=None):
+    """
+    Generator simulated annealing pada satu jadwal
+    
+    Setiap langkah memilih mata kuliah (yang berkonflik dengan peluang
+    p_konflik) dan slot acak; langkah dengan delta konflik d <= 0 selalu
+    diterima, d > 0 diterima dengan peluang exp(-d / suhu). Suhu turun
+    geometris dari suhu_awal ke suhu_akhir sepanjang run.
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi(, sks(, kelas))]}
+        databases: Dictionary pilihan valid
+        generations: Jumlah generasi (default: 10)
+        early_stopping: Stop begitu jadwal tanpa konflik (default: False)
+        langkah_per_generasi: Langkah per generasi (default: jumlah mata kuliah)
+        suhu_awal: Suhu awal, dalam satuan konflik per mata kuliah (default: 1.5)
+        suhu_akhir: Suhu di langkah terakhir (default: 0.05)
+        p_konflik: Peluang memilih mata kuliah yang berkonflik (default: 0.8)
+        seeding: Jadwal awal 'random' (default) atau 'greedy'
+        random_fraction: Fraksi mata kuliah acak untuk seeding 'greedy' (default: 0.2)
+        seed: Seed generator acak (default: None = entropi OS)
+        rng: random.Random (default: random.Random(seed))
+    
+    Yields:
+        Snapshot per generasi (total_konflik = total konflik jadwal terbaik,
+        best_konflik = konflik terkecil satu mata kuliah di jadwal itu;
+        evaluations = jumlah langkah)
+    
+    Returns:
+        Dictionary hasil (format rangkum_hasil) ditambah key 'lintasan'
+    """
+    rng = rng if rng is not None else random.Random(seed)
+    langkah_per_generasi = langkah_per_generasi or len(populasi_data)
+    
+    # ========== INITIALIZATION ==========
+    lintasan = JadwalLintasan(populasi_data, databases, seeding=seeding, random_fraction=random_fraction, rng=rng)
+    populasi_awal = [krom.salin() for krom in lintasan.populasi]
+    total_awal = lintasan.total
+    n_hari, n_ruangan = len(lintasan.hari), len(lintasan.ruangan)
+    
+    suhu = suhu_awal
+    pendinginan = (suhu_akhir / suhu_awal) ** (1 / max(1, generations * langkah_per_generasi))
+    history = buat_history()
+    langkah = diterima = gen = 0
+    
+    # ========== ANNEALING ==========
+    for gen in range(1, generations + 1):
+        for _ in range(langkah_per_generasi):
+            if not lintasan.total:
+                break
+            langkah += 1
+            suhu *= pendinginan
+            
+            krom = lintasan.pilih(rng, p_konflik)
+            hari = lintasan.hari[rng.randrange(n_hari)]
+            # Hanya waktu mulai yang span SKS-nya muat
+            mulai = lintasan.peta.waktu_muat(krom['data'][3])
+            waktu = mulai[rng.randrange(len(mulai))]
+            ruangan = lintasan.ruangan[rng.randrange(n_ruangan)]
+            
+            konflik_baru = lintasan.konflik_di(krom, hari, waktu, ruangan)
+            delta = konflik_baru - krom['konflik']
+            if delta <= 0 or rng.random() < math.exp(-delta / suhu):
+                lintasan.pindah(krom, hari, waktu, ruangan, konflik_baru)
+                diterima += 1
+        
+        _catat(history, gen, lintasan)
+        if (yield buat_event_generasi(history, generations, total_konflik=lintasan.total_terbaik, evaluations=langkah)):
+            break
+        
+        if early_stopping and not lintasan.total:
+            break
+    
+    # ========== FINALIZATION ==========
+    return _rangkum(lintasan, populasi_awal, total_awal, history, gen, databases, {
+        'generations': generations,
+        'population_size': len(populasi_awal),
+        'early_stopping': early_stopping,
+        'engine': 'annealing',
+        'langkah_per_generasi': langkah_per_generasi,
+        'suhu_awal': suhu_awal,
+        'suhu_akhir': suhu_akhir,
+        'p_konflik': p_konflik,
+        'seeding': seeding,
+        'random_fraction': random_fraction,
+        'seed': seed
+    }, langkah, diterima)
+
+
+# ========== TABU SEARCH ==========
+
+def evolve_tabu(populasi_data, databases,
+                generations=10,
+                early_stopping=False,
+                langkah_per_generasi=None,
+                tenure=20,
+                seeding='random',
+                random_fraction=0.2,
+                seed=None,
+                rng=None):
+    """
+    Generator tabu search (min-conflicts) pada satu jadwal
+    
+    Setiap langkah memilih acak mata kuliah yang berkonflik dan
+    memindahkannya ke slot terbaik di seluruh (hari, waktu) lewat
+    IndeksSlotBebas.cari_slot, walaupun lebih buruk. Posisi yang baru
+    ditinggalkan dan posisi saat ini menjadi tabu untuk mata kuliah itu
+    selama tenure langkah, kecuali (aspirasi) langkahnya menghasilkan
+    jadwal yang lebih baik dari solusi terbaik.
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi(, sks(, kelas))]}
+        databases: Dictionary pilihan valid
+        generations: Jumlah generasi (default: 10)
+        early_stopping: Stop begitu jadwal tanpa konflik (default: False)
+        langkah_per_generasi: Langkah per generasi (default: jumlah mata kuliah)
+        tenure: Lama (langkah) sebuah posisi tabu (default: 20)
+        seeding: Jadwal awal 'random' (default) atau 'greedy'
+        random_fraction: Fraksi mata kuliah acak untuk seeding 'greedy' (default: 0.2)
+        seed: Seed generator acak (default: None = entropi OS)
+        rng: random.Random (default: random.Random(seed))
+    
+    Yields:
+        Snapshot per generasi (total_konflik = total konflik jadwal terbaik,
+        best_konflik = konflik terkecil satu mata kuliah di jadwal itu;
+        evaluations = jumlah langkah)
+    
+    Returns:
+        Dictionary hasil (format rangkum_hasil) ditambah key 'lintasan'
+    """
+    rng = rng if rng is not None else random.Random(seed)
+    langkah_per_generasi = langkah_per_generasi or len(populasi_data)
+    
+    # ========== INITIALIZATION ==========
+    lintasan = JadwalLintasan(populasi_data, databases, slot_bebas=True,
+                              seeding=seeding, random_fraction=random_fraction, rng=rng)
+    populasi_awal = [krom.salin() for krom in lintasan.populasi]
+    total_awal = lintasan.total
+    
+    daftar_tabu = {}  # id(krom) -> {(hari, waktu): langkah terakhir masih tabu}
+    history = buat_history()
+    langkah = diterima = gen = 0
+    
+    # ========== TABU SEARCH ==========
+    for gen in range(1, generations + 1):
+        for _ in range(langkah_per_generasi):
+            if not lintasan.n_konflik:
+                break
+            langkah += 1
+            
+            krom = lintasan.pilih(rng)
+            data = krom['data']
+            posisi = (data[4], data[5])
+            tabu_krom = daftar_tabu.setdefault(id(krom), {})
+            tabu = {slot for slot, sampai in tabu_krom.items() if sampai >= langkah}
+            tabu.add(posisi)
+            aspirasi = krom['konflik'] - (lintasan.total - lintasan.total_terbaik) / 2
+            
+            lintasan.lepas(krom)
+            slot = lintasan.slot_bebas.cari_slot(data, lintasan.indeks, tabu, aspirasi)
+            if slot is None:
+                lintasan.pasang(krom, *posisi, data[6], krom['konflik'])
+                continue
+            
+            tabu_krom[posisi] = langkah + tenure
+            lintasan.pasang(krom, slot[1], slot[2], slot[3], slot[0])
+            diterima += 1
+        
+        _catat(history, gen, lintasan)
+        if (yield buat_event_generasi(history, generations, total_konflik=lintasan.total_terbaik, evaluations=langkah)):
+            break
+        
+        if early_stopping and not lintasan.total:
+            break
+    
+    # ========== FINALIZATION ==========
+    return _rangkum(lintasan, populasi_awal, total_awal, history, gen, databases, {
+        'generations': generations,
+        'population_size': len(populasi_awal),
+        'early_stopping': early_stopping,
+        'engine': 'tabu',
+        'langkah_per_generasi': langkah_per_generasi,
+        'tenure': tenure,
+        'seeding': seeding,
+        'random_fraction': random_fraction,
+        'seed': seed
+    }, langkah, diterima)
+
+
+def run_lokal(populasi_data, databases, engine='annealing', on_generation=None, **params):
+    """
+    Jalankan solver trajectory sampai selesai
+    
+    Args:
+        populasi_data: Dictionary {kode: [dosen, matkul, prodi]}
+        databases: Dictionary pilihan valid
+        engine: 'annealing' atau 'tabu'
+        on_generation: Callback(snapshot) per generasi; True = hentikan
+        **params: Parameter evolve_annealing / evolve_tabu
+    
+    Returns:
+        Dictionary hasil (lihat evolve_annealing)
+    """
+    solver = {'annealing': evolve_annealing, 'tabu': evolve_tabu}[engine]
+    return habiskan(solver(populasi_data, databases, **params), on_generation=on_generation)